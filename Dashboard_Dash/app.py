@@ -25,31 +25,38 @@ app.layout = html.Div([
 
 # Lógica para actualizar el contenido según la URL activa
 @app.callback(
-    [Output('page-content', 'children'),
-     Output('link-resumen', 'className'),
-     Output('link-acceso-internet', 'className'),
-     Output('link-cobertura-fibra', 'className'),
-     Output('link-planes-pospago', 'className'),
-     Output('link-conclusiones', 'className')],
+    Output('page-content', 'children'),
     [Input('url', 'pathname')]
 )
 def display_page(pathname):
-    # Establecer la clase activa dependiendo de la URL
-    active_link = 'nav-link active-link'
-    normal_link = 'nav-link'
-
     if pathname == '/':
-        return resumen_general.layout(), active_link, normal_link, normal_link, normal_link, normal_link
+        return resumen_general.layout()
     elif pathname == '/acceso-a-internet':
-        return kpi_1.layout(), normal_link, active_link, normal_link, normal_link, normal_link
+        return kpi_1.layout()
     elif pathname == '/cobertura-fibra':
-        return kpi_2.layout(), normal_link, normal_link, active_link, normal_link, normal_link
+        return kpi_2.layout()
     elif pathname == '/planes-pospago':
-        return kpi_3.layout(), normal_link, normal_link, normal_link, active_link, normal_link
+        return kpi_3.layout()
     elif pathname == '/conclusiones':
-        return html.Div([html.H3('Conclusiones')]), normal_link, normal_link, normal_link, normal_link, active_link
+        return html.Div([html.H3('Conclusiones')])
     else:
-        return html.Div([html.H3('Página no encontrada')]), normal_link, normal_link, normal_link, normal_link, normal_link
+        return html.Div([html.H3('Página no encontrada')])
+
+# Clase activa de los links de navegación según la URL: se resuelve en el navegador, sin ida y vuelta al servidor
+app.clientside_callback(
+    """
+    function(pathname) {
+        const rutas = ['/', '/acceso-a-internet', '/cobertura-fibra', '/planes-pospago', '/conclusiones'];
+        return rutas.map(ruta => ruta === pathname ? 'nav-link active-link' : 'nav-link');
+    }
+    """,
+    [Output('link-resumen', 'className'),
+     Output('link-acceso-internet', 'className'),
+     Output('link-cobertura-fibra', 'className'),
+     Output('link-planes-pospago', 'className'),
+     Output('link-conclusiones', 'className')],
+    [Input('url', 'pathname')]
+)
 
 if __name__ == '__main__':
     app.run_server(debug=False)
\ No newline at end of file
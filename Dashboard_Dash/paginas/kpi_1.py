@@ -1,36 +1,67 @@
 import dash_bootstrap_components as dbc
-from dash import dcc, html, Input, Output, callback
-from data_loader import load_internet_penetration_data
+from dash import dcc, html, Input, Output, State, callback, clientside_callback
+from data_loader import cargar_datasets_kpi, cargar_indicadores_provincia
 from visualization import (
     graficar_penetracion_internet_dash,
     graficar_comparativa_acceso_proyectado_dash,
     graficar_evolucion_penetracion_provincia_dash,
     graficar_mapa_penetracion_dash
 )
-
-# Cargar los datos
-df_penetracion = load_internet_penetration_data()
+from telecom_core.diferido import CargaDiferida
+from telecom_core.figuras import CacheFiguras
+from telecom_core.transformaciones import proyeccion_penetracion
 
 # Ruta al archivo GeoJSONa
 geojson_path = 'assets/argentina_nivel_1_normalizado.geojson'
 
-# Generar los gráficos iniciales
-fig_penetracion_internet = graficar_penetracion_internet_dash(df_penetracion)
-fig_comparativa_acceso_proyectado = graficar_comparativa_acceso_proyectado_dash(df_penetracion)
-provincia_inicial = df_penetracion['nombre_provincia'].unique()[0]  # Provincia predeterminada
-fig_lineas = graficar_evolucion_penetracion_provincia_dash(df_penetracion, provincia_inicial)
-fig_mapa = graficar_mapa_penetracion_dash(geojson_path)
 
-# Lista de provincias para el dropdown
-provincias = df_penetracion['nombre_provincia'].unique()
+def construir_kpi_1():
+    """ Carga los datos y genera los gráficos de la página; se ejecuta en el primer pedido y en cada refresco """
+    # Todos los datasets de los KPIs se consultan en paralelo; las demás páginas los toman del cache
+    df_penetracion = cargar_datasets_kpi()['penetracion']
+    provincia_inicial = df_penetracion['nombre_provincia'].unique()[0]  # Provincia predeterminada
+
+    # Series de todas las provincias con su proyección, calculadas una vez para los gráficos por provincia
+    df_evolucion = proyeccion_penetracion(df_penetracion)
+
+    return {
+        'df_penetracion': df_penetracion,
+        'df_evolucion': df_evolucion,
+        'fig_penetracion_internet': graficar_penetracion_internet_dash(df_penetracion),
+        'fig_comparativa_acceso_proyectado': graficar_comparativa_acceso_proyectado_dash(df_penetracion),
+        'provincia_inicial': provincia_inicial,
+        'fig_lineas': graficar_evolucion_penetracion_provincia_dash(df_evolucion, provincia_inicial),
+        'fig_mapa': graficar_mapa_penetracion_dash(cargar_indicadores_provincia(), geojson_path),
+        # Lista de provincias para el dropdown
+        'provincias': df_penetracion['nombre_provincia'].unique()
+    }
+
+
+# Los datos y gráficos se generan recién en el primer pedido, no al importar la página
+datos_kpi_1 = CargaDiferida(construir_kpi_1)
+
+
+def construir_figura_lineas(provincia):
+    """ Gráfico de evolución de una provincia, a partir de los datos vigentes de la página """
+    return graficar_evolucion_penetracion_provincia_dash(datos_kpi_1.obtener()["df_evolucion"], provincia)
+
+
+# Figuras de evolución por provincia (24 como máximo), memorizadas hasta que se reconstruyan los datos
+figuras_lineas = CacheFiguras(construir_figura_lineas, version=lambda: datos_kpi_1.construcciones)
 
 # Layout
 def layout():
+    datos = datos_kpi_1.obtener()
     return html.Div([
         # Fila para el gráfico de barras (ocupa el ancho completo)
         html.Div([
             html.Button("Cambiar gráfico", id="cambiar-grafico-btn", className="btn-cambiar-grafico"),
-            dcc.Graph(id="grafico-barras", figure=fig_penetracion_internet)
+            # Ambas figuras viajan una sola vez al navegador; el botón alterna entre ellas en el cliente
+            dcc.Store(id="figuras-barras", data={
+                "penetracion": datos["fig_penetracion_internet"],
+                "comparativa": datos["fig_comparativa_acceso_proyectado"]
+            }),
+            dcc.Graph(id="grafico-barras")
         ], className="graph-container", style={"width": "100%"}),  # Forzamos el ancho completo
 
         # Contenedor de la fila inferior con gráficos alineados
@@ -41,19 +72,19 @@ def layout():
                     html.H4("Evolución de la Penetración de Internet por Provincia", className="graph-title"),
                     dcc.Dropdown(
                         id="dropdown-provincia",
-                        options=[{"label": prov.capitalize(), "value": prov} for prov in provincias],
-                        value=provincia_inicial,
+                        options=[{"label": prov.capitalize(), "value": prov} for prov in datos["provincias"]],
+                        value=datos["provincia_inicial"],
                         placeholder="Selecciona una provincia",
                         clearable=False,
                         className="dropdown-button"
                     )
                 ], className="graph-header"),  # Usamos graph-header para alinear título y dropdown
-                dcc.Graph(id="grafico-lineas", figure=fig_lineas, style={'height': '200px'})
+                dcc.Graph(id="grafico-lineas", figure=datos["fig_lineas"], style={'height': '200px'})
             ], className="line-graph-container", style={"flex": "1"}),
 
             # Contenedor del gráfico de mapa
             html.Div([
-                dcc.Graph(id="grafico-mapa", figure=fig_mapa, style={'height': '294px'})
+                dcc.Graph(id="grafico-mapa", figure=datos["fig_mapa"], style={'height': '294px'})
             ], className="line-graph-container", style={"flex": "1"})
             
         ], style={"display": "flex", "gap": "20px", "width": "100%"})  # Ancho completo para la fila inferior
@@ -64,17 +95,18 @@ def layout():
 
 
 
-# Callback para cambiar el gráfico de barras al presionar el botón
-@callback(
+# Callback del lado del cliente: alterna el gráfico de barras entre las dos figuras del Store
+# (sin clics muestra la penetración; los clics impares, la comparativa proyectada)
+clientside_callback(
+    """
+    function(n_clicks, figuras) {
+        return (n_clicks || 0) % 2 === 1 ? figuras.comparativa : figuras.penetracion;
+    }
+    """,
     Output("grafico-barras", "figure"),
     Input("cambiar-grafico-btn", "n_clicks"),
-    prevent_initial_call=True
+    State("figuras-barras", "data")
 )
-def actualizar_grafico_barras(n_clicks):
-    if n_clicks % 2 == 1:
-        return fig_comparativa_acceso_proyectado
-    else:
-        return fig_penetracion_internet
 
 # Callback para actualizar el gráfico de líneas basado en la provincia seleccionada
 @callback(
@@ -82,4 +114,4 @@ def actualizar_grafico_barras(n_clicks):
     Input("dropdown-provincia", "value")
 )
 def actualizar_grafico_lineas(provincia):
-    return graficar_evolucion_penetracion_provincia_dash(df_penetracion, provincia)
+    return figuras_lineas.obtener(provincia)
@@ -1,21 +1,31 @@
 import dash_bootstrap_components as dbc
 from dash import dcc, html
-from data_loader import cargar_datos_cobertura_fibra
+from data_loader import cargar_datasets_kpi, cargar_indicadores_provincia
 from visualization import graficar_porcentaje_localidades_fibra, graficar_cobertura_fibra_optica_proyectada, graficar_cobertura_fibra_optica
-
-# Carga de datos
-df_cobertura = cargar_datos_cobertura_fibra()
+from telecom_core.diferido import CargaDiferida
 
 # Ruta al archivo GeoJSONa
 geojson_path = 'assets/argentina_nivel_1_normalizado.geojson'
 
-# Generar los gráficos
-df_porcentaje = graficar_porcentaje_localidades_fibra(df_cobertura)
-df_proyeccion = graficar_cobertura_fibra_optica_proyectada(df_cobertura)
-df_mapa = graficar_cobertura_fibra_optica(geojson_path)
+
+def construir_kpi_2():
+    """ Carga los datos y genera los gráficos de la página; se ejecuta en el primer pedido y en cada refresco """
+    # Todos los datasets de los KPIs se consultan en paralelo; las demás páginas los toman del cache
+    df_cobertura = cargar_datasets_kpi()['cobertura_provincia']
+
+    return {
+        'df_porcentaje': graficar_porcentaje_localidades_fibra(df_cobertura),
+        'df_proyeccion': graficar_cobertura_fibra_optica_proyectada(df_cobertura),
+        'df_mapa': graficar_cobertura_fibra_optica(cargar_indicadores_provincia(), geojson_path)
+    }
+
+
+# Los datos y gráficos se generan recién en el primer pedido, no al importar la página
+datos_kpi_2 = CargaDiferida(construir_kpi_2)
 
 # Layout
 def layout():
+    datos = datos_kpi_2.obtener()
     return html.Div([
         # Contenedor principal con dos columnas (izquierda y derecha)
         html.Div([
@@ -23,7 +33,7 @@ def layout():
             html.Div([
                 dcc.Graph(
                     id='porcentaje-localidades-fibra',
-                    figure=df_porcentaje,  # Asegúrate de pasar df
+                    figure=datos["df_porcentaje"],  # Asegúrate de pasar df
                     style={"height": "100%"}
                 )
             ], className="bar2-graph-container", style={"width": "45%", "display": "flex", "flexDirection": "column"}),  # 55% de ancho para la columna izquierda
@@ -34,7 +44,7 @@ def layout():
                 html.Div([
                     dcc.Graph(
                         id='grafico-superior',
-                        figure=df_proyeccion,  # Gráfico superior
+                        figure=datos["df_proyeccion"],  # Gráfico superior
                         style={"height": "100%"}
                     )
                 ], className="bar3-graph-container", style={"height": "45%"}),  # La mitad superior de la columna derecha
@@ -43,7 +53,7 @@ def layout():
                 html.Div([
                     dcc.Graph(
                         id='grafico-inferior',
-                        figure=df_mapa,  # Gráfico inferior aquí
+                        figure=datos["df_mapa"],  # Gráfico inferior aquí
                         style={"height": "100%"}
                     )
                 ], className="map3-graph-container", style={"height": "45%"}),  # La mitad inferior de la columna derecha
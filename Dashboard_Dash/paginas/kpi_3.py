@@ -1,25 +1,40 @@
 import dash_bootstrap_components as dbc
 from dash import dcc, html, Input, Output, callback
-from data_loader import cargar_datos_accesos_movil
+from data_loader import cargar_datasets_kpi
 from visualization import graficar_evolucion_accesos_pospago, graficar_proyeccion_accesos_pospago, graficar_distribucion_accesos
+from telecom_core.diferido import CargaDiferida
+from telecom_core.transformaciones import proyeccion_accesos_pospago
 
-# Carga de los datos
-df_accesos_movil = cargar_datos_accesos_movil()
 
-# Generar los gráficos iniciales
-fig_evolucion_accesos = graficar_evolucion_accesos_pospago(df_accesos_movil)
-fig_proyeccion = graficar_proyeccion_accesos_pospago(df_accesos_movil)
-fig_torta = graficar_distribucion_accesos(df_accesos_movil)
+def construir_kpi_3():
+    """ Carga los datos y genera los gráficos de la página; se ejecuta en el primer pedido y en cada refresco """
+    # Todos los datasets de los KPIs se consultan en paralelo; las demás páginas los toman del cache
+    datasets = cargar_datasets_kpi()
+    df_accesos_movil = datasets['accesos_movil']
+    # Totales anuales de 2024 agregados en la base de datos para el gráfico de torta
+    df_accesos_anual = datasets['accesos_movil_anual']
+
+    return {
+        'fig_evolucion_accesos': graficar_evolucion_accesos_pospago(df_accesos_movil),
+        # Serie con el trimestre proyectado, calculada por el motor de proyecciones una vez por versión
+        'fig_proyeccion': graficar_proyeccion_accesos_pospago(proyeccion_accesos_pospago(df_accesos_movil)),
+        'fig_torta': graficar_distribucion_accesos(df_accesos_anual)
+    }
+
+
+# Los datos y gráficos se generan recién en el primer pedido, no al importar la página
+datos_kpi_3 = CargaDiferida(construir_kpi_3)
 
 
 # Layout principal
 def layout():
+    datos = datos_kpi_3.obtener()
     return html.Div([
         # Gráfico principal de barras horizontales (mitad superior)
         html.Div([
             dcc.Graph(
                 id='evolucion-accesos-pospago',
-                figure=fig_evolucion_accesos
+                figure=datos["fig_evolucion_accesos"]
             )
         ], className="bar-graph-container", style={"width": "100%", "border-radius": "4px", "height": "50vh"}),
 
@@ -29,7 +44,7 @@ def layout():
             html.Div([
                 dcc.Graph(
                     id="grafico-lineas",
-                    figure=fig_proyeccion,
+                    figure=datos["fig_proyeccion"],
                     style={"height": "100%"}
                 )
             ], className="line-graph-kpi3-container", style={"flex": "1"}),  # Ocupa la mitad izquierda
@@ -38,7 +53,7 @@ def layout():
             html.Div([
                 dcc.Graph(
                     id="grafico-torta",
-                    figure=fig_torta,  # Aquí debes pasar tu figura de gráfico de torta
+                    figure=datos["fig_torta"],  # Aquí debes pasar tu figura de gráfico de torta
                     style={"height": "100%"}
                 )
             ], className="line-graph-kpi3-container", style={"flex": "1"})  # Ocupa la mitad derecha
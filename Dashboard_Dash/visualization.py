@@ -1,9 +1,15 @@
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
-import json
 from dash import dcc
 import dash_leaflet as dl
+from telecom_core.geometria import nivel_para_zoom, obtener_geojson
+from telecom_core.transformaciones import (
+    AUMENTO_POSPAGO, agregar_anio_trimestre, evolucion_provincia, ordenar_por_periodo, proyectar_penetracion,
+    provincias_menor_cobertura
+)
+
+# Zoom inicial de los mapas de coropletas (Argentina completa)
+ZOOM_MAPA = 4
 
 
 # -- GRÁFICOS PARA KPI 1: ACCESO A INTERNET --
@@ -23,20 +29,9 @@ def graficar_penetracion_internet_dash(df_penetracion):
     """
     color_palette = ["#00B7C2", "#1B262C", "#3FC5F0", "#0F4C75", "#05DFD7"]
 
-    # Filtrar los datos a partir de 2023
-    df_penetracion_reciente = df_penetracion[df_penetracion['anio'] >= 2023].sort_values('accesos_por_100_hogares')
-
-    # Crear columna 'anio_trimestre'
-    df_penetracion_reciente['anio_trimestre'] = df_penetracion_reciente['anio'].astype(str) + ' T' + df_penetracion_reciente['trimestre'].astype(str)
-
-    # Crear una columna temporal para ordenar correctamente por año y trimestre
-    df_penetracion_reciente['orden'] = df_penetracion_reciente['anio'] * 10 + df_penetracion_reciente['trimestre']
-
-    # Ordenar el DataFrame por la nueva columna 'orden'
-    df_penetracion_reciente = df_penetracion_reciente.sort_values(by='orden')
-
-    # Eliminar la columna temporal después de la ordenación
-    df_penetracion_reciente.drop(columns=['orden'], inplace=True)
+    # Los datos llegan filtrados desde 2023 por la consulta SQL y con el periodo ya agregado por
+    # el cargador (load_internet_penetration_data); ordenar por periodo y, dentro de cada uno, por accesos
+    df_penetracion_reciente = ordenar_por_periodo(df_penetracion, por='accesos_por_100_hogares')
    
     # Gráfico interactivo de barras agrupadas
     fig = px.bar(
@@ -100,15 +95,8 @@ def graficar_comparativa_acceso_proyectado_dash(df_penetracion):
 
     color_palette = ["#00B7C2", "#0F4C75"]
 
-    # Filtrar los datos a partir de 2023 y crear columna 'anio_trimestre'
-    df_penetracion_reciente = df_penetracion[df_penetracion['anio'] >= 2023].copy()
-    df_penetracion_reciente['anio_trimestre'] = df_penetracion_reciente['anio'].astype(str) + ' T' + df_penetracion_reciente['trimestre'].astype(str)
-
-    # Filtrar datos para el último trimestre registrado (2024 T1) y copiar para la proyección
-    df_kpi = df_penetracion_reciente[df_penetracion_reciente['anio_trimestre'] == '2024 T1'].copy()
-
-    # Agregar columna con el nuevo acceso proyectado con un 2% de aumento
-    df_kpi['acceso_proyectado'] = df_kpi['accesos_por_100_hogares'] * 1.02
+    # Datos del último trimestre registrado (2024 T1) con el acceso proyectado con un 2% de aumento
+    df_kpi = proyectar_penetracion(df_penetracion)
 
     # Reorganizar el DataFrame para Plotly
     df_kpi_melted = df_kpi.melt(id_vars='nombre_provincia', 
@@ -175,82 +163,64 @@ def graficar_evolucion_penetracion_provincia_dash(df_penetracion, provincia):
     aumento del 2% en el último trimestre disponible para Dash.
 
     Parámetros:
-    - df_penetracion (DataFrame): DataFrame con las columnas 'nombre_provincia', 'anio_trimestre', 
-                                  y 'accesos_por_100_hogares'.
+    - df_penetracion (DataFrame): Tabla de proyeccion_penetracion (series de todas las provincias con
+                                  sus trimestres proyectados), calculada una vez por versión de los datos.
     - provincia (str): Nombre de la provincia seleccionada.
 
     Retorno:
     - fig: Gráfico en formato Plotly para ser integrado en Dash.
     """
-    # Filtrar datos a partir de 2023 y crear columna 'anio_trimestre'
-    df_penetracion_reciente = df_penetracion[df_penetracion['anio'] >= 2023].copy()
-    df_penetracion_reciente['anio_trimestre'] = df_penetracion_reciente['anio'].astype(str) + ' T' + df_penetracion_reciente['trimestre'].astype(str)
-
-    # Filtrar los datos por la provincia seleccionada
-    df_provincia_filtrada = df_penetracion_reciente[df_penetracion_reciente['nombre_provincia'] == provincia]
-
-    # Ordenar por año y trimestre para asegurar el orden cronológico
-    df_provincia_filtrada = df_provincia_filtrada.sort_values(by=['anio', 'trimestre'])
+    # Serie de la provincia en orden cronológico, con la proyección del 2% al final
+    df_completo, acceso_proyectado = evolucion_provincia(df_penetracion, provincia)
 
-    # Obtener los datos del último trimestre para calcular la proyección
-    df_kpi = df_provincia_filtrada[df_provincia_filtrada['anio_trimestre'] == '2024 T1']
+    # Tramo histórico
+    df_historico = df_completo[~df_completo['proyectado']]
 
-    # Proyectar un aumento del 2% en accesos para 2024 T2
-    if not df_kpi.empty:
-        acceso_actual = df_kpi['accesos_por_100_hogares'].values[0]
-        acceso_proyectado = acceso_actual * 1.02
-
-        # Crear los datos de proyección
-        datos_proyectados = {
-            'anio_trimestre': ['2024 T2'],
-            'accesos_por_100_hogares': [acceso_proyectado],
-            'nombre_provincia': provincia
-        }
+    # Crear la figura del gráfico
+    fig = go.Figure()
 
-        df_proyeccion = pd.DataFrame(datos_proyectados)
+    # Agregar la línea principal (sin el punto de proyección)
+    fig.add_trace(go.Scatter(
+        x=df_historico['anio_trimestre'],
+        y=df_historico['accesos_por_100_hogares'],
+        mode='lines+markers',
+        line=dict(color='#00B7C2', width=2),  # Color y grosor de la línea principal
+        name='Acceso Histórico'
+    ))
 
-        # Concatenar los datos históricos y proyectados
-        df_completo = pd.concat([df_provincia_filtrada, df_proyeccion]).sort_values(by=['anio', 'trimestre'])
+    # Personalización del gráfico para el estilo oscuro
+    fig.update_layout(
+        xaxis_title='Año y Trimestre',
+        yaxis_title='Accesos por 100 Hogares',
+        xaxis_tickangle=-15,
+        template="plotly_dark",
+        plot_bgcolor="#09090e",
+        paper_bgcolor="#09090e",
+        title_font_size=1,
+        height=225,
+        margin=dict(l=10, r=10, t=30, b=30),
+        showlegend=False  # Oculta la leyenda
+    )
 
-        # Crear la figura del gráfico
-        fig = go.Figure()
+    # Sin proyección (provincia sin datos en el periodo base) se muestra solo el histórico
+    if acceso_proyectado is not None:
 
-        # Agregar la línea principal (sin el punto de proyección)
-        fig.add_trace(go.Scatter(
-            x=df_completo['anio_trimestre'][:-1],
-            y=df_completo['accesos_por_100_hogares'][:-1],
-            mode='lines+markers',
-            line=dict(color='#00B7C2', width=2),  # Color y grosor de la línea principal
-            name='Acceso Histórico'
-        ))
+        # Tramo proyectado (arranca en el último trimestre real)
+        df_proyectado = df_completo.iloc[len(df_historico) - 1:]
 
         # Agregar el último punto de proyección con color diferente
         fig.add_trace(go.Scatter(
-            x=df_completo['anio_trimestre'][-2:],  # Solo el último punto
-            y=df_completo['accesos_por_100_hogares'][-2:],
+            x=df_proyectado['anio_trimestre'],  # Último punto real y puntos proyectados
+            y=df_proyectado['accesos_por_100_hogares'],
             mode='lines+markers',
             line=dict(color='#FCF876', width=2, dash='dash'),  # Línea punteada para la proyección
             marker=dict(color='#FCF876', size=6),  # Color y tamaño del marcador de proyección
             name='Proyección'
         ))
 
-        # Personalización del gráfico para el estilo oscuro
-        fig.update_layout(
-            xaxis_title='Año y Trimestre',
-            yaxis_title='Accesos por 100 Hogares',
-            xaxis_tickangle=-15,
-            template="plotly_dark",
-            plot_bgcolor="#09090e",
-            paper_bgcolor="#09090e",
-            title_font_size=1,
-            height=225,
-            margin=dict(l=10, r=10, t=30, b=30),
-            showlegend=False  # Oculta la leyenda
-        )
-
         # Añadir anotación en el punto proyectado
         fig.add_annotation(
-            x='2024 T2',
+            x=df_completo['anio_trimestre'].iloc[-1],
             y=acceso_proyectado,
             text="Proyección",
             showarrow=True,
@@ -264,49 +234,45 @@ def graficar_evolucion_penetracion_provincia_dash(df_penetracion, provincia):
 
 
 # CUARTO GRÁFICO: Mapa de coropletas con la penetración de internet por provincia
-def graficar_mapa_penetracion_dash(geojson_path):
+def graficar_mapa_penetracion_dash(df_indicadores, geojson_path):
     """
     Genera un mapa de coropletas interactivo que muestra la penetración de internet
     por cada 100 hogares en cada provincia de Argentina.
+
+    Parámetros:
+    - df_indicadores (DataFrame): Indicadores por provincia con las columnas 'clave', 'provincia' y
+                                  'promedio_accesos' (cargar_indicadores_provincia).
+    - geojson_path (str): Ruta al archivo GeoJSON con la geometría de las provincias.
+
+    Retorno:
+    - fig: Gráfico en formato Plotly para ser integrado en Dash.
     """
     color_palette = ["#00B7C2", "#1B262C", "#3FC5F0", "#0F4C75", "#05DFD7"]
     color_palette_invertida = color_palette[::-1]  # Invertir la lista de colores
 
-    data = {
-        'nombre_provincia': [
-            'tierra del fuego', 'santa cruz', 'chubut', 'rio negro', 'neuquen', 'la pampa', 'buenos aires', 
-            'mendoza', 'san luis', 'cordoba', 'santa fe', 'entre rios', 'la rioja', 'san juan', 'corrientes', 
-            'misiones', 'santiago del estero', 'catamarca', 'tucuman', 'salta', 'jujuy', 'chaco', 'formosa', 'caba'
-        ],
-        'accesos_por_100_hogares': [
-            109.78, 67.58, 84.89, 71.14, 79.50, 100.49, 81.10, 52.59, 102.70, 90.70, 80.40, 69.31, 80.03, 51.62, 51.94, 
-            56.76, 49.41, 68.82, 60.48, 56.30, 57.65, 46.70, 39.61, 119.53
-        ]
-    }
-
+    # Penetración promedio de cada provincia, ya indexada por la clave de coincidencia con el GeoJSON
+    df = df_indicadores.dropna(subset=['promedio_accesos'])
 
-    # Convertir los datos en un DataFrame
-    df = pd.DataFrame(data)
-
-    # Cargar el archivo GeoJSON
-    with open(geojson_path) as f:
-        geojson_data = json.load(f)
+    # GeoJSON con la clave de coincidencia, parseado una vez y simplificado para el zoom del mapa
+    geojson_data = obtener_geojson(geojson_path, nivel_para_zoom(ZOOM_MAPA))
 
     
     # Crear el gráfico
     fig = px.choropleth_mapbox(
         df,
         geojson=geojson_data,
-        locations='nombre_provincia',  # Columna de mapeo en el DataFrame
-        featureidkey="properties.NAME_1",  # Columna de mapeo en el GeoJSON
-        color='accesos_por_100_hogares',  # Variable a visualizar
+        locations='clave',  # Columna de mapeo en el DataFrame
+        featureidkey="properties.clave",  # Clave normalizada agregada al GeoJSON
+        color='promedio_accesos',  # Variable a visualizar
         color_continuous_scale=color_palette_invertida,  # Escala de color
-        range_color=(df['accesos_por_100_hogares'].min(),
-                     df['accesos_por_100_hogares'].max()),
+        range_color=(df['promedio_accesos'].min(),
+                     df['promedio_accesos'].max()),
         mapbox_style="carto-darkmatter",  # Estilo de mapa oscuro
-        zoom=4,
+        zoom=ZOOM_MAPA,
         center={"lat": -38.4161, "lon": -63.6167},  # Coordenadas de Argentina
-        title="Penetración de Internet por Provincia"
+        title="Penetración de Internet por Provincia",
+        hover_name='provincia',  # Nombre de la provincia en el tooltip
+        labels={'promedio_accesos': 'Accesos por 100 Hogares'}
     )
 
     # Ajustar layout
@@ -356,7 +322,7 @@ def graficar_porcentaje_localidades_fibra(df_cobertura):
     Genera un gráfico de barras horizontales que muestra el porcentaje de localidades con fibra óptica por provincia.
 
     Parámetros:
-    - df (DataFrame): DataFrame que contiene las columnas 'nombre_provincia', 'localidad', y 'fibra_optica'.
+    - df (DataFrame): DataFrame agregado por provincia con las columnas 'nombre_provincia' y 'porcentaje_fibra'.
 
     Retorno:
     - fig: Gráfico generado con Plotly.
@@ -365,13 +331,8 @@ def graficar_porcentaje_localidades_fibra(df_cobertura):
     # Definir la paleta de colores
     color_palette = ["#FBB454", "#FF7777", "#FF9551"]
 
-    # Calcular el porcentaje de localidades con fibra óptica
-    df_fibra_optica = df_cobertura[df_cobertura['fibra_optica'] == True]
-    total_localidades_provincia = df_cobertura.groupby('nombre_provincia')['localidad'].count()
-    localidades_fibra_provincia = df_fibra_optica.groupby('nombre_provincia')['localidad'].count()
-
-    porcentaje_fibra_optica = (localidades_fibra_provincia / total_localidades_provincia) * 100
-    porcentaje_fibra_optica = porcentaje_fibra_optica.sort_values()
+    # Porcentaje de localidades con fibra óptica (precalculado por provincia en la vista materializada)
+    porcentaje_fibra_optica = df_cobertura.set_index('nombre_provincia')['porcentaje_fibra'].sort_values()
 
     # Crear gráfico de barras horizontales
     fig = px.bar(
@@ -416,22 +377,11 @@ def graficar_cobertura_fibra_optica_proyectada(df_cobertura):
     en provincias con menor cobertura.
 
     Parámetros:
-    - df (DataFrame): DataFrame que contiene las columnas 'nombre_provincia' y 'fibra_optica'.
+    - df (DataFrame): DataFrame agregado por provincia con las columnas 'nombre_provincia' y 'porcentaje_fibra'.
     """
 
-    # Filtrar provincias con menor cobertura (por debajo del 25% del total)
-    prov_menor_cobertura_fibra = df_cobertura.groupby('nombre_provincia')['fibra_optica'].mean()
-    prov_menor_cobertura_fibra = prov_menor_cobertura_fibra[prov_menor_cobertura_fibra < prov_menor_cobertura_fibra.quantile(0.25)]
-    
-    # Proyección de aumento del 30% en la cobertura
-    prov_menor_cobertura_fibra_proyectado = prov_menor_cobertura_fibra * 1.30
-
-    # Crear un DataFrame para el gráfico
-    df_fibra_optica = pd.DataFrame({
-        'Provincia': prov_menor_cobertura_fibra.index,
-        'Cobertura Actual': prov_menor_cobertura_fibra.values,
-        'Cobertura Proyectada': prov_menor_cobertura_fibra_proyectado.values
-    })
+    # Provincias con menor cobertura (por debajo del 25% del total) y su proyección con un 30% de aumento
+    df_fibra_optica = provincias_menor_cobertura(df_cobertura)
 
     # Transformar el DataFrame para mostrar la cobertura actual vs proyectada
     df_fibra_optica_melted = df_fibra_optica.melt(id_vars='Provincia', 
@@ -478,11 +428,13 @@ def graficar_cobertura_fibra_optica_proyectada(df_cobertura):
 
 
 # TERCER GRÁFICO: Mapa Interactivo de Provincias
-def graficar_cobertura_fibra_optica(geojson_path):
+def graficar_cobertura_fibra_optica(df_indicadores, geojson_path):
     """
     Genera un gráfico de mapa coroplético que muestra la cobertura de fibra óptica por provincia con tema oscuro.
 
     Args:
+        df_indicadores (DataFrame): Indicadores por provincia con las columnas 'clave', 'provincia' y
+                                    'porcentaje_fibra' (cargar_indicadores_provincia).
         geojson_path (str): Ruta al archivo GeoJSON con la geometría de las provincias.
 
     Returns:
@@ -490,47 +442,33 @@ def graficar_cobertura_fibra_optica(geojson_path):
     """
     color_palette = ["#fff590", "#f59e44", "#ff7876"]
 
-    # Datos de cobertura de fibra óptica por provincia obtenidos de Streamlit directamente.
-    datos = {
-        'nombre_provincia': [
-            'tierra del fuego', 'santa cruz', 'chubut', 'rio negro', 'neuquen', 'la pampa', 'buenos aires', 
-            'mendoza', 'san luis', 'cordoba', 'santa fe', 'entre rios', 'la rioja', 'san juan', 'corrientes', 
-            'misiones', 'santiago del estero', 'catamarca', 'tucuman', 'salta', 'jujuy', 'chaco', 'formosa', 'caba'
-        ],
-        'fibra_optica': [
-            100, 93.33, 39.39, 70.15, 46.67, 66.67, 71.95, 48.00, 40.66, 52.62, 49.50, 40.94, 51.79, 18.06, 45.65, 
-            53.42, 64.04, 60.42, 37.29, 79.44, 65.75, 77.05, 27.12, 100
-        ]
-    }
-
-    # Convertir los datos en un DataFrame
-    df = pd.DataFrame(datos)
-
-    # Cargar el archivo GeoJSON
-    with open(geojson_path) as f:
-        geojson_data = json.load(f)
+    # Porcentaje de localidades con fibra óptica de cada provincia, indexado por la clave del GeoJSON
+    df = df_indicadores.dropna(subset=['porcentaje_fibra'])
+
+    # GeoJSON con la clave de coincidencia, parseado una vez y simplificado para el zoom del mapa
+    geojson_data = obtener_geojson(geojson_path, nivel_para_zoom(ZOOM_MAPA))
 
     # Crear el gráfico
     fig = px.choropleth_mapbox(
         df,
         geojson=geojson_data,
-        locations='nombre_provincia',  # Columna de mapeo en el DataFrame
-        featureidkey="properties.NAME_1",  # Columna de mapeo en el GeoJSON
-        color='fibra_optica',  # Variable a visualizar
+        locations='clave',  # Columna de mapeo en el DataFrame
+        featureidkey="properties.clave",  # Clave normalizada agregada al GeoJSON
+        color='porcentaje_fibra',  # Variable a visualizar
         color_continuous_scale=color_palette,  # Escala de color
         range_color=(0, 100),  # Rango de valores
         mapbox_style="carto-darkmatter",
-        zoom=4,
+        zoom=ZOOM_MAPA,
         center={"lat": -38.4161, "lon": -63.6167},  # Coordenadas de Argentina
         title="Cobertura de Fibra Óptica por Provincia",
-        hover_name='nombre_provincia',  # Añadir el nombre de la provincia al tooltip
-        hover_data={"fibra_optica": True},  # Mostrar el valor de fibra_optica en el tooltip
+        hover_name='provincia',  # Añadir el nombre de la provincia al tooltip
+        hover_data={"porcentaje_fibra": True},  # Mostrar el porcentaje de cobertura en el tooltip
     )
 
     # Crear un hovertemplate dinámico con el color de la provincia
     hovertemplate = (
         "<b>%{hovertext}</b><br>"  # Mostrar nombre de la provincia
-        "Cobertura de Fibra Óptica: %{customdata[0]}%<br>"  # Mostrar porcentaje de cobertura
+        "Cobertura de Fibra Óptica: %{customdata[0]:.2f}%<br>"  # Mostrar porcentaje de cobertura
     )
 
     # Asignar el hovertemplate dinámico
@@ -593,11 +531,9 @@ def graficar_evolucion_accesos_pospago(df_accesos_movil):
     # Definir la paleta de colores
     color_palette = ["#BC7AF9", "#A084E8", "#8B5DFF", "#7E30E1", "#6a3382", "#D67BFF"]
 
-    # Filtrar datos a partir de 2023
-    df_pospago_reciente = df_accesos_movil[df_accesos_movil['anio'] >= 2023].copy()
-
-    # Crear columna combinada para año y trimestre
-    df_pospago_reciente['anio_trimestre'] = df_pospago_reciente['anio'].astype(str) + ' T' + df_pospago_reciente['trimestre'].astype(str)
+    # Los datos llegan filtrados desde 2023 por la consulta SQL (cargar_datos_accesos_movil), con la
+    # etiqueta categórica 'anio_trimestre' agregada por el cargador
+    df_pospago_reciente = agregar_anio_trimestre(df_accesos_movil)
 
     # Crear el gráfico de barras horizontales
     fig = px.bar(
@@ -640,32 +576,31 @@ def graficar_evolucion_accesos_pospago(df_accesos_movil):
 
 
 # SEGUNDO GRÁFICO: Proyección de aumento en accesos pospago
-def graficar_proyeccion_accesos_pospago(df_accesos_movil):
+def graficar_proyeccion_accesos_pospago(df_proyeccion):
     """
     Genera un gráfico de líneas que muestra la evolución histórica de accesos a planes pospago
-    y una proyección de aumento del 5% para el tercer trimestre de 2024.
-    
+    y una proyección de aumento del 5% para el trimestre siguiente.
+
+    Parámetros:
+    - df_proyeccion (DataFrame): Tabla de proyeccion_accesos_pospago, con las columnas 'anio_trimestre',
+                                 'total_accesos_pospago' y 'proyectado'.
+
     Retorno:
     - fig: Gráfico generado con Plotly.
     """
-    # Datos históricos y proyección
-    trimestres = ['2023 T1', '2023 T2', '2023 T3', '2023 T4', '2024 T1', '2024 T2']
-    accesos_postpago = [7028083, 7310125, 7903181, 8301200, 8398514, 8397205]  # Datos oficiales
-
-    # Proyección del 5% para el tercer trimestre de 2024
-    proyeccion_t3_2024 = accesos_postpago[-1] * 1.05
-
-    # Agregar el trimestre proyectado
-    trimestres.append('2024 T3')
-    accesos_postpago.append(proyeccion_t3_2024)
+    # Datos históricos y proyección, leídos de la tabla del motor de proyecciones
+    df_historico = df_proyeccion[~df_proyeccion['proyectado']]
+    df_proyectado = df_proyeccion.iloc[len(df_historico) - 1:]  # Desde el último trimestre real
+    periodo_proyectado = df_proyeccion['anio_trimestre'].iloc[-1]
+    valor_proyectado = df_proyeccion['total_accesos_pospago'].iloc[-1]
 
     # Crear la figura de líneas
     fig = go.Figure()
 
     # Datos históricos
     fig.add_trace(go.Scatter(
-        x=trimestres[:-1], 
-        y=accesos_postpago[:-1], 
+        x=df_historico['anio_trimestre'],
+        y=df_historico['total_accesos_pospago'],
         mode='lines+markers',
         line=dict(color='#A084E8', width=2),
         name='Datos Históricos'
@@ -674,8 +609,8 @@ def graficar_proyeccion_accesos_pospago(df_accesos_movil):
 
     # Proyección
     fig.add_trace(go.Scatter(
-        x=trimestres[-2:], 
-        y=accesos_postpago[-2:], 
+        x=df_proyectado['anio_trimestre'],
+        y=df_proyectado['total_accesos_pospago'],
         mode='lines+markers', 
         line=dict(color='#fa60ff', width=2, dash='dash'),
         marker=dict(color='#fa60ff', size=6),  # Color y tamaño del marcador de proyección
@@ -684,16 +619,16 @@ def graficar_proyeccion_accesos_pospago(df_accesos_movil):
 
     # Anotación del valor proyectado
     fig.add_annotation(
-        x='2024 T3',
-        y=proyeccion_t3_2024,
-        text=f'{proyeccion_t3_2024:,.0f}',
+        x=periodo_proyectado,
+        y=valor_proyectado,
+        text=f'{valor_proyectado:,.0f}',
         showarrow=True,
         arrowhead=2
     )
 
     # Configuración del gráfico
     fig.update_layout(
-        title='Proyección del 5% en Accesos de Planes Pospago (2024 T3)',
+        title=f'Proyección del {AUMENTO_POSPAGO:.0%} en Accesos de Planes Pospago ({periodo_proyectado})',
         xaxis_title='Período (Año y Trimestre)',
         yaxis_title='Accesos de Planes Pospago',
         title_font_size=15,
@@ -717,13 +652,14 @@ def graficar_distribucion_accesos(df_accesos_movil):
     para el primer y segundo trimestre de 2024.
 
     Parámetros:
-    - df (DataFrame): DataFrame con las columnas 'anio', 'total_accesos_pospago' y 'total_accesos_prepago'.
+    - df (DataFrame): Totales de 2024 ya agregados por la consulta SQL, con las columnas 'anio',
+                      'total_accesos_pospago' y 'total_accesos_prepago'
+                      (cargar_datos_accesos_movil(desde=2024, hasta=2024, nivel='anio')).
 
     Retorno:
     - fig: Figura de Plotly lista para ser usada en Dash.
     """
-    # Filtrar los datos para 2024 T1 y T2
-    df_t2_2024 = df_accesos_movil[df_accesos_movil['anio'] == 2024]
+    df_t2_2024 = df_accesos_movil
 
     # Sumar los accesos pospago y prepago
     accesos_pospago = df_t2_2024['total_accesos_pospago'].sum()
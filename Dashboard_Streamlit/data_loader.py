@@ -1,151 +1,76 @@
+# Los cargadores viven en el paquete compartido telecom_core (instalar con `pip install -e .`
+# desde la raíz del repositorio), así ambos dashboards usan el mismo cache y el mismo pool
 import os
-import psycopg2
-import pandas as pd
-from dotenv import load_dotenv
-
-# Cargar credenciales del archivo .env
-load_dotenv("C:/DYNAMO/ProyectoN2/credenciales.env")
-
-def connect_db():
-    """ Funcion para conectarse a la base de datos """
-    conn = psycopg2.connect(
-        host=os.getenv("DB_HOST"),
-        database=os.getenv("DB_NAME"),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD")
-    )
-    return conn
-
-
-
-
-# -- FUNCIONES PARA EL KPI 1 --
-
-def load_internet_penetration_data():
-    """ Funcion para cargar los datos de penetracion de internet en hogares para el KPI 1 """
-    conn = connect_db()
-    
-    # Consulta SQL
-    query = """
-    SELECT 
-        p.nombre_provincia, 
-        pe.anio, 
-        pe.trimestre,
-        ph.accesos_por_100_hogares
-    FROM 
-        penetracion_internet_hogares ph
-    JOIN 
-        provincias p ON ph.id_provincia = p.id_provincia
-    JOIN 
-        periodos pe ON ph.id_periodo = pe.id_periodo;
-    """
-    
-    # Ejecutar consulta y cargar en DataFrame
-    df = pd.read_sql(query, conn)
-    
-    # Cerrar conexión
-    conn.close()
-    
-    return df
 
+import streamlit as st
 
-def cargar_datos_penetracion_mapa():
-    """
-    Carga los datos de penetración promedio por provincia desde la base de datos.
+from telecom_core.cache import version_datos
+from telecom_core.cargadores import (
+    cargar_datasets_kpi,
+    cargar_datos_accesos_movil,
+    cargar_datos_cobertura_provincia,
+    cargar_datos_penetracion_mapa,
+    load_internet_penetration_data,
+)
+from telecom_core.pool import obtener_pool
+from telecom_core.transformaciones import proyeccion_accesos_pospago, proyeccion_penetracion
 
-    Retorno:
-    - DataFrame con las columnas 'nombre_provincia' y 'promedio_accesos'.
-    """
-    conn = connect_db()
-
-    # Consulta SQL
-    query = """
-    SELECT 
-        p.nombre_provincia, 
-        AVG(ph.accesos_por_100_hogares) AS promedio_accesos
-    FROM 
-        penetracion_internet_hogares ph
-    JOIN 
-        provincias p ON ph.id_provincia = p.id_provincia
-    JOIN 
-        periodos pe ON ph.id_periodo = pe.id_periodo
-    WHERE 
-        pe.anio >= 2024
-    GROUP BY 
-        p.nombre_provincia;
-    """
-    df = pd.read_sql(query, conn)
-    conn.close()
-    
-    # Normalizar nombres de provincias para facilitar la coincidencia con GeoJSON
-    df['nombre_provincia'] = df['nombre_provincia'].str.lower()
-    return df
+# Segundos que Streamlit conserva los datasets y figuras memorizados (el mismo TTL del cache de consultas)
+TTL_CACHE = int(os.getenv("CACHE_TTL", "3600"))
 
 
+# -- CACHE DE STREAMLIT --
 
+@st.cache_resource(show_spinner=False)
+def obtener_pool_conexiones():
+    """
+    Retorna el pool de conexiones compartido como recurso de Streamlit: se crea una sola vez por
+    proceso y lo usan todas las sesiones y ejecuciones de la app.
+    """
+    return obtener_pool()
 
-# -- FUNCIONES PARA EL KPI 2 --
 
-def cargar_datos_cobertura_fibra():
+@st.cache_data(ttl=TTL_CACHE, show_spinner="Cargando datos...")
+def _cargar_datasets(nombres, version):
     """
-    Carga los datos de cobertura de fibra óptica y conectividad inalámbrica por localidad y provincia.
-
-    Retorno:
-    - DataFrame con las columnas 'localidad', 'nombre_provincia', 'fibra_optica', 'wireless' y 'poblacion'.
+    Carga concurrentemente los datasets pedidos. Streamlit memoriza el resultado por (nombres, version),
+    así una nueva versión de los datos (version_datos) genera otra entrada aunque no haya vencido el TTL.
     """
-    conn = connect_db()
-
-    # Consulta SQL
-    query = """
-    SELECT 
-        l.localidad, 
-        p.nombre_provincia, 
-        mc.fibra_optica, 
-        mc.wireless, 
-        mc.poblacion 
-    FROM 
-        mapa_conectividad mc
-    JOIN 
-        localidades l ON mc.id_localidad = l.id_localidad
-    JOIN 
-        provincias p ON l.id_provincia = p.id_provincia
-    WHERE 
-        mc.fibra_optica = TRUE OR mc.wireless = TRUE
-    ORDER BY 
-        p.nombre_provincia, l.localidad;
+    return cargar_datasets_kpi(list(nombres))
+
+
+def cargar_datasets(*nombres):
     """
-    df = pd.read_sql(query, conn)
-    conn.close()
-    return df
+    Retorna los datasets de los KPIs memorizados por Streamlit para la versión vigente de los datos.
+    Las interacciones con los widgets de una página reutilizan los DataFrames sin volver a consultar
+    la base de datos.
 
+    Parámetros:
+    - *nombres (str): Datasets de telecom_core.cargadores.CARGAS_KPI ('penetracion', 'penetracion_mapa',
+                      'cobertura_provincia', 'accesos_movil', 'accesos_movil_anual').
 
+    Retorno:
+    - dict nombre -> DataFrame.
+    """
+    obtener_pool_conexiones()
+    return _cargar_datasets(tuple(nombres), version_datos())
 
 
-# -- FUNCIONES PARA EL KPI 3 --
+@st.cache_data(ttl=TTL_CACHE, show_spinner=False)
+def _cargar_proyecciones(version):
+    """ Calcula las tablas de proyección con el motor de telecom_core.proyecciones, una vez por versión """
+    datasets = cargar_datasets_kpi(['penetracion', 'accesos_movil'])
+    return {
+        'penetracion': proyeccion_penetracion(datasets['penetracion']),
+        'accesos_movil': proyeccion_accesos_pospago(datasets['accesos_movil']),
+    }
 
-def cargar_datos_accesos_movil():
-    """
-    Carga los datos de accesos a planes de telefonía móvil pospago y prepago por año y trimestre.
 
-    Retorno:
-    - DataFrame con las columnas 'anio', 'trimestre', 'total_accesos_pospago', y 'total_accesos_prepago'.
+def cargar_proyecciones():
     """
-    conn = connect_db()
-
-    # Consulta SQL
-    query = """
-        SELECT 
-            pe.anio,
-            pe.trimestre,
-            atm.total_accesos_pospago,
-            atm.total_accesos_prepago
-        FROM 
-            accesos_telefonia_movil atm
-        JOIN
-            periodos pe ON atm.id_periodo = pe.id_periodo
-        ORDER BY 
-            pe.anio, pe.trimestre;
+    Retorna las series con sus trimestres proyectados de la versión vigente de los datos: 'penetracion'
+    (todas las provincias, ver proyeccion_penetracion) y 'accesos_movil' (ver proyeccion_accesos_pospago).
+    Los gráficos leen de estas tablas en lugar de proyectar en cada ejecución de la página.
     """
-    df = pd.read_sql(query, conn)
-    conn.close()
-    return df
+    obtener_pool_conexiones()
+    return _cargar_proyecciones(version_datos())
@@ -1,13 +1,14 @@
 import streamlit as st
-from data_loader import load_internet_penetration_data, cargar_datos_penetracion_mapa
+from data_loader import cargar_datasets, cargar_proyecciones
 from visualization import graficar_penetracion_internet, graficar_comparativa_acceso_proyectado, graficar_evolucion_penetracion_provincia, graficar_mapa_penetracion
 
 def display():
     st.title("KPI 1 - Acceso a Internet")
 
-    # Cargar los datos de penetración general y mapa
-    df_penetracion = load_internet_penetration_data()
-    df_penetracion_mapa = cargar_datos_penetracion_mapa()
+    # Cargar los datos de penetración general y mapa (memorizados por Streamlit para la versión de los datos)
+    datasets = cargar_datasets('penetracion', 'penetracion_mapa')
+    df_penetracion = datasets['penetracion']
+    df_penetracion_mapa = datasets['penetracion_mapa']
     geojson_path = 'assets/argentina_nivel_1_normalizado.geojson'
 
     # Mostrar gráficos iniciales
@@ -19,15 +20,25 @@ def display():
 
     # Subtítulo de la sección de evolución y filtro de selección
     st.subheader("Evolución de la Penetración por Provincia")
+    mostrar_evolucion_provincia(cargar_proyecciones()['penetracion'])
 
+    # Mapa de penetración por provincia
+    graficar_mapa_penetracion(df_penetracion_mapa, geojson_path)
+
+
+@st.fragment
+def mostrar_evolucion_provincia(df_evolucion):
+    """
+    Selector de provincia y gráfico de su evolución, leído de la tabla de proyecciones de todas las
+    provincias (cargar_proyecciones). Como fragmento, cambiar la provincia vuelve a ejecutar solo esta
+    función: los gráficos de barras y el mapa de la página no se recalculan ni se envían otra vez al
+    navegador.
+    """
     # Sidebar para seleccionar la provincia
     provincia_seleccionada = st.selectbox(
         'Selecciona una provincia:', 
-        sorted(df_penetracion[df_penetracion['anio'] >= 2023]['nombre_provincia'].unique())
+        sorted(df_evolucion['nombre_provincia'].unique())
     )
 
     # Gráfico de evolución de penetración de internet por provincia
-    graficar_evolucion_penetracion_provincia(df_penetracion, provincia_seleccionada)
-
-    # Mapa de penetración por provincia
-    graficar_mapa_penetracion(df_penetracion_mapa, geojson_path)
\ No newline at end of file
+    graficar_evolucion_penetracion_provincia(df_evolucion, provincia_seleccionada)
@@ -1,12 +1,12 @@
 import streamlit as st
-from data_loader import cargar_datos_cobertura_fibra
+from data_loader import cargar_datasets
 from visualization import graficar_porcentaje_localidades_fibra, graficar_cobertura_fibra_optica_proyectada, graficar_mapa_cobertura_fibra, mostrar_tarjetas_cobertura
 
 def display():
     st.title("KPI 2: Cobertura de Fibra Óptica")
 
-    # Cargar los datos de cobertura de fibra óptica
-    df_cobertura = cargar_datos_cobertura_fibra()
+    # Cargar los datos de cobertura de fibra óptica (memorizados por Streamlit para la versión de los datos)
+    df_cobertura = cargar_datasets('cobertura_provincia')['cobertura_provincia']
     geojson_path = 'assets/argentina_nivel_1_normalizado.geojson'
 
     # Primer gráfico: porcentaje de localidades con fibra óptica por provincia
@@ -1,12 +1,23 @@
 import streamlit as st
-from data_loader import cargar_datos_accesos_movil
+from data_loader import cargar_datasets, cargar_proyecciones
 from visualization import graficar_evolucion_accesos_pospago, graficar_proyeccion_accesos_pospago, graficar_distribucion_accesos, mostrar_tarjetas_accesos_pospago
 
+from telecom_core.transformaciones import AUMENTO_POSPAGO
+
 def display():
     st.title("KPI 3: Aumento en Planes Pospago")
 
-    # Cargar los datos de accesos a telefonía móvil
-    df_telefonia = cargar_datos_accesos_movil()
+    # Cargar los datos de accesos a telefonía móvil (memorizados por Streamlit para la versión de los datos)
+    datasets = cargar_datasets('accesos_movil', 'accesos_movil_anual')
+    df_telefonia = datasets['accesos_movil']
+    df_telefonia_anual = datasets['accesos_movil_anual']
+
+    # Serie de accesos pospago con el trimestre proyectado (motor de proyecciones, una vez por versión)
+    df_proyeccion = cargar_proyecciones()['accesos_movil']
+
+    # Aumento y trimestre proyectado, tomados de la proyección (igual que el título del gráfico)
+    aumento = f"{AUMENTO_POSPAGO:.0%}"
+    periodos_proyectados = ', '.join(df_proyeccion.loc[df_proyeccion['proyectado'], 'anio_trimestre'].astype(str))
 
     # Gráfico 1: Evolución de accesos pospago desde 2023 en adelante
     st.subheader("Evolución Trimestral del Acceso a Líneas Pospago (2023 en adelante)")
@@ -14,18 +25,18 @@ def display():
 
     st.divider()
 
-    # Gráfico 2: Proyección del aumento del 5% en accesos de planes pospago
-    st.subheader("Proyección de Aumento del 5% en Accesos de Planes Pospago (2024 T3)")
-    graficar_proyeccion_accesos_pospago()
+    # Gráfico 2: Proyección del aumento en accesos de planes pospago
+    st.subheader(f"Proyección de Aumento del {aumento} en Accesos de Planes Pospago ({periodos_proyectados})")
+    graficar_proyeccion_accesos_pospago(df_proyeccion)
 
     st.divider()
 
     # Gráfico 3: Distribución de accesos pospago y prepago (2024 T1 y T2)
     st.subheader("Distribución de Accesos Pospago y Prepago (2024 T1 y T2)")
-    graficar_distribucion_accesos(df_telefonia)
+    graficar_distribucion_accesos(df_telefonia_anual)
 
     st.divider()
 
-    # Tarjetas de progreso hacia el 5% de aumento en accesos pospago
-    st.subheader("Progreso hacia el 5% de Aumento en los Accesos a Líneas Pospago")
-    mostrar_tarjetas_accesos_pospago(df_telefonia)
+    # Tarjetas de progreso hacia el aumento proyectado en accesos pospago
+    st.subheader(f"Progreso hacia el {aumento} de Aumento en los Accesos a Líneas Pospago")
+    mostrar_tarjetas_accesos_pospago(df_proyeccion)
@@ -1,10 +1,88 @@
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
+import streamlit.components.v1 as components
 import folium
-import json
-from streamlit_folium import st_folium
+from data_loader import TTL_CACHE
+from telecom_core.geometria import nivel_para_zoom, obtener_geojson
+from telecom_core.normalizacion import claves_provincia, clave_provincia
+from telecom_core.transformaciones import (
+    AUMENTO_POSPAGO, agregar_anio_trimestre, evolucion_provincia, objetivo_cobertura, ordenar_por_periodo,
+    proyectar_penetracion, provincias_menor_cobertura
+)
+
+# Zoom inicial de los mapas de coropletas (Argentina completa)
+ZOOM_MAPA = 4
+
+
+# -- MAPAS DE COROPLETAS --
+
+@st.cache_data(ttl=TTL_CACHE, show_spinner=False)
+def _html_mapa_coropletas(valores, geojson_path, nombre, leyenda, formato):
+    """
+    Arma un mapa de coropletas de Folium con una sola capa de geometrías y retorna su HTML.
+
+    Los valores y el texto del tooltip se agregan a las propiedades de cada provincia en una sola
+    pasada, y un único GeoJsonTooltip los muestra, en lugar de agregar una capa GeoJson por
+    provincia (que repetía todas las geometrías en el HTML).
+
+    Parámetros:
+    - valores (Series): Valor de cada provincia indexado por la clave de coincidencia (clave_provincia).
+    - geojson_path (str): Ruta al archivo GeoJSON con las geometrías de las provincias.
+    - nombre (str): Nombre de la capa.
+    - leyenda (str): Título de la escala de colores.
+    - formato (str): Formato del valor en el tooltip, p. ej. '{:.2f}% cobertura'.
+
+    Retorno:
+    - str con el HTML completo del mapa.
+    """
+    # GeoJSON con la clave de coincidencia, parseado una vez y simplificado para el zoom del mapa
+    # (copia propia: se agregan los valores a las propiedades)
+    geojson_data = obtener_geojson(geojson_path, nivel_para_zoom(ZOOM_MAPA), copiar=True)
+
+    # Texto del tooltip de cada provincia, formateado una vez por valor
+    textos = valores.map(formato.format).to_dict()
+    for feature in geojson_data['features']:
+        propiedades = feature['properties']
+        nombre_provincia = propiedades['NAME_1'].lower().capitalize()
+        propiedades['tooltip'] = f"{nombre_provincia}: {textos.get(propiedades['clave'], 'No data')}"
+
+    # Crear el mapa centrado en Argentina
+    m = folium.Map(location=[-38.4161, -63.6167], zoom_start=ZOOM_MAPA)
+
+    # Mapa de coropletas: su capa de geometrías es la única y lleva el tooltip
+    choropleth = folium.Choropleth(
+        geo_data=geojson_data,
+        name=nombre,
+        data=valores.rename_axis('clave').reset_index(name='valor'),
+        columns=['clave', 'valor'],
+        key_on="feature.properties.clave",  # Clave normalizada agregada al GeoJSON
+        fill_color="YlGnBu",
+        fill_opacity=0.7,
+        line_opacity=0.2,
+        legend_name=leyenda,
+    ).add_to(m)
+    choropleth.geojson.add_child(folium.GeoJsonTooltip(fields=['tooltip'], labels=False))
+
+    # Añadir controles de capas
+    folium.LayerControl().add_to(m)
+
+    return m.get_root().render()
+
+
+def mostrar_mapa_coropletas(valores, geojson_path, nombre, leyenda, formato):
+    """
+    Muestra en Streamlit un mapa de coropletas (ver _html_mapa_coropletas). Streamlit memoriza el
+    HTML por valores, así las siguientes ejecuciones de la página lo reutilizan hasta que cambien
+    los datos o venza el TTL.
+
+    Parámetros: los de _html_mapa_coropletas.
+
+    Retorno:
+    - None: Muestra el mapa interactivo en Streamlit.
+    """
+    html = _html_mapa_coropletas(valores, geojson_path, nombre, leyenda, formato)
+    components.html(html, width=725, height=500)
 
 
 # -- GRÁFICOS PARA KPI 1: ACCESO A INTERNET --
@@ -12,30 +90,26 @@ from streamlit_folium import st_folium
 # PRIMER GRÁFICO: Penetración de Internet por cada 100 hogares
 def graficar_penetracion_internet(df_penetracion):
     """
-    Genera un gráfico de barras agrupadas interactivo que muestra la penetración de internet 
+    Genera un gráfico de barras agrupadas interactivo que muestra la penetración de internet
     por cada 100 hogares en diferentes provincias y trimestres.
 
     Parámetros:
-    - df_penetracion (DataFrame): DataFrame con las columnas 'nombre_provincia', 
+    - df_penetracion (DataFrame): DataFrame con las columnas 'nombre_provincia',
                                   'anio', 'trimestre', y 'accesos_por_100_hogares'.
 
     Retorno:
     - None: Muestra el gráfico interactivo en Streamlit.
     """
-    # Filtrar los datos a partir de 2023
-    df_penetracion_reciente = df_penetracion[df_penetracion['anio'] >= 2023].sort_values('accesos_por_100_hogares')
-
-    # Crear columna 'anio_trimestre'
-    df_penetracion_reciente['anio_trimestre'] = df_penetracion_reciente['anio'].astype(str) + ' T' + df_penetracion_reciente['trimestre'].astype(str)
+    # Mostrar en Streamlit (figura memorizada: solo se arma de nuevo si cambian los datos)
+    st.plotly_chart(_figura_penetracion_internet(df_penetracion))
 
-    # Crear una columna temporal para ordenar correctamente por año y trimestre
-    df_penetracion_reciente['orden'] = df_penetracion_reciente['anio'] * 10 + df_penetracion_reciente['trimestre']
 
-    # Ordenar el DataFrame por la nueva columna 'orden'
-    df_penetracion_reciente = df_penetracion_reciente.sort_values(by='orden')
-
-    # Eliminar la columna temporal después de la ordenación
-    df_penetracion_reciente.drop(columns=['orden'], inplace=True)
+@st.cache_data(ttl=TTL_CACHE, show_spinner=False)
+def _figura_penetracion_internet(df_penetracion):
+    """ Arma la figura de graficar_penetracion_internet """
+    # Los datos llegan filtrados desde 2023 por la consulta SQL y con el periodo ya agregado por
+    # el cargador (load_internet_penetration_data); ordenar por periodo y, dentro de cada uno, por accesos
+    df_penetracion_reciente = ordenar_por_periodo(df_penetracion, por='accesos_por_100_hogares')
    
     # Gráfico interactivo de barras agrupadas
     fig_barras = px.bar(
@@ -58,8 +132,7 @@ def graficar_penetracion_internet(df_penetracion):
         yaxis_range=[0, df_penetracion_reciente['accesos_por_100_hogares'].max() + 10]
     )
 
-    # Mostrar en Streamlit
-    st.plotly_chart(fig_barras)
+    return fig_barras
 
 
 # SEGUNDO GRÁFICO: Comparativa de acceso actual vs. proyectado
@@ -76,15 +149,15 @@ def graficar_comparativa_acceso_proyectado(df_penetracion):
     Retorno:
     - None: Muestra el gráfico interactivo en Streamlit.
     """
-    # Crear df_penetracion_reciente para filtrar datos a partir de 2023 y crear columna 'anio_trimestre'
-    df_penetracion_reciente = df_penetracion[df_penetracion['anio'] >= 2023].copy()
-    df_penetracion_reciente['anio_trimestre'] = df_penetracion_reciente['anio'].astype(str) + ' T' + df_penetracion_reciente['trimestre'].astype(str)
+    # Mostrar gráfico en Streamlit (figura memorizada: solo se arma de nuevo si cambian los datos)
+    st.plotly_chart(_figura_comparativa_acceso_proyectado(df_penetracion), use_container_width=True)
 
-    # Filtrar datos para el último trimestre registrado (2024 T1) y copiar para la proyección
-    df_kpi = df_penetracion_reciente[df_penetracion_reciente['anio_trimestre'] == '2024 T1'].copy()
 
-    # Agregar columna con el nuevo acceso proyectado con un 2% de aumento
-    df_kpi['acceso_proyectado'] = df_kpi['accesos_por_100_hogares'] * 1.02
+@st.cache_data(ttl=TTL_CACHE, show_spinner=False)
+def _figura_comparativa_acceso_proyectado(df_penetracion):
+    """ Arma la figura de graficar_comparativa_acceso_proyectado """
+    # Datos del último trimestre registrado (2024 T1) con el acceso proyectado con un 2% de aumento
+    df_kpi = proyectar_penetracion(df_penetracion)
 
     # Reorganizar el DataFrame para Plotly
     df_kpi_melted = df_kpi.melt(id_vars='nombre_provincia', 
@@ -119,8 +192,7 @@ def graficar_comparativa_acceso_proyectado(df_penetracion):
         yaxis_range=[0, df_kpi_melted['Cantidad'].max() + 10]
     )
 
-    # Mostrar gráfico en Streamlit
-    st.plotly_chart(fig_barras, use_container_width=True)
+    return fig_barras
 
 
 # TERCER GRÁFICO: Evolución de la penetración de internet por provincia
@@ -131,60 +203,49 @@ def graficar_evolucion_penetracion_provincia(df_penetracion, provincia):
     aumento del 2% en el último trimestre disponible.
 
     Parámetros:
-    - df_penetracion (DataFrame): DataFrame con las columnas 'nombre_provincia', 'anio_trimestre', 
-                                  y 'accesos_por_100_hogares'.
+    - df_penetracion (DataFrame): Tabla de proyeccion_penetracion (series de todas las provincias con
+                                  sus trimestres proyectados), calculada una vez por versión de los datos.
     - provincia (str): Nombre de la provincia seleccionada.
 
     Retorno:
     - None: Muestra el gráfico interactivo en Streamlit.
     """
-    # Filtrar datos a partir de 2023 y crear columna 'anio_trimestre'
-    df_penetracion_reciente = df_penetracion[df_penetracion['anio'] >= 2023].copy().sort_values('accesos_por_100_hogares')
-    df_penetracion_reciente['anio_trimestre'] = df_penetracion_reciente['anio'].astype(str) + ' T' + df_penetracion_reciente['trimestre'].astype(str)
-
-    # Filtrar los datos por la provincia seleccionada
-    df_provincia_filtrada = df_penetracion_reciente[df_penetracion_reciente['nombre_provincia'] == provincia]
-
-    # Obtener los datos del último trimestre para calcular la proyección
-    df_kpi = df_provincia_filtrada[df_provincia_filtrada['anio_trimestre'] == '2024 T1']
-
-    # Proyectar un aumento del 2% en accesos para 2024 T2
-    if not df_kpi.empty:
-        acceso_actual = df_kpi['accesos_por_100_hogares'].values[0]
-        acceso_proyectado = acceso_actual * 1.02
-
-        # Crear los datos de proyección
-        datos_proyectados = {
-            'anio_trimestre': ['2024 T2'],
-            'accesos_por_100_hogares': [acceso_proyectado],
-            'nombre_provincia': provincia
-        }
-
-        df_proyeccion = pd.DataFrame(datos_proyectados)
-
-        # Concatenar los datos históricos y proyectados
-        df_completo = pd.concat([df_provincia_filtrada, df_proyeccion])
-
-        # Gráfico interactivo de líneas
-        fig_lineas = px.line(
-            df_completo, 
-            x='anio_trimestre', 
-            y='accesos_por_100_hogares', 
-            title=f'Evolución de la Penetración de Internet por Provincia: {provincia} (2023 en adelante)',
-            labels={'anio_trimestre': 'Año y Trimestre', 'accesos_por_100_hogares': 'Accesos por 100 Hogares'},
-            markers=True
-        )
+    # Figura memorizada por provincia: cambiar la selección a una provincia ya vista no la vuelve a armar
+    fig_lineas = _figura_evolucion_penetracion_provincia(df_penetracion, provincia)
 
-        # Personalización del gráfico
-        fig_lineas.update_layout(
-            xaxis_title='Año y Trimestre',
-            yaxis_title='Accesos por 100 Hogares',
-            xaxis_tickangle=-45
-        )
+    # Mostrar el gráfico en Streamlit
+    st.plotly_chart(fig_lineas, use_container_width=True)
+
+
+@st.cache_data(ttl=TTL_CACHE, show_spinner=False)
+def _figura_evolucion_penetracion_provincia(df_penetracion, provincia):
+    """ Arma la figura de graficar_evolucion_penetracion_provincia (solo el histórico si no hay proyección) """
+    # Serie de la provincia en orden cronológico, con la proyección del 2% al final
+    df_completo, acceso_proyectado = evolucion_provincia(df_penetracion, provincia)
+
+    # Gráfico interactivo de líneas
+    fig_lineas = px.line(
+        df_completo,
+        x='anio_trimestre',
+        y='accesos_por_100_hogares',
+        title=f'Evolución de la Penetración de Internet por Provincia: {provincia} (2023 en adelante)',
+        labels={'anio_trimestre': 'Año y Trimestre', 'accesos_por_100_hogares': 'Accesos por 100 Hogares'},
+        markers=True
+    )
+
+    # Personalización del gráfico
+    fig_lineas.update_layout(
+        xaxis_title='Año y Trimestre',
+        yaxis_title='Accesos por 100 Hogares',
+        xaxis_tickangle=-45
+    )
+
+    # Sin proyección (provincia sin datos en el periodo base) se muestra solo el histórico
+    if acceso_proyectado is not None:
 
         # Añadir anotación en el punto proyectado
         fig_lineas.add_annotation(
-            x='2024 T2',
+            x=df_completo['anio_trimestre'].iloc[-1],
             y=acceso_proyectado,
             text="Proyección",
             showarrow=True,
@@ -193,8 +254,7 @@ def graficar_evolucion_penetracion_provincia(df_penetracion, provincia):
             ay=-40
         )
 
-        # Mostrar el gráfico en Streamlit
-        st.plotly_chart(fig_lineas, use_container_width=True)
+    return fig_lineas
 
 
 # CUARTO GRÁFICO: Mapa de coropletas con la penetración de internet por provincia
@@ -211,55 +271,34 @@ def graficar_mapa_penetracion(df_penetracion_provincia, geojson_path):
     Retorno:
     - None: Muestra el mapa interactivo en Streamlit.
     """
-    # Cargar el archivo GeoJSON
-    with open(geojson_path) as f:
-        geojson_data = json.load(f)
-
-    # Crear el mapa centrado en Argentina
-    m = folium.Map(location=[-38.4161, -63.6167], zoom_start=4)
-
-    # Crear mapa de coropletas con Folium
-    choropleth = folium.Choropleth(
-        geo_data=geojson_data,
-        name="Penetración de Internet",
-        data=df_penetracion_provincia.set_index('nombre_provincia'),
-        columns=[df_penetracion_provincia.set_index('nombre_provincia').index, 'promedio_accesos'],
-        key_on="feature.properties.NAME_1",  # Usar la clave correcta del GeoJSON
-        fill_color="YlGnBu",
-        fill_opacity=0.7,
-        line_opacity=0.2,
-        legend_name="Accesos por 100 Hogares",
-    ).add_to(m)
-
-    # Añadir tooltips personalizados para cada provincia
-    for feature in geojson_data['features']:
-        nombre_provincia = feature['properties']['NAME_1'].lower()
-        penetracion = df_penetracion_provincia.set_index('nombre_provincia').get('promedio_accesos').get(nombre_provincia, 'No data')
-        
-        popup_text = f"{nombre_provincia.capitalize()}: {penetracion:.2f} accesos por 100 hogares" if penetracion != 'No data' else f"{nombre_provincia.capitalize()}: No data"
-        
-        folium.GeoJson(
-            feature,
-            tooltip=folium.Tooltip(popup_text)
-        ).add_to(m)
-
-    # Añadir controles de capas
-    folium.LayerControl().add_to(m)
+    # Indexar los datos por la clave del GeoJSON ('BuenosAires' y 'buenos aires' -> 'buenosaires')
+    penetracion_por_clave = df_penetracion_provincia.assign(
+        clave=claves_provincia(df_penetracion_provincia['nombre_provincia'])
+    ).set_index('clave')['promedio_accesos']
 
     # Mostrar el mapa en Streamlit
     st.subheader("Mapa de Penetración por Provincia")
-    st_folium(m, width=725)
+    mostrar_mapa_coropletas(
+        penetracion_por_clave,
+        geojson_path,
+        nombre="Penetración de Internet",
+        leyenda="Accesos por 100 Hogares",
+        formato="{:.2f} accesos por 100 hogares"
+    )
 
 
 # -- GRÁFICOS PARA KPI 2: COBERTURA DE FIBRA ÓPTICA --
 
 # PRIMER GRÁFICO: Porcentaje de localidades con fibra óptica por provincia
+@st.fragment
 def graficar_porcentaje_localidades_fibra(df):
     """
     Genera un gráfico de barras que muestra el porcentaje de localidades con fibra óptica por provincia.
+    Es un fragmento de Streamlit: cambiar las provincias seleccionadas vuelve a ejecutar solo este
+    gráfico, no el mapa ni el resto de la página.
 
     Parámetros:
-    - df (DataFrame): DataFrame que contiene las columnas 'nombre_provincia', 'localidad', y 'fibra_optica'.
+    - df (DataFrame): DataFrame agregado por provincia con las columnas 'nombre_provincia' y 'porcentaje_fibra'.
 
     Retorno:
     - None: Muestra el gráfico interactivo en Streamlit.
@@ -271,13 +310,15 @@ def graficar_porcentaje_localidades_fibra(df):
     # Filtrar el DataFrame por las provincias seleccionadas
     df_filtrado = df[df['nombre_provincia'].isin(provincia_seleccionada)]
 
-    # Calcular el porcentaje de localidades con fibra óptica
-    df_fibra_optica = df_filtrado[df_filtrado['fibra_optica'] == True]
-    total_localidades_provincia = df_filtrado.groupby('nombre_provincia')['localidad'].count()
-    localidades_fibra_provincia = df_fibra_optica.groupby('nombre_provincia')['localidad'].count()
+    # Mostrar gráfico en Streamlit (figura memorizada por selección de provincias)
+    st.plotly_chart(_figura_porcentaje_localidades_fibra(df_filtrado), use_container_width=True)
+
 
-    porcentaje_fibra_optica = (localidades_fibra_provincia / total_localidades_provincia) * 100
-    porcentaje_fibra_optica = porcentaje_fibra_optica.sort_values()
+@st.cache_data(ttl=TTL_CACHE, show_spinner=False)
+def _figura_porcentaje_localidades_fibra(df_filtrado):
+    """ Arma la figura de graficar_porcentaje_localidades_fibra con las provincias seleccionadas """
+    # Porcentaje de localidades con fibra óptica (precalculado por provincia en la vista materializada)
+    porcentaje_fibra_optica = df_filtrado.set_index('nombre_provincia')['porcentaje_fibra'].sort_values()
 
     # Crear gráfico de barras
     fig = px.bar(
@@ -290,8 +331,7 @@ def graficar_porcentaje_localidades_fibra(df):
     )
     fig.update_traces(texttemplate='%{text:.2f}%', textposition='outside')
 
-    # Mostrar gráfico en Streamlit
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 # SEGUNDO GRÁFICO: Cobertura de fibra óptica actual vs. proyectada
@@ -301,24 +341,20 @@ def graficar_cobertura_fibra_optica_proyectada(df):
     en provincias con menor cobertura.
 
     Parámetros:
-    - df (DataFrame): DataFrame que contiene las columnas 'nombre_provincia' y 'fibra_optica'.
+    - df (DataFrame): DataFrame agregado por provincia con las columnas 'nombre_provincia' y 'porcentaje_fibra'.
 
     Retorno:
     - None: Muestra el gráfico interactivo en Streamlit.
     """
-    # Filtrar provincias con menor cobertura (por debajo del 25% del total)
-    prov_menor_cobertura_fibra = df.groupby('nombre_provincia')['fibra_optica'].mean()
-    prov_menor_cobertura_fibra = prov_menor_cobertura_fibra[prov_menor_cobertura_fibra < prov_menor_cobertura_fibra.quantile(0.25)]
-    
-    # Proyección de aumento del 30% en la cobertura
-    prov_menor_cobertura_fibra_proyectado = prov_menor_cobertura_fibra * 1.30
-
-    # Crear un DataFrame para el gráfico
-    df_fibra_optica = pd.DataFrame({
-        'Provincia': prov_menor_cobertura_fibra.index,
-        'Cobertura Actual': prov_menor_cobertura_fibra.values,
-        'Cobertura Proyectada': prov_menor_cobertura_fibra_proyectado.values
-    })
+    # Mostrar gráfico en Streamlit (figura memorizada: solo se arma de nuevo si cambian los datos)
+    st.plotly_chart(_figura_cobertura_fibra_optica_proyectada(df), use_container_width=True)
+
+
+@st.cache_data(ttl=TTL_CACHE, show_spinner=False)
+def _figura_cobertura_fibra_optica_proyectada(df):
+    """ Arma la figura de graficar_cobertura_fibra_optica_proyectada """
+    # Provincias con menor cobertura (por debajo del 25% del total) y su proyección con un 30% de aumento
+    df_fibra_optica = provincias_menor_cobertura(df)
 
     # Transformar el DataFrame para mostrar la cobertura actual vs proyectada
     df_fibra_optica_melted = df_fibra_optica.melt(id_vars='Provincia', 
@@ -337,8 +373,7 @@ def graficar_cobertura_fibra_optica_proyectada(df):
     )
     fig.update_traces(texttemplate='%{text:.2f}%', textposition='outside')
 
-    # Mostrar gráfico en Streamlit
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 # TERCER GRÁFICO: Mapa de coropletas con la cobertura de fibra óptica por provincia
@@ -348,54 +383,27 @@ def graficar_mapa_cobertura_fibra(df, geojson_path):
     por cada provincia en Argentina.
 
     Parámetros:
-    - df (DataFrame): DataFrame que contiene las columnas 'nombre_provincia' y 'fibra_optica'.
+    - df (DataFrame): DataFrame agregado por provincia con las columnas 'nombre_provincia' y 'porcentaje_fibra'.
     - geojson_path (str): Ruta al archivo GeoJSON con las geometrías de las provincias.
 
     Retorno:
     - None: Muestra el mapa interactivo en Streamlit.
     """
-    # Calcular el porcentaje de cobertura de fibra óptica por provincia
-    cobertura_provincia = df.groupby('nombre_provincia')['fibra_optica'].mean() * 100
-
-    # Cargar el archivo GeoJSON
-    with open(geojson_path) as f:
-        geojson_data = json.load(f)
+    # Porcentaje de cobertura de fibra óptica por provincia
+    cobertura_provincia = df.set_index('nombre_provincia')['porcentaje_fibra']
 
-    # Crear el mapa centrado en Argentina
-    m = folium.Map(location=[-38.4161, -63.6167], zoom_start=4)
-
-    # Crear el mapa de coropletas con cobertura de fibra óptica
-    choropleth = folium.Choropleth(
-        geo_data=geojson_data,
-        name="Cobertura de Fibra Óptica",
-        data=cobertura_provincia,
-        columns=[cobertura_provincia.index, cobertura_provincia],
-        key_on="feature.properties.NAME_1",  # Clave en el GeoJSON que corresponde con las provincias
-        fill_color="YlGnBu",
-        fill_opacity=0.7,
-        line_opacity=0.2,
-        legend_name="Cobertura de Fibra Óptica (%)",
-    ).add_to(m)
-
-    # Añadir tooltips personalizados con nombre y porcentaje de cobertura
-    for feature in geojson_data['features']:
-        nombre_provincia = feature['properties']['NAME_1'].lower()  # Aseguramos que coincide en minúsculas
-        cobertura = cobertura_provincia.get(nombre_provincia, 'No data')
-        
-        # Crear el texto para el tooltip
-        popup_text = f"{nombre_provincia.capitalize()}: {cobertura:.2f}% cobertura" if cobertura != 'No data' else f"{nombre_provincia.capitalize()}: No data"
-        
-        folium.GeoJson(
-            feature,
-            tooltip=folium.Tooltip(popup_text)
-        ).add_to(m)
-
-    # Añadir controles de capas
-    folium.LayerControl().add_to(m)
+    # Indexar la cobertura por la clave de coincidencia con el GeoJSON
+    cobertura_provincia = cobertura_provincia.rename(index=clave_provincia)
 
     # Mostrar el mapa en Streamlit
     st.subheader("Cobertura de Fibra Óptica por Provincia")
-    st_folium(m, width=725)
+    mostrar_mapa_coropletas(
+        cobertura_provincia,
+        geojson_path,
+        nombre="Cobertura de Fibra Óptica",
+        leyenda="Cobertura de Fibra Óptica (%)",
+        formato="{:.2f}% cobertura"
+    )
 
 
 # CUARTO GRÁFICO: Proyección de aumento en la cobertura de fibra óptica
@@ -405,16 +413,10 @@ def mostrar_tarjetas_cobertura(df):
     en la cobertura de fibra óptica a nivel nacional.
 
     Parámetros:
-    - df (DataFrame): DataFrame que contiene la columna 'fibra_optica' por provincia.
+    - df (DataFrame): DataFrame agregado por provincia con la columna 'porcentaje_fibra'.
     """
-    # Calcular porcentaje de cobertura de fibra óptica por provincia
-    cobertura_provincia = df.groupby('nombre_provincia')['fibra_optica'].mean() * 100
-    
-    # Calcular el promedio actual de cobertura de fibra óptica a nivel nacional
-    promedio_cobertura_actual = cobertura_provincia.mean()
-
-    # Progreso hacia el 10% proyectado (actual + 10%)
-    objetivo_cobertura = promedio_cobertura_actual * 1.10
+    # Promedio actual de cobertura de fibra óptica a nivel nacional y objetivo con el 10% de aumento
+    promedio_cobertura_actual, objetivo = objetivo_cobertura(df)
 
     # Mostrar los KPIs en tarjetas
     st.subheader('Progreso hacia el 10% de aumento en la cobertura de fibra óptica')
@@ -431,8 +433,8 @@ def mostrar_tarjetas_cobertura(df):
     # Tarjeta 2: Proyección 10%
     col2.metric(
         label="Cobertura Proyectada",
-        value=f"{objetivo_cobertura:.2f}%",
-        delta=f"+{(objetivo_cobertura - promedio_cobertura_actual):.2f}% adicional proyectado"
+        value=f"{objetivo:.2f}%",
+        delta=f"+{(objetivo - promedio_cobertura_actual):.2f}% adicional proyectado"
     )
 
 # -- GRÁFICOS PARA KPI 3: AUMENTO EN PLANES POSPAGO --
@@ -449,11 +451,16 @@ def graficar_evolucion_accesos_pospago(df):
     Retorno:
     - None: Muestra el gráfico interactivo en Streamlit.
     """
-    # Filtrar datos a partir de 2023
-    df_pospago_reciente = df[df['anio'] >= 2023].copy()
+    # Mostrar el gráfico en Streamlit (figura memorizada: solo se arma de nuevo si cambian los datos)
+    st.plotly_chart(_figura_evolucion_accesos_pospago(df), use_container_width=True)
 
-    # Crear columna combinada para año y trimestre
-    df_pospago_reciente['anio_trimestre'] = df_pospago_reciente['anio'].astype(str) + ' T' + df_pospago_reciente['trimestre'].astype(str)
+
+@st.cache_data(ttl=TTL_CACHE, show_spinner=False)
+def _figura_evolucion_accesos_pospago(df):
+    """ Arma la figura de graficar_evolucion_accesos_pospago """
+    # Los datos llegan filtrados desde 2023 por la consulta SQL (cargar_datos_accesos_movil), con la
+    # etiqueta categórica 'anio_trimestre' agregada por el cargador
+    df_pospago_reciente = agregar_anio_trimestre(df)
 
     # Crear el gráfico de barras horizontales
     fig = px.bar(
@@ -477,37 +484,42 @@ def graficar_evolucion_accesos_pospago(df):
         plot_bgcolor='rgba(0,0,0,0)',
     )
 
-    # Mostrar el gráfico en Streamlit
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 # SEGUNDO GRÁFICO: Proyección de aumento en accesos pospago
-def graficar_proyeccion_accesos_pospago():
+def graficar_proyeccion_accesos_pospago(df_proyeccion):
     """
     Genera un gráfico de líneas que muestra la evolución histórica de accesos a planes pospago
-    y una proyección de aumento del 5% para el tercer trimestre de 2024.
+    y una proyección de aumento del 5% para el trimestre siguiente.
+
+    Parámetros:
+    - df_proyeccion (DataFrame): Tabla de proyeccion_accesos_pospago, con las columnas 'anio_trimestre',
+                                 'total_accesos_pospago' y 'proyectado'.
 
     Retorno:
     - None: Muestra el gráfico interactivo en Streamlit.
     """
-    # Datos históricos y proyección
-    trimestres = ['2023 T1', '2023 T2', '2023 T3', '2023 T4', '2024 T1', '2024 T2']
-    accesos_postpago = [7028083, 7310125, 7903181, 8301200, 8398514, 8397205]  # Datos oficiales
+    # Mostrar el gráfico en Streamlit (figura memorizada: solo se arma de nuevo si cambian los datos)
+    st.plotly_chart(_figura_proyeccion_accesos_pospago(df_proyeccion), use_container_width=True)
 
-    # Proyección del 5% para el tercer trimestre de 2024
-    proyeccion_t3_2024 = accesos_postpago[-1] * 1.05
 
-    # Agregar el trimestre proyectado
-    trimestres.append('2024 T3')
-    accesos_postpago.append(proyeccion_t3_2024)
+@st.cache_data(ttl=TTL_CACHE, show_spinner=False)
+def _figura_proyeccion_accesos_pospago(df_proyeccion):
+    """ Arma la figura de graficar_proyeccion_accesos_pospago """
+    # Datos históricos y proyección, leídos de la tabla del motor de proyecciones
+    df_historico = df_proyeccion[~df_proyeccion['proyectado']]
+    df_proyectado = df_proyeccion.iloc[len(df_historico) - 1:]  # Desde el último trimestre real
+    periodo_proyectado = df_proyeccion['anio_trimestre'].iloc[-1]
+    valor_proyectado = df_proyeccion['total_accesos_pospago'].iloc[-1]
 
     # Crear la figura de líneas
     fig = go.Figure()
 
     # Datos históricos
     fig.add_trace(go.Scatter(
-        x=trimestres[:-1], 
-        y=accesos_postpago[:-1], 
+        x=df_historico['anio_trimestre'],
+        y=df_historico['total_accesos_pospago'],
         mode='lines+markers', 
         name='Datos Históricos',
         line=dict(color='blue')
@@ -515,8 +527,8 @@ def graficar_proyeccion_accesos_pospago():
 
     # Proyección
     fig.add_trace(go.Scatter(
-        x=trimestres[-2:], 
-        y=accesos_postpago[-2:], 
+        x=df_proyectado['anio_trimestre'],
+        y=df_proyectado['total_accesos_pospago'],
         mode='lines+markers', 
         name='Proyección', 
         line=dict(dash='dash', color='orange')
@@ -524,23 +536,22 @@ def graficar_proyeccion_accesos_pospago():
 
     # Anotación del valor proyectado
     fig.add_annotation(
-        x='2024 T3',
-        y=proyeccion_t3_2024,
-        text=f'{proyeccion_t3_2024:,.0f}',
+        x=periodo_proyectado,
+        y=valor_proyectado,
+        text=f'{valor_proyectado:,.0f}',
         showarrow=True,
         arrowhead=2
     )
 
     # Configuración del gráfico
     fig.update_layout(
-        title='Proyección del 5% en Accesos de Planes Pospago (2024 T3)',
+        title=f'Proyección del {AUMENTO_POSPAGO:.0%} en Accesos de Planes Pospago ({periodo_proyectado})',
         xaxis_title='Período (Año y Trimestre)',
         yaxis_title='Accesos de Planes Pospago',
         legend_title_text='Datos',
     )
 
-    # Mostrar el gráfico en Streamlit
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 # TERCER GRÁFICO: Distribución de accesos pospago y prepago 
@@ -550,13 +561,21 @@ def graficar_distribucion_accesos(df):
     para el primer y segundo trimestre de 2024.
 
     Parámetros:
-    - df (DataFrame): DataFrame con las columnas 'anio', 'total_accesos_pospago' y 'total_accesos_prepago'.
+    - df (DataFrame): Totales de 2024 ya agregados por la consulta SQL, con las columnas 'anio',
+                      'total_accesos_pospago' y 'total_accesos_prepago'
+                      (cargar_datos_accesos_movil(desde=2024, hasta=2024, nivel='anio')).
 
     Retorno:
     - None: Muestra el gráfico interactivo en Streamlit.
     """
-    # Filtrar los datos para 2024 T1 y T2
-    df_t2_2024 = df[df['anio'] == 2024]
+    # Mostrar el gráfico en Streamlit (figura memorizada: solo se arma de nuevo si cambian los datos)
+    st.plotly_chart(_figura_distribucion_accesos(df), use_container_width=True)
+
+
+@st.cache_data(ttl=TTL_CACHE, show_spinner=False)
+def _figura_distribucion_accesos(df):
+    """ Arma la figura de graficar_distribucion_accesos """
+    df_t2_2024 = df
 
     # Sumar los accesos pospago y prepago
     accesos_pospago = df_t2_2024['total_accesos_pospago'].sum()
@@ -578,26 +597,25 @@ def graficar_distribucion_accesos(df):
         hole=0.3  # Gráfico de dona
     )
 
-    # Mostrar el gráfico en Streamlit
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 # CUARTO GRÁFICO: Tarjetas de métricas para accesos pospago
-def mostrar_tarjetas_accesos_pospago(df):
+def mostrar_tarjetas_accesos_pospago(df_proyeccion):
     """
-    Muestra tarjetas de métricas que indican el progreso hacia el 5% de aumento en los accesos pospago.
+    Muestra tarjetas de métricas que indican el progreso hacia el aumento proyectado (AUMENTO_POSPAGO)
+    en los accesos pospago.
 
     Parámetros:
-    - df (DataFrame): DataFrame con la columna 'total_accesos_pospago' y el último valor disponible de accesos.
+    - df_proyeccion (DataFrame): Tabla de proyeccion_accesos_pospago, con las columnas 'total_accesos_pospago'
+                                 y 'proyectado'.
     """
-    # Filtrar los datos recientes de accesos pospago
-    df_pospago_reciente = df[df['anio'] >= 2023]
-
     # Obtener los accesos pospago actuales (último trimestre disponible)
-    accesos_pospago_actuales = df_pospago_reciente['total_accesos_pospago'].iloc[-1]
-    
-    # Calcular la proyección de aumento del 5%
-    proyeccion_5p = accesos_pospago_actuales * 1.05
+    df_historico = df_proyeccion[~df_proyeccion['proyectado']]
+    accesos_pospago_actuales = df_historico['total_accesos_pospago'].iloc[-1]
+
+    # Proyección para el trimestre siguiente (calculada por el motor de proyecciones)
+    proyeccion_5p = df_proyeccion['total_accesos_pospago'].iloc[len(df_historico)]
     delta_proyeccion = proyeccion_5p - accesos_pospago_actuales
 
     # Crear columnas para mostrar las métricas
@@ -611,9 +629,9 @@ def mostrar_tarjetas_accesos_pospago(df):
         delta_color="normal"
     )
 
-    # Tarjeta 2: Proyección del 5% de Aumento
+    # Tarjeta 2: Proyección del aumento (AUMENTO_POSPAGO)
     col2.metric(
-        label="Proyección Pospago (+5%)",
+        label=f"Proyección Pospago (+{AUMENTO_POSPAGO:.0%})",
         value=f"{proyeccion_5p:,.0f}",
         delta=f"+{delta_proyeccion:,.0f}",
         delta_color="inverse"
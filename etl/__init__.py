@@ -0,0 +1,3 @@
+"""
+Módulos reutilizables del proceso ETL: extracción de los datasets fuente y carga en PostgreSQL.
+"""
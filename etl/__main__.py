@@ -0,0 +1,54 @@
+import argparse
+import time
+
+from etl.pipeline import HOJAS, ejecutar_pipeline, imprimir_reporte
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m etl",
+        description="Procesa los datasets de Internet, Telefonía Móvil y Mapa de Conectividad en paralelo."
+    )
+    parser.add_argument("--origen", default="datasets/original_datasets",
+                        help="Carpeta con los archivos Excel originales")
+    parser.add_argument("--salida", default="datasets/dataset_procesados_proyecto",
+                        help="Carpeta raíz de los datasets procesados")
+    parser.add_argument("--formato", nargs="+", choices=["csv", "parquet"], default=["csv"],
+                        help="Formatos de salida")
+    parser.add_argument("--hojas", nargs="+", metavar="SALIDA",
+                        help="Procesar solo estas salidas (p. ej. mapa_conectividad ingresos_servicios_internet)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Procesos en paralelo (por defecto uno por CPU)")
+    parser.add_argument("--forzar", action="store_true",
+                        help="Reprocesar todas las hojas aunque no hayan cambiado")
+    parser.add_argument("--cargar", action="store_true",
+                        help="Recargar en la base de datos las tablas de las hojas procesadas (usa las variables "
+                             "DB_HOST, DB_NAME, DB_USER y DB_PASSWORD)")
+    args = parser.parse_args()
+
+    hojas = HOJAS
+    if args.hojas:
+        desconocidas = set(args.hojas) - {hoja['salida'] for hoja in HOJAS}
+        if desconocidas:
+            parser.error(f"Salidas desconocidas: {', '.join(sorted(desconocidas))}")
+        hojas = [hoja for hoja in HOJAS if hoja['salida'] in args.hojas]
+
+    inicio = time.perf_counter()
+    resultados = ejecutar_pipeline(args.origen, args.salida, formatos=args.formato, hojas=hojas,
+                                   max_workers=args.workers, forzar=args.forzar)
+    imprimir_reporte(resultados)
+
+    if args.cargar:
+        # Importación diferida: el procesamiento de las hojas no requiere la base de datos
+        from etl.recarga import recargar_tablas
+        from telecom_core.pool import conexion
+
+        with conexion() as conn:
+            recargadas = recargar_tablas(conn, resultados)
+        print(f"{len(recargadas)} tablas recargadas")
+
+    print(f"ETL completo: {len(resultados)} hojas en {time.perf_counter() - inicio:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
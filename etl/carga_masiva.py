@@ -0,0 +1,174 @@
+import io
+import time
+
+import pandas as pd
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+from etl.vistas import refrescar_vistas, vistas_afectadas
+from telecom_core.cache import invalidar_cache
+
+
+def _preparar_dataframe(df, columnas):
+    """
+    Selecciona las columnas a cargar y convierte a enteros nulables las columnas float
+    con valores enteros (p. ej. 'poblacion' con NaN), para que PostgreSQL las acepte en columnas INT.
+    """
+    df = df[columnas]
+    for columna in df.columns:
+        serie = df[columna]
+        if pd.api.types.is_float_dtype(serie):
+            valores = serie.dropna()
+            if not valores.empty and (valores % 1 == 0).all():
+                df = df.assign(**{columna: serie.astype('Int64')})
+    return df
+
+
+def _copiar(cursor, df, destino, columnas, tam_lote):
+    """ Envía el DataFrame con COPY FROM STDIN en bloques de tam_lote filas """
+    comando = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '')").format(
+        destino, sql.SQL(', ').join(map(sql.Identifier, columnas))
+    )
+    for inicio in range(0, len(df), tam_lote):
+        buffer = io.StringIO()
+        df.iloc[inicio:inicio + tam_lote].to_csv(buffer, index=False, header=False, na_rep='')
+        buffer.seek(0)
+        cursor.copy_expert(comando, buffer)
+
+
+def cargar_dataframe(conn, df, tabla, columnas=None, conflicto=None, truncar=False, metodo='copy', tam_lote=50000):
+    """
+    Carga un DataFrame completo en una tabla dentro de una única transacción.
+
+    Parámetros:
+    - conn: Conexión psycopg2.
+    - df (DataFrame): Datos a cargar; los nombres de columna deben coincidir con los de la tabla.
+    - tabla (str): Tabla destino.
+    - columnas (list, opcional): Columnas a cargar; por defecto todas las del DataFrame.
+    - conflicto (str, opcional): 'ignorar' para omitir filas que violan restricciones únicas
+                                 (equivale a ON CONFLICT DO NOTHING).
+    - truncar (bool): Vaciar la tabla antes de cargar (recarga completa).
+    - metodo (str): 'copy' para COPY FROM STDIN o 'values' para INSERT por lotes con execute_values.
+    - tam_lote (int): Filas por bloque enviado al servidor.
+
+    Retorno:
+    - dict con 'tabla', 'filas', 'segundos' y 'filas_por_segundo'.
+    """
+    columnas = list(columnas or df.columns)
+    df = _preparar_dataframe(df, columnas)
+    destino = sql.Identifier(tabla)
+    lista_columnas = sql.SQL(', ').join(map(sql.Identifier, columnas))
+    sufijo_conflicto = sql.SQL(" ON CONFLICT DO NOTHING") if conflicto == 'ignorar' else sql.SQL("")
+
+    inicio = time.perf_counter()
+    try:
+        with conn.cursor() as cursor:
+            if truncar:
+                cursor.execute(sql.SQL("TRUNCATE {}").format(destino))
+
+            if metodo == 'values':
+                filas = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+                insercion = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(destino, lista_columnas) + sufijo_conflicto
+                # RETURNING permite contar las filas realmente insertadas en todos los lotes
+                insertadas = len(execute_values(
+                    cursor, insercion + sql.SQL(" RETURNING 1"), filas, page_size=tam_lote, fetch=True
+                ))
+            elif conflicto == 'ignorar':
+                # COPY no admite ON CONFLICT: se copia a una tabla temporal y se inserta desde ahí
+                temporal = sql.Identifier(f"tmp_{tabla}")
+                cursor.execute(sql.SQL("CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP").format(temporal, destino))
+                _copiar(cursor, df, temporal, columnas, tam_lote)
+                cursor.execute(
+                    sql.SQL("INSERT INTO {} ({}) SELECT {} FROM {}").format(destino, lista_columnas, lista_columnas, temporal)
+                    + sufijo_conflicto
+                )
+                insertadas = cursor.rowcount
+            else:
+                _copiar(cursor, df, destino, columnas, tam_lote)
+                insertadas = len(df)
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    segundos = time.perf_counter() - inicio
+    return {
+        'tabla': tabla,
+        'filas': insertadas,
+        'segundos': segundos,
+        'filas_por_segundo': insertadas / segundos if segundos > 0 else float('inf')
+    }
+
+
+def analizar_tablas(conn, tablas=None):
+    """
+    Actualiza las estadísticas del planificador (ANALYZE) para que los planes de las consultas
+    de los dashboards reflejen los datos recién cargados.
+
+    Parámetros:
+    - conn: Conexión psycopg2.
+    - tablas (list, opcional): Tablas a analizar; por defecto toda la base.
+    """
+    try:
+        with conn.cursor() as cursor:
+            if tablas:
+                cursor.execute(sql.SQL("ANALYZE {}").format(sql.SQL(', ').join(map(sql.Identifier, tablas))))
+            else:
+                cursor.execute("ANALYZE")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def finalizar_carga(conn, tablas=None):
+    """
+    Pasos posteriores a una carga: refresca las vistas materializadas que dependen de las tablas
+    cargadas, actualiza las estadísticas (ANALYZE) de las tablas y las vistas e invalida el cache
+    de los dashboards.
+
+    Parámetros:
+    - conn: Conexión psycopg2.
+    - tablas (list, opcional): Tablas cargadas; por defecto se refrescan todas las vistas y se analiza
+                               toda la base (p. ej. al terminar la carga tabla por tabla del notebook).
+
+    Retorno:
+    - list con el resultado de refrescar_vistas para cada vista refrescada.
+    """
+    refrescos = refrescar_vistas(conn, None if tablas is None else vistas_afectadas(tablas))
+    for refresco in refrescos:
+        print(f"{refresco['vista']}: refrescada en {refresco['segundos']:.2f} s")
+    if tablas is None:
+        analizar_tablas(conn)
+    else:
+        analizar_tablas(conn, list(tablas) + [refresco['vista'] for refresco in refrescos])
+    invalidar_cache()
+    return refrescos
+
+
+def cargar_tablas(conn, cargas, **opciones):
+    """
+    Carga varias tablas en orden, cada una en su propia transacción, informa las filas por segundo
+    y, si todas las cargas terminan bien, ejecuta finalizar_carga con las tablas cargadas. Si una carga
+    falla, la excepción se propaga sin ese paso (las tablas ya confirmadas quedan cargadas).
+
+    Parámetros:
+    - conn: Conexión psycopg2.
+    - cargas (dict): Tabla destino -> DataFrame, en el orden de carga (dimensiones antes que hechos).
+    - **opciones: Argumentos adicionales para cargar_dataframe (truncar, metodo, conflicto, ...).
+
+    Retorno:
+    - list con el resultado de cargar_dataframe para cada tabla.
+    """
+    resultados = []
+    for tabla, df in cargas.items():
+        resultado = cargar_dataframe(conn, df, tabla, **opciones)
+        print(f"{tabla}: {resultado['filas']} filas en {resultado['segundos']:.2f} s "
+              f"({resultado['filas_por_segundo']:,.0f} filas/s)")
+        resultados.append(resultado)
+
+    # Solo si todas las cargas terminaron: una falla se propaga sin refrescar sobre datos incompletos
+    if resultados:
+        finalizar_carga(conn, [resultado['tabla'] for resultado in resultados])
+    return resultados
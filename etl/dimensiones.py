@@ -0,0 +1,190 @@
+import pandas as pd
+
+from etl.carga_masiva import cargar_dataframe
+from telecom_core.normalizacion import claves_provincia, normalizar_nombre, normalizar_serie
+
+# Consultas de lectura de cada dimensión: se ejecutan una sola vez por CacheDimensiones
+CONSULTAS_DIMENSIONES = {
+    'periodos': "SELECT id_periodo, anio, trimestre FROM periodos",
+    'provincias': "SELECT id_provincia, nombre_provincia FROM provincias",
+    'localidades': "SELECT id_localidad, id_provincia, partido, localidad FROM localidades",
+}
+
+# Máximo de claves faltantes que se muestran en cada advertencia
+MAX_EJEMPLOS_FALTANTES = 5
+
+
+class CacheDimensiones:
+    """
+    Tablas de búsqueda en memoria de las dimensiones periodos, provincias y localidades.
+
+    Cada dimensión se lee una sola vez y las claves foráneas de un DataFrame completo se
+    resuelven con un merge vectorizado, en lugar de un SELECT por fila. Los miembros que
+    faltan en una dimensión pueden insertarse en bloque (crear=True) antes de resolver.
+
+    Parámetros:
+    - conn: Conexión psycopg2, usada para leer las dimensiones y para insertar los faltantes.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._tablas = {}
+
+    # -- LECTURA --
+
+    def _leer(self, dimension):
+        with self.conn.cursor() as cursor:
+            cursor.execute(CONSULTAS_DIMENSIONES[dimension])
+            columnas = [descripcion[0] for descripcion in cursor.description]
+            df = pd.DataFrame(cursor.fetchall(), columns=columnas)
+        # La lectura abre una transacción: se cierra para no dejarla pendiente
+        self.conn.commit()
+
+        # Columnas de coincidencia, únicas para que el merge no duplique filas
+        if dimension == 'periodos':
+            df['anio'] = df['anio'].astype('int64')
+            df['trimestre'] = df['trimestre'].astype('int64')
+            return df.drop_duplicates(subset=['anio', 'trimestre'])
+        if dimension == 'provincias':
+            df['clave_provincia'] = claves_provincia(df['nombre_provincia'])
+            return df.drop_duplicates(subset=['clave_provincia'])
+        df['clave_partido'] = normalizar_serie(df['partido'])
+        df['clave_localidad'] = normalizar_serie(df['localidad'])
+        return df.drop_duplicates(subset=['id_provincia', 'clave_partido', 'clave_localidad'])
+
+    def tabla(self, dimension):
+        """ Retorna la tabla de búsqueda de una dimensión, leyéndola de la base si aún no está en memoria """
+        if dimension not in self._tablas:
+            self._tablas[dimension] = self._leer(dimension)
+        return self._tablas[dimension]
+
+    def recargar(self, dimension=None):
+        """ Descarta una dimensión (o todas) para que se vuelva a leer en el próximo uso """
+        if dimension is None:
+            self._tablas.clear()
+        else:
+            self._tablas.pop(dimension, None)
+
+    # -- RESOLUCIÓN --
+
+    def _buscar(self, claves, dimension, columnas_clave, columna_id):
+        """ Retorna la columna de ids (Int64, nulos si no hay coincidencia) para las claves dadas """
+        tabla = self.tabla(dimension)[columnas_clave + [columna_id]]
+        ids = claves.merge(tabla, how='left', on=columnas_clave)[columna_id]
+        return pd.Series(ids.to_numpy(), index=claves.index, name=columna_id).astype('Int64')
+
+    @staticmethod
+    def _advertir_faltantes(df, columna_id, columnas, dimension):
+        faltantes = df.loc[df[columna_id].isna(), columnas].drop_duplicates()
+        if faltantes.empty:
+            return
+        ejemplos = '; '.join(
+            ', '.join(map(str, fila)) for fila in faltantes.head(MAX_EJEMPLOS_FALTANTES).itertuples(index=False)
+        )
+        print(f"Advertencia: {df[columna_id].isna().sum()} filas sin {dimension} "
+              f"({len(faltantes)} valores distintos, p. ej. {ejemplos})")
+
+    def resolver_periodos(self, df, anio='Año', trimestre='Trimestre', descripcion=None, crear=False):
+        """
+        Agrega la columna 'id_periodo' a partir del año y el trimestre.
+
+        Parámetros:
+        - df (DataFrame): Datos a resolver.
+        - anio, trimestre (str): Columnas con el año y el trimestre.
+        - descripcion (str, opcional): Columna con la descripción del periodo, usada al crear faltantes.
+        - crear (bool): Insertar en bloque los periodos que no existen.
+
+        Retorno:
+        - Copia del DataFrame con 'id_periodo' (nulo en las filas sin periodo).
+        """
+        claves = pd.DataFrame({
+            'anio': pd.to_numeric(df[anio]).astype('Int64'),
+            'trimestre': pd.to_numeric(df[trimestre]).astype('Int64'),
+        }, index=df.index)
+        ids = self._buscar(claves, 'periodos', ['anio', 'trimestre'], 'id_periodo')
+
+        if crear and ids.isna().any():
+            nuevos = claves[ids.isna()].dropna()
+            if descripcion is not None:
+                nuevos = nuevos.assign(descripcion_periodo=df.loc[nuevos.index, descripcion])
+            nuevos = nuevos.drop_duplicates(subset=['anio', 'trimestre'])
+            if not nuevos.empty:
+                cargar_dataframe(self.conn, nuevos, 'periodos', conflicto='ignorar')
+                self.recargar('periodos')
+                ids = self._buscar(claves, 'periodos', ['anio', 'trimestre'], 'id_periodo')
+
+        resultado = df.assign(id_periodo=ids)
+        self._advertir_faltantes(resultado, 'id_periodo', [anio, trimestre], 'periodo')
+        return resultado
+
+    def resolver_provincias(self, df, provincia='Provincia', crear=False):
+        """
+        Agrega la columna 'id_provincia' comparando claves de provincia (clave_provincia), de modo
+        que 'Capital Federal', 'CABA' y 'caba' resuelven al mismo id.
+
+        Parámetros:
+        - df (DataFrame): Datos a resolver.
+        - provincia (str): Columna con el nombre de la provincia.
+        - crear (bool): Insertar en bloque las provincias que no existen, con su nombre normalizado.
+
+        Retorno:
+        - Copia del DataFrame con 'id_provincia' (nulo en las filas sin provincia).
+        """
+        claves = pd.DataFrame({'clave_provincia': claves_provincia(df[provincia])}, index=df.index)
+        ids = self._buscar(claves, 'provincias', ['clave_provincia'], 'id_provincia')
+
+        if crear and ids.isna().any():
+            nombres = df.loc[ids.isna(), provincia].dropna().drop_duplicates()
+            nuevos = pd.DataFrame({
+                'nombre_provincia': [normalizar_nombre(nombre) for nombre in nombres],
+                'clave_provincia': claves_provincia(nombres).to_numpy(),
+            }).drop_duplicates(subset=['clave_provincia'])
+            if not nuevos.empty:
+                cargar_dataframe(self.conn, nuevos, 'provincias', columnas=['nombre_provincia'], conflicto='ignorar')
+                self.recargar('provincias')
+                ids = self._buscar(claves, 'provincias', ['clave_provincia'], 'id_provincia')
+
+        resultado = df.assign(id_provincia=ids)
+        self._advertir_faltantes(resultado, 'id_provincia', [provincia], 'provincia')
+        return resultado
+
+    def resolver_localidades(self, df, provincia='Provincia', partido='Partido', localidad='Localidad',
+                             crear=False, atributos=None):
+        """
+        Agrega las columnas 'id_provincia' e 'id_localidad' a partir de la provincia, el partido y la localidad.
+
+        Parámetros:
+        - df (DataFrame): Datos a resolver.
+        - provincia, partido, localidad (str): Columnas con los nombres.
+        - crear (bool): Insertar en bloque las localidades que no existen (la provincia debe existir).
+        - atributos (dict, opcional): Columna del DataFrame -> columna de 'localidades' que se completa
+                                      al crear (p. ej. {'Link': 'link_indec', 'Latitud': 'latitud'}).
+
+        Retorno:
+        - Copia del DataFrame con 'id_provincia' e 'id_localidad' (nulos en las filas sin coincidencia).
+        """
+        resultado = self.resolver_provincias(df, provincia)
+        claves = pd.DataFrame({
+            'id_provincia': resultado['id_provincia'],
+            'clave_partido': normalizar_serie(df[partido]),
+            'clave_localidad': normalizar_serie(df[localidad]),
+        }, index=df.index)
+        columnas_clave = ['id_provincia', 'clave_partido', 'clave_localidad']
+        ids = self._buscar(claves, 'localidades', columnas_clave, 'id_localidad')
+
+        if crear and ids.isna().any():
+            atributos = atributos or {}
+            faltantes = ids.isna() & claves['id_provincia'].notna()
+            nuevos = claves[faltantes].rename(columns={'clave_partido': 'partido', 'clave_localidad': 'localidad'})
+            for origen, destino in atributos.items():
+                nuevos[destino] = df.loc[faltantes, origen]
+            nuevos = nuevos.drop_duplicates(subset=['id_provincia', 'partido', 'localidad'])
+            if not nuevos.empty:
+                cargar_dataframe(self.conn, nuevos, 'localidades', conflicto='ignorar')
+                self.recargar('localidades')
+                ids = self._buscar(claves, 'localidades', columnas_clave, 'id_localidad')
+
+        resultado = resultado.assign(id_localidad=ids)
+        self._advertir_faltantes(resultado[resultado['id_provincia'].notna()], 'id_localidad',
+                                 [localidad, partido, provincia], 'localidad')
+        return resultado
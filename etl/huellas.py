@@ -0,0 +1,88 @@
+import hashlib
+import json
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pandas as pd
+
+NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PKG = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Archivo donde se guardan las huellas de la última ejecución, dentro de la carpeta de salida
+NOMBRE_ARCHIVO_HUELLAS = ".etl_huellas.json"
+
+
+def _sha256_stream(archivo, tam_bloque=1024 * 1024):
+    hash_ = hashlib.sha256()
+    for bloque in iter(lambda: archivo.read(tam_bloque), b""):
+        hash_.update(bloque)
+    return hash_.hexdigest()
+
+
+def huella_archivo(ruta):
+    """ Retorna el SHA-256 del contenido completo de un archivo """
+    with open(ruta, "rb") as archivo:
+        return _sha256_stream(archivo)
+
+
+def _entradas_hojas(zf):
+    """ Retorna la lista ordenada de (nombre de hoja, entrada XML dentro del .xlsx) """
+    relaciones = {
+        rel.get("Id"): rel.get("Target")
+        for rel in ET.fromstring(zf.read("xl/_rels/workbook.xml.rels")).iter(f"{NS_PKG}Relationship")
+    }
+    entradas = []
+    for hoja in ET.fromstring(zf.read("xl/workbook.xml")).iter(f"{NS_MAIN}sheet"):
+        destino = relaciones[hoja.get(f"{NS_REL}id")]
+        entrada = destino.lstrip("/") if destino.startswith("/") else posixpath.normpath(posixpath.join("xl", destino))
+        entradas.append((hoja.get("name"), entrada))
+    return entradas
+
+
+def huella_hoja_xlsx(ruta, hoja):
+    """
+    Calcula la huella cruda de una hoja sin parsear el libro: el SHA-256 de su XML y el de
+    la tabla de textos compartidos (sharedStrings), que todas las hojas referencian.
+
+    Parámetros:
+    - ruta (str | Path): Archivo .xlsx.
+    - hoja (str | int): Nombre o posición de la hoja.
+
+    Retorno:
+    - dict con las claves 'xml' y 'textos'.
+    """
+    with zipfile.ZipFile(ruta) as zf:
+        entradas = _entradas_hojas(zf)
+        entrada = entradas[hoja][1] if isinstance(hoja, int) else dict(entradas)[hoja]
+        with zf.open(entrada) as archivo:
+            xml = _sha256_stream(archivo)
+        textos = ""
+        if "xl/sharedStrings.xml" in zf.namelist():
+            with zf.open("xl/sharedStrings.xml") as archivo:
+                textos = _sha256_stream(archivo)
+    return {'xml': xml, 'textos': textos}
+
+
+def huella_dataframe(df):
+    """ Retorna un SHA-256 del contenido de un DataFrame (columnas y valores, sin el índice) """
+    hash_ = hashlib.sha256("|".join(map(str, df.columns)).encode("utf-8"))
+    hash_.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return hash_.hexdigest()
+
+
+def leer_huellas(directorio_salida):
+    """ Lee las huellas guardadas en la última ejecución, o un diccionario vacío """
+    try:
+        return json.loads((Path(directorio_salida) / NOMBRE_ARCHIVO_HUELLAS).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def guardar_huellas(directorio_salida, huellas):
+    """ Guarda las huellas de esta ejecución para la próxima comparación """
+    ruta = Path(directorio_salida) / NOMBRE_ARCHIVO_HUELLAS
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    ruta.write_text(json.dumps(huellas, indent=2, ensure_ascii=False), encoding="utf-8")
@@ -0,0 +1,133 @@
+-- Migración 0001: índices para los joins de los dashboards y restricciones de claves naturales.
+--
+-- Los índices únicos de las tablas de hechos incluyen (INCLUDE) las métricas que leen los KPIs,
+-- de modo que las consultas pueden resolverse con un index-only scan, sin visitar la tabla.
+
+
+-- -- VERIFICACIÓN PREVIA --
+-- Una base cargada con el notebook anterior (inserciones sin claves únicas, re-ejecutables) puede
+-- tener filas repetidas. Antes de agregar las restricciones se buscan las claves duplicadas de todas
+-- las tablas y, si hay, la migración se cancela sin cambios informando cada tabla, cuántas claves
+-- se repiten y algunos ejemplos (ver "Duplicados de claves naturales" en el README).
+
+DO $$
+DECLARE
+    clave RECORD;
+    duplicadas BIGINT;
+    ejemplos TEXT;
+    reporte TEXT := '';
+BEGIN
+    FOR clave IN
+        SELECT * FROM (VALUES
+            ('periodos', 'anio, trimestre'),
+            ('penetracion_internet_hogares', 'id_provincia, id_periodo'),
+            ('penetracion_internet_poblacion', 'id_provincia, id_periodo'),
+            ('velocidad_media_provincia', 'id_provincia, id_periodo'),
+            ('accesos_velocidad_provincia', 'id_provincia, id_periodo'),
+            ('accesos_telefonia_movil', 'id_periodo'),
+            ('ingresos_servicios_internet', 'id_periodo'),
+            ('ingresos_telefonia_movil', 'id_periodo'),
+            ('penetracion_telefonia_movil', 'id_periodo'),
+            ('sms_salientes', 'id_periodo'),
+            ('llamadas_salientes', 'id_periodo'),
+            ('minutos_salientes', 'id_periodo')
+        ) AS claves (tabla, columnas)
+    LOOP
+        EXECUTE format(
+            'SELECT count(*) FROM (SELECT 1 FROM %I GROUP BY %s HAVING count(*) > 1) d',
+            clave.tabla, clave.columnas
+        ) INTO duplicadas;
+        IF duplicadas > 0 THEN
+            EXECUTE format(
+                'SELECT string_agg(valores, ''; '') FROM ('
+                '    SELECT concat_ws('', '', %s) || '' x'' || count(*) AS valores'
+                '    FROM %I GROUP BY %s HAVING count(*) > 1 ORDER BY count(*) DESC LIMIT 5'
+                ') d',
+                clave.columnas, clave.tabla, clave.columnas
+            ) INTO ejemplos;
+            reporte := reporte || format(E'\n  %s (%s): %s claves duplicadas, p. ej. %s',
+                                         clave.tabla, clave.columnas, duplicadas, ejemplos);
+        END IF;
+    END LOOP;
+
+    IF reporte <> '' THEN
+        RAISE EXCEPTION 'Migración 0001 cancelada: hay claves naturales duplicadas%', reporte
+            USING HINT = 'Eliminar los duplicados antes de aplicarla (README, "Duplicados de claves naturales").';
+    END IF;
+END
+$$;
+
+
+-- -- DIMENSIONES --
+
+ALTER TABLE periodos
+    ADD CONSTRAINT uq_periodos_anio_trimestre UNIQUE (anio, trimestre);
+
+-- Clave de búsqueda de localidades en la carga (etl/dimensiones.py) y join con provincias
+CREATE INDEX ix_localidades_provincia_partido_localidad
+    ON localidades (id_provincia, partido, localidad);
+
+
+-- -- HECHOS POR PROVINCIA Y PERIODO --
+
+ALTER TABLE penetracion_internet_hogares
+    ADD CONSTRAINT uq_penetracion_internet_hogares_provincia_periodo
+    UNIQUE (id_provincia, id_periodo) INCLUDE (accesos_por_100_hogares);
+
+-- Filtros por periodo (p. ej. anio >= 2024 en el mapa del KPI 1)
+CREATE INDEX ix_penetracion_internet_hogares_periodo
+    ON penetracion_internet_hogares (id_periodo) INCLUDE (id_provincia, accesos_por_100_hogares);
+
+ALTER TABLE penetracion_internet_poblacion
+    ADD CONSTRAINT uq_penetracion_internet_poblacion_provincia_periodo
+    UNIQUE (id_provincia, id_periodo) INCLUDE (accesos_por_100_hab);
+
+ALTER TABLE velocidad_media_provincia
+    ADD CONSTRAINT uq_velocidad_media_provincia_provincia_periodo
+    UNIQUE (id_provincia, id_periodo) INCLUDE (mbps_media_bajada);
+
+ALTER TABLE accesos_velocidad_provincia
+    ADD CONSTRAINT uq_accesos_velocidad_provincia_provincia_periodo
+    UNIQUE (id_provincia, id_periodo);
+
+
+-- -- HECHOS NACIONALES POR PERIODO --
+
+ALTER TABLE accesos_telefonia_movil
+    ADD CONSTRAINT uq_accesos_telefonia_movil_periodo
+    UNIQUE (id_periodo) INCLUDE (total_accesos_pospago, total_accesos_prepago);
+
+ALTER TABLE ingresos_servicios_internet
+    ADD CONSTRAINT uq_ingresos_servicios_internet_periodo UNIQUE (id_periodo);
+
+ALTER TABLE ingresos_telefonia_movil
+    ADD CONSTRAINT uq_ingresos_telefonia_movil_periodo UNIQUE (id_periodo);
+
+ALTER TABLE penetracion_telefonia_movil
+    ADD CONSTRAINT uq_penetracion_telefonia_movil_periodo UNIQUE (id_periodo);
+
+ALTER TABLE sms_salientes
+    ADD CONSTRAINT uq_sms_salientes_periodo UNIQUE (id_periodo);
+
+ALTER TABLE llamadas_salientes
+    ADD CONSTRAINT uq_llamadas_salientes_periodo UNIQUE (id_periodo);
+
+ALTER TABLE minutos_salientes
+    ADD CONSTRAINT uq_minutos_salientes_periodo UNIQUE (id_periodo);
+
+
+-- -- HECHOS POR LOCALIDAD --
+
+CREATE INDEX ix_mapa_conectividad_localidad
+    ON mapa_conectividad (id_localidad);
+
+-- Cobertura del KPI 2: solo las localidades con fibra óptica o wireless
+CREATE INDEX ix_mapa_conectividad_fibra_wireless
+    ON mapa_conectividad (id_localidad) INCLUDE (fibra_optica, wireless, poblacion)
+    WHERE fibra_optica = TRUE OR wireless = TRUE;
+
+CREATE INDEX ix_tecnologias_acceso_localidad
+    ON tecnologias_acceso (id_localidad);
+
+CREATE INDEX ix_accesos_por_velocidad_localidades_localidad
+    ON accesos_por_velocidad_localidades (id_localidad);
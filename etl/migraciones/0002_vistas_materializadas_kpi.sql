@@ -0,0 +1,83 @@
+-- Migración 0002: vistas materializadas con los agregados por provincia y periodo de cada KPI.
+--
+-- Los dashboards leen estas vistas en lugar de agregar en cada consulta (o en pandas) las tablas
+-- de hechos completas. El ETL las refresca con REFRESH MATERIALIZED VIEW CONCURRENTLY después de
+-- cada carga (etl/vistas.py), lo que requiere un índice único en cada vista.
+
+
+-- -- KPI 1: penetración de internet por provincia y periodo --
+
+CREATE MATERIALIZED VIEW mv_penetracion_provincia_periodo AS
+SELECT
+    ph.id_provincia,
+    p.nombre_provincia,
+    ph.id_periodo,
+    pe.anio,
+    pe.trimestre,
+    AVG(ph.accesos_por_100_hogares) AS accesos_por_100_hogares
+FROM
+    penetracion_internet_hogares ph
+JOIN
+    provincias p ON ph.id_provincia = p.id_provincia
+JOIN
+    periodos pe ON ph.id_periodo = pe.id_periodo
+GROUP BY
+    ph.id_provincia, p.nombre_provincia, ph.id_periodo, pe.anio, pe.trimestre;
+
+CREATE UNIQUE INDEX uq_mv_penetracion_provincia_periodo
+    ON mv_penetracion_provincia_periodo (id_provincia, id_periodo);
+
+-- Filtros por año (p. ej. anio >= 2024 en el mapa)
+CREATE INDEX ix_mv_penetracion_provincia_periodo_anio
+    ON mv_penetracion_provincia_periodo (anio) INCLUDE (nombre_provincia, accesos_por_100_hogares);
+
+
+-- -- KPI 2: cobertura de fibra óptica y wireless por provincia --
+-- Misma población que la consulta por localidad: solo localidades con fibra óptica o wireless.
+
+CREATE MATERIALIZED VIEW mv_cobertura_provincia AS
+SELECT
+    p.id_provincia,
+    p.nombre_provincia,
+    COUNT(*) AS total_localidades,
+    COUNT(*) FILTER (WHERE mc.fibra_optica) AS localidades_fibra,
+    COUNT(*) FILTER (WHERE mc.wireless) AS localidades_wireless,
+    SUM(mc.poblacion) AS poblacion,
+    SUM(mc.poblacion) FILTER (WHERE mc.fibra_optica) AS poblacion_fibra
+FROM
+    mapa_conectividad mc
+JOIN
+    localidades l ON mc.id_localidad = l.id_localidad
+JOIN
+    provincias p ON l.id_provincia = p.id_provincia
+WHERE
+    mc.fibra_optica = TRUE OR mc.wireless = TRUE
+GROUP BY
+    p.id_provincia, p.nombre_provincia;
+
+CREATE UNIQUE INDEX uq_mv_cobertura_provincia
+    ON mv_cobertura_provincia (id_provincia);
+
+
+-- -- KPI 3: accesos de telefonía móvil por periodo --
+
+CREATE MATERIALIZED VIEW mv_accesos_movil_periodo AS
+SELECT
+    atm.id_periodo,
+    pe.anio,
+    pe.trimestre,
+    SUM(atm.total_accesos_pospago) AS total_accesos_pospago,
+    SUM(atm.total_accesos_prepago) AS total_accesos_prepago,
+    SUM(atm.total_accesos_operativos) AS total_accesos_operativos
+FROM
+    accesos_telefonia_movil atm
+JOIN
+    periodos pe ON atm.id_periodo = pe.id_periodo
+GROUP BY
+    atm.id_periodo, pe.anio, pe.trimestre;
+
+CREATE UNIQUE INDEX uq_mv_accesos_movil_periodo
+    ON mv_accesos_movil_periodo (id_periodo);
+
+CREATE INDEX ix_mv_accesos_movil_periodo_anio_trimestre
+    ON mv_accesos_movil_periodo (anio, trimestre) INCLUDE (total_accesos_pospago, total_accesos_prepago);
@@ -0,0 +1,86 @@
+"""
+Migraciones versionadas del esquema 'telecomunicaciones'.
+
+Cada archivo NNNN_descripcion.sql de esta carpeta es una migración; se aplican en orden,
+cada una en su propia transacción, y las versiones aplicadas se registran en la tabla
+schema_migraciones para no repetirlas.
+"""
+import re
+import time
+from pathlib import Path
+
+from psycopg2 import sql
+
+DIRECTORIO_MIGRACIONES = Path(__file__).resolve().parent
+TABLA_VERSIONES = "schema_migraciones"
+PATRON_ARCHIVO = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+
+def migraciones_disponibles(directorio=None):
+    """
+    Retorna las migraciones de la carpeta, ordenadas por versión.
+
+    Retorno:
+    - list de dict con 'version' (int), 'nombre' y 'ruta'.
+    """
+    directorio = Path(directorio or DIRECTORIO_MIGRACIONES)
+    migraciones = []
+    for ruta in sorted(directorio.glob("*.sql")):
+        coincidencia = PATRON_ARCHIVO.match(ruta.name)
+        if coincidencia:
+            migraciones.append({'version': int(coincidencia.group(1)), 'nombre': coincidencia.group(2), 'ruta': ruta})
+    return migraciones
+
+
+def versiones_aplicadas(conn):
+    """ Retorna el conjunto de versiones ya aplicadas, creando la tabla de registro si no existe """
+    with conn.cursor() as cursor:
+        cursor.execute(sql.SQL("""
+            CREATE TABLE IF NOT EXISTS {} (
+                version INT PRIMARY KEY,
+                nombre VARCHAR(200) NOT NULL,
+                aplicada_en TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+        """).format(sql.Identifier(TABLA_VERSIONES)))
+        cursor.execute(sql.SQL("SELECT version FROM {}").format(sql.Identifier(TABLA_VERSIONES)))
+        versiones = {fila[0] for fila in cursor.fetchall()}
+    conn.commit()
+    return versiones
+
+
+def aplicar_migraciones(conn, hasta=None, directorio=None):
+    """
+    Aplica en orden las migraciones pendientes, cada una en una transacción junto con su registro.
+    Si una migración falla se deshace por completo y no se aplican las siguientes.
+
+    Parámetros:
+    - conn: Conexión psycopg2.
+    - hasta (int, opcional): Última versión a aplicar; por defecto todas.
+    - directorio (str | Path, opcional): Carpeta de migraciones; por defecto la de este paquete.
+
+    Retorno:
+    - list de dict con 'version', 'nombre' y 'segundos' de cada migración aplicada.
+    """
+    aplicadas = versiones_aplicadas(conn)
+    resultados = []
+    for migracion in migraciones_disponibles(directorio):
+        if migracion['version'] in aplicadas or (hasta is not None and migracion['version'] > hasta):
+            continue
+        inicio = time.perf_counter()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(migracion['ruta'].read_text(encoding="utf-8"))
+                cursor.execute(
+                    sql.SQL("INSERT INTO {} (version, nombre) VALUES (%s, %s)").format(sql.Identifier(TABLA_VERSIONES)),
+                    (migracion['version'], migracion['nombre'])
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        resultados.append({
+            'version': migracion['version'],
+            'nombre': migracion['nombre'],
+            'segundos': time.perf_counter() - inicio
+        })
+    return resultados
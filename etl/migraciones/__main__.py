@@ -0,0 +1,47 @@
+import argparse
+import sys
+
+from etl.carga_masiva import analizar_tablas
+from etl.migraciones import aplicar_migraciones
+from etl.migraciones.verificacion import verificar_indices
+from telecom_core.pool import conexion
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m etl.migraciones",
+        description="Aplica las migraciones pendientes del esquema, actualiza las estadísticas y "
+                    "verifica con EXPLAIN que las consultas de los KPIs usan los índices."
+    )
+    parser.add_argument("--hasta", type=int, default=None,
+                        help="Última versión a aplicar (por defecto todas)")
+    parser.add_argument("--solo-verificar", action="store_true",
+                        help="No aplicar migraciones; solo ejecutar ANALYZE y la verificación de planes")
+    parser.add_argument("--forzar-indices", action="store_true",
+                        help="Desactivar los recorridos secuenciales durante el EXPLAIN (prueba que los índices "
+                             "pueden resolver las consultas, no que el planificador los elija)")
+    args = parser.parse_args()
+
+    with conexion() as conn:
+        if not args.solo_verificar:
+            aplicadas = aplicar_migraciones(conn, hasta=args.hasta)
+            for migracion in aplicadas:
+                print(f"Migración {migracion['version']:04d} ({migracion['nombre']}) aplicada en {migracion['segundos']:.2f} s")
+            if not aplicadas:
+                print("El esquema está al día")
+
+        # Los planes se verifican con las estadísticas recién actualizadas
+        analizar_tablas(conn)
+
+        resultados = verificar_indices(conn, forzar_indices=args.forzar_indices)
+        for nombre, resultado in resultados.items():
+            accesos = ', '.join(f"{tabla}: {'/'.join(sorted(indices))}" for tabla, indices in sorted(resultado['accesos'].items()))
+            chicas = f" (tabla chica: {', '.join(resultado['tablas_chicas'])})" if resultado['tablas_chicas'] else ""
+            print(f"{'OK   ' if resultado['ok'] else 'FALLA'} {nombre:<32} {accesos}{chicas}")
+
+    if not all(resultado['ok'] for resultado in resultados.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
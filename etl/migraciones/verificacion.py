@@ -0,0 +1,163 @@
+import json
+
+from telecom_core.consultas import CONSULTAS_KPI
+
+# Búsquedas por clave foránea sobre las tablas de hechos y dimensiones (índices de la migración 0001):
+# nombre -> (query, params)
+CONSULTAS_CLAVES_FORANEAS = {
+    'penetracion_hogares_periodo': (
+        "SELECT id_provincia, accesos_por_100_hogares FROM penetracion_internet_hogares WHERE id_periodo = %s", (1,)
+    ),
+    'penetracion_hogares_provincia': (
+        "SELECT id_periodo, accesos_por_100_hogares FROM penetracion_internet_hogares WHERE id_provincia = %s", (1,)
+    ),
+    'accesos_movil_periodo': (
+        "SELECT total_accesos_pospago, total_accesos_prepago FROM accesos_telefonia_movil WHERE id_periodo = %s", (1,)
+    ),
+    'localidades_provincia': (
+        "SELECT id_localidad, partido, localidad FROM localidades WHERE id_provincia = %s", (1,)
+    ),
+    'mapa_conectividad_localidad': (
+        "SELECT poblacion, fibra_optica, wireless FROM mapa_conectividad WHERE id_localidad = %s", (1,)
+    ),
+    'tecnologias_acceso_localidad': (
+        "SELECT * FROM tecnologias_acceso WHERE id_localidad = %s", (1,)
+    ),
+    'accesos_por_velocidad_localidad': (
+        "SELECT velocidad_mbps, cantidad_accesos FROM accesos_por_velocidad_localidades WHERE id_localidad = %s", (1,)
+    ),
+}
+
+# Vista o tabla de cada consulta -> índices que deben poder resolverla
+INDICES_ESPERADOS = {
+    # Consultas de los dashboards sobre las vistas materializadas (migración 0002)
+    'penetracion_reciente': {
+        'mv_penetracion_provincia_periodo': {'ix_mv_penetracion_provincia_periodo_anio'},
+    },
+    'penetracion_mapa': {
+        'mv_penetracion_provincia_periodo': {'ix_mv_penetracion_provincia_periodo_anio'},
+    },
+    'cobertura_provincia': {
+        'mv_cobertura_provincia': {'uq_mv_cobertura_provincia'},
+    },
+    'accesos_movil_reciente': {
+        'mv_accesos_movil_periodo': {'ix_mv_accesos_movil_periodo_anio_trimestre'},
+    },
+    'accesos_movil_anual': {
+        'mv_accesos_movil_periodo': {'ix_mv_accesos_movil_periodo_anio_trimestre'},
+    },
+    # Claves foráneas id_periodo, id_provincia e id_localidad (migración 0001)
+    'penetracion_hogares_periodo': {
+        'penetracion_internet_hogares': {'ix_penetracion_internet_hogares_periodo'},
+    },
+    'penetracion_hogares_provincia': {
+        'penetracion_internet_hogares': {'uq_penetracion_internet_hogares_provincia_periodo'},
+    },
+    'accesos_movil_periodo': {
+        'accesos_telefonia_movil': {'uq_accesos_telefonia_movil_periodo'},
+    },
+    'localidades_provincia': {
+        'localidades': {'ix_localidades_provincia_partido_localidad'},
+    },
+    'mapa_conectividad_localidad': {
+        'mapa_conectividad': {'ix_mapa_conectividad_localidad'},
+    },
+    'tecnologias_acceso_localidad': {
+        'tecnologias_acceso': {'ix_tecnologias_acceso_localidad'},
+    },
+    'accesos_por_velocidad_localidad': {
+        'accesos_por_velocidad_localidades': {'ix_accesos_por_velocidad_localidades_localidad'},
+    },
+}
+
+# Páginas (8 KB) hasta las que leer la tabla completa es más barato que un índice: sin forzar los
+# índices, un Seq Scan sobre una tabla de este tamaño es la elección correcta del planificador
+PAGINAS_TABLA_CHICA = 8
+
+
+def _recorrer_plan(nodo, accesos, tabla_padre=None):
+    """ Acumula, por tabla, los índices (o 'Seq Scan') con que el plan accede a cada una """
+    # Los Bitmap Index Scan no informan la tabla: es la del Bitmap Heap Scan que los contiene
+    tabla = nodo.get('Relation Name', tabla_padre if 'Index Name' in nodo else None)
+    if tabla is not None:
+        accesos.setdefault(tabla, set()).add(nodo.get('Index Name', nodo['Node Type']))
+    for hijo in nodo.get('Plans', []):
+        _recorrer_plan(hijo, accesos, nodo.get('Relation Name', tabla_padre))
+    return accesos
+
+
+def plan_consulta(conn, query, params=None, forzar_indices=False):
+    """
+    Ejecuta EXPLAIN sobre una consulta y retorna cómo accede a cada tabla.
+
+    Parámetros:
+    - conn: Conexión psycopg2.
+    - query (str): Consulta a analizar (no se ejecuta).
+    - params (tuple, opcional): Parámetros de la consulta.
+    - forzar_indices (bool): Desactivar los recorridos secuenciales durante el EXPLAIN. Solo prueba que
+                             los índices pueden resolver la consulta, no que el planificador los elija;
+                             por defecto se verifica el plan real.
+
+    Retorno:
+    - dict tabla -> conjunto de índices usados ('Seq Scan' si se lee la tabla completa).
+    """
+    try:
+        with conn.cursor() as cursor:
+            if forzar_indices:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("EXPLAIN (FORMAT JSON) " + query.strip().rstrip(';'), params)
+            plan = cursor.fetchone()[0]
+    finally:
+        # Descartar el SET LOCAL y no dejar la transacción abierta
+        conn.rollback()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return _recorrer_plan(plan[0]['Plan'], {})
+
+
+def _paginas(conn, tablas):
+    """ Retorna las páginas de cada tabla según pg_class (actualizado por ANALYZE) """
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT relname, relpages FROM pg_class WHERE relname = ANY(%s)", (list(tablas),))
+            return dict(cursor.fetchall())
+    finally:
+        conn.rollback()
+
+
+def verificar_indices(conn, forzar_indices=False, consultas=None):
+    """
+    Verifica con EXPLAIN que cada consulta accede a su vista o tabla por alguno de los índices
+    esperados (INDICES_ESPERADOS). Ejecutar después de ANALYZE, para que los planes reflejen los datos.
+
+    Sin forzar los índices se verifican los planes que elige el planificador; un Seq Scan sobre una
+    tabla de hasta PAGINAS_TABLA_CHICA páginas se acepta y se informa en 'tablas_chicas'.
+
+    Parámetros:
+    - conn: Conexión psycopg2.
+    - forzar_indices (bool): Ver plan_consulta.
+    - consultas (dict, opcional): Nombre -> (query, params); por defecto CONSULTAS_KPI y
+                                  CONSULTAS_CLAVES_FORANEAS.
+
+    Retorno:
+    - dict nombre -> {'accesos': dict tabla -> índices usados, 'tablas_chicas': list, 'ok': bool}.
+    """
+    consultas = consultas or {**CONSULTAS_KPI, **CONSULTAS_CLAVES_FORANEAS}
+    paginas = {} if forzar_indices else _paginas(
+        conn, {tabla for nombre in consultas for tabla in INDICES_ESPERADOS.get(nombre, {})}
+    )
+    resultados = {}
+    for nombre, (query, params) in consultas.items():
+        accesos = plan_consulta(conn, query, params, forzar_indices=forzar_indices)
+        esperados = INDICES_ESPERADOS.get(nombre, {})
+        faltantes = [tabla for tabla, indices in esperados.items() if not accesos.get(tabla, set()) & indices]
+        tablas_chicas = [
+            tabla for tabla in faltantes
+            if 'Seq Scan' in accesos.get(tabla, set()) and paginas.get(tabla, 0) <= PAGINAS_TABLA_CHICA
+        ]
+        resultados[nombre] = {
+            'accesos': accesos,
+            'tablas_chicas': tablas_chicas,
+            'ok': len(tablas_chicas) == len(faltantes),
+        }
+    return resultados
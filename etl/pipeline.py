@@ -0,0 +1,211 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+
+from etl.huellas import guardar_huellas, huella_archivo, huella_dataframe, huella_hoja_xlsx, leer_huellas
+
+
+# -- LIMPIEZA (mismas reglas que los notebooks ETL_*) --
+
+def limpiar_accesos_tecnologia(df):
+    """ Elimina filas con valores nulos en las columnas de texto """
+    return df.dropna(subset=['Provincia', 'Partido', 'Localidad', 'Link Indec'])
+
+
+def limpiar_accesos_velocidad(df):
+    """ Elimina las filas con valores nulos en la columna 'OTROS' """
+    return df.dropna(subset=['OTROS'])
+
+
+def limpiar_ingresos_internet(df):
+    """ Corrige el error en el año "2033" reemplazándolo por "2023" """
+    return df.assign(**{'Año': df['Año'].replace(2033, 2023)})
+
+
+def limpiar_mapa_conectividad(df):
+    """ Reemplaza los valores nulos en la columna 'Link' por 0 """
+    return df.assign(Link=df['Link'].fillna(0))
+
+
+# -- HOJAS A PROCESAR --
+
+# Archivo fuente y carpeta de salida de cada dataset
+FUENTES = {
+    'internet': {'archivo': 'Internet.xlsx', 'carpeta': 'Internet_processed'},
+    'telefonia': {'archivo': 'Telefonia_movil.xlsx', 'carpeta': 'Telefonia_processed'},
+    'conectividad': {'archivo': 'mapa_conectividad.xlsx', 'carpeta': 'Mapa_conectividad_processed'},
+}
+
+# Cada hoja es independiente: se leen y limpian en paralelo. 'tabla' es la tabla que se recarga
+# en la base de datos cuando la hoja cambia.
+HOJAS = [
+    {'fuente': 'internet', 'hoja': 'Acc_vel_loc_sinrangos', 'salida': 'accesos_velocidad_localidad', 'tabla': 'accesos_por_velocidad_localidades', 'limpieza': None},
+    {'fuente': 'internet', 'hoja': 'Accesos_tecnologia_localidad', 'salida': 'accesos_tecnologia_localidad', 'tabla': 'tecnologias_acceso', 'limpieza': limpiar_accesos_tecnologia},
+    {'fuente': 'internet', 'hoja': 'Accesos por velocidad', 'salida': 'accesos_por_velocidad', 'tabla': 'accesos_velocidad_provincia', 'limpieza': limpiar_accesos_velocidad},
+    {'fuente': 'internet', 'hoja': 'Penetración-poblacion', 'salida': 'penetracion_internet_poblacion', 'tabla': 'penetracion_internet_poblacion', 'limpieza': None},
+    {'fuente': 'internet', 'hoja': 'Penetracion-hogares', 'salida': 'penetracion_internet_hogares', 'tabla': 'penetracion_internet_hogares', 'limpieza': None},
+    {'fuente': 'internet', 'hoja': 'Ingresos ', 'salida': 'ingresos_servicios_internet', 'tabla': 'ingresos_servicios_internet', 'limpieza': limpiar_ingresos_internet},
+    {'fuente': 'internet', 'hoja': 'Velocidad % por prov', 'salida': 'velocidad_media_provincia', 'tabla': 'velocidad_media_provincia', 'limpieza': None},
+    {'fuente': 'telefonia', 'hoja': 'SMS', 'salida': 'sms_salientes', 'tabla': 'sms_salientes', 'limpieza': None},
+    {'fuente': 'telefonia', 'hoja': 'Llamadas salientes', 'salida': 'llamadas_salientes', 'tabla': 'llamadas_salientes', 'limpieza': None},
+    {'fuente': 'telefonia', 'hoja': 'Minutos salientes', 'salida': 'minutos_salientes', 'tabla': 'minutos_salientes', 'limpieza': None},
+    {'fuente': 'telefonia', 'hoja': 'Ingresos', 'salida': 'ingresos_telefonia_movil', 'tabla': 'ingresos_telefonia_movil', 'limpieza': None},
+    {'fuente': 'telefonia', 'hoja': 'Penetracion', 'salida': 'penetracion_telefonia_movil', 'tabla': 'penetracion_telefonia_movil', 'limpieza': None},
+    {'fuente': 'telefonia', 'hoja': 'Accesos', 'salida': 'accesos_telefonia_movil', 'tabla': 'accesos_telefonia_movil', 'limpieza': None},
+    {'fuente': 'conectividad', 'hoja': 0, 'salida': 'mapa_conectividad', 'tabla': 'mapa_conectividad', 'limpieza': limpiar_mapa_conectividad},
+]
+
+
+def _archivos_salida(hoja, directorio_salida, formatos):
+    carpeta = Path(directorio_salida) / FUENTES[hoja['fuente']]['carpeta']
+    return {formato: carpeta / f"{hoja['salida']}.{formato}" for formato in formatos}
+
+
+def procesar_hoja(hoja, directorio_origen, directorio_salida, formatos=('csv',), huella_anterior=None, huella_fuente=None):
+    """
+    Lee una hoja de Excel, aplica su limpieza y exporta el resultado, salvo que no haya cambiado.
+
+    La hoja se omite sin parsear si su XML y los textos compartidos del libro coinciden con la
+    ejecución anterior; si difieren, se parsea y se omite la exportación cuando el contenido
+    resultante es idéntico al anterior.
+
+    Parámetros:
+    - hoja (dict): Definición de la hoja (ver HOJAS).
+    - directorio_origen (str | Path): Carpeta con los archivos Excel originales.
+    - directorio_salida (str | Path): Carpeta raíz de los datasets procesados.
+    - formatos (tuple): Formatos de salida, 'csv' y/o 'parquet'.
+    - huella_anterior (dict, opcional): Huella de la hoja en la ejecución anterior.
+    - huella_fuente (str, opcional): Huella del archivo Excel en esta ejecución.
+
+    Retorno:
+    - dict con la salida, la tabla, el estado ('procesada', 'sin_cambios_hoja' o
+      'sin_cambios_contenido'), la cantidad de filas, los archivos escritos, la huella y los segundos.
+    """
+    inicio = time.perf_counter()
+    ruta = Path(directorio_origen) / FUENTES[hoja['fuente']]['archivo']
+    archivos = _archivos_salida(hoja, directorio_salida, formatos)
+    salidas_existen = all(archivo.exists() for archivo in archivos.values())
+    anterior = huella_anterior or {}
+
+    huella = {'archivo': huella_fuente, **huella_hoja_xlsx(ruta, hoja['hoja'])}
+    resultado = {'salida': hoja['salida'], 'tabla': hoja['tabla'], 'archivos': [], 'huella': huella}
+
+    if salidas_existen and anterior.get('xml') == huella['xml'] and anterior.get('textos') == huella['textos']:
+        huella['contenido'] = anterior.get('contenido')
+        huella['filas'] = anterior.get('filas')
+        return {**resultado, 'estado': 'sin_cambios_hoja', 'filas': anterior.get('filas'),
+                'segundos': time.perf_counter() - inicio}
+
+    df = pd.read_excel(ruta, sheet_name=hoja['hoja'], engine='openpyxl')
+    if hoja['limpieza'] is not None:
+        df = hoja['limpieza'](df)
+    huella['contenido'] = huella_dataframe(df)
+    huella['filas'] = len(df)
+
+    if salidas_existen and anterior.get('contenido') == huella['contenido']:
+        return {**resultado, 'estado': 'sin_cambios_contenido', 'filas': len(df),
+                'segundos': time.perf_counter() - inicio}
+
+    carpeta = Path(directorio_salida) / FUENTES[hoja['fuente']]['carpeta']
+    carpeta.mkdir(parents=True, exist_ok=True)
+    if 'csv' in archivos:
+        df.to_csv(archivos['csv'], index=False)
+    if 'parquet' in archivos:
+        df.to_parquet(archivos['parquet'], index=False)
+
+    return {
+        **resultado,
+        'estado': 'procesada',
+        'filas': len(df),
+        'archivos': [str(archivo) for archivo in archivos.values()],
+        'segundos': time.perf_counter() - inicio
+    }
+
+
+def ejecutar_pipeline(directorio_origen, directorio_salida, formatos=('csv',), hojas=None, max_workers=None, forzar=False):
+    """
+    Procesa en un pool de procesos las hojas cuyo origen cambió desde la última ejecución.
+
+    Primero se compara la huella de cada archivo Excel: si no cambió (y las salidas existen),
+    sus hojas se omiten sin abrir el libro. El resto se compara hoja por hoja en procesar_hoja.
+
+    Parámetros:
+    - directorio_origen (str | Path): Carpeta con Internet.xlsx, Telefonia_movil.xlsx y mapa_conectividad.xlsx.
+    - directorio_salida (str | Path): Carpeta raíz de los datasets procesados.
+    - formatos (tuple): Formatos de salida, 'csv' y/o 'parquet'.
+    - hojas (list, opcional): Hojas a procesar; por defecto todas las de HOJAS.
+    - max_workers (int, opcional): Procesos en paralelo; por defecto uno por CPU.
+    - forzar (bool): Ignorar las huellas anteriores y reprocesar todo.
+
+    Retorno:
+    - list con el resultado de cada hoja, en el orden de HOJAS. El estado 'sin_cambios_archivo'
+      indica que la hoja se omitió porque su archivo Excel no cambió.
+    """
+    hojas = HOJAS if hojas is None else hojas
+    formatos = tuple(formatos)
+    previas = {} if forzar else leer_huellas(directorio_salida).get('hojas', {})
+
+    huellas_fuentes = {
+        fuente: huella_archivo(Path(directorio_origen) / FUENTES[fuente]['archivo'])
+        for fuente in {hoja['fuente'] for hoja in hojas}
+    }
+
+    resultados = {}
+    pendientes = []
+    for hoja in hojas:
+        anterior = previas.get(hoja['salida'])
+        salidas_existen = all(archivo.exists() for archivo in _archivos_salida(hoja, directorio_salida, formatos).values())
+        if anterior and salidas_existen and anterior.get('archivo') == huellas_fuentes[hoja['fuente']]:
+            resultados[hoja['salida']] = {
+                'salida': hoja['salida'], 'tabla': hoja['tabla'], 'estado': 'sin_cambios_archivo',
+                'filas': anterior.get('filas'), 'archivos': [], 'huella': anterior, 'segundos': 0.0
+            }
+        else:
+            pendientes.append(hoja)
+
+    if pendientes:
+        max_workers = max_workers or min(len(pendientes), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futuros = {
+                executor.submit(
+                    procesar_hoja, hoja, directorio_origen, directorio_salida, formatos,
+                    previas.get(hoja['salida']), huellas_fuentes[hoja['fuente']]
+                ): hoja['salida']
+                for hoja in pendientes
+            }
+            for futuro in as_completed(futuros):
+                resultados[futuros[futuro]] = futuro.result()
+
+    # Guardar las huellas conservando las de hojas que no participaron de esta ejecución
+    huellas = leer_huellas(directorio_salida)
+    huellas.setdefault('hojas', {}).update({salida: resultado['huella'] for salida, resultado in resultados.items()})
+    huellas['archivos'] = {**huellas.get('archivos', {}), **{FUENTES[f]['archivo']: h for f, h in huellas_fuentes.items()}}
+    guardar_huellas(directorio_salida, huellas)
+
+    return [resultados[hoja['salida']] for hoja in hojas]
+
+
+def tablas_afectadas(resultados):
+    """ Retorna las tablas que deben recargarse porque su hoja se procesó en esta ejecución """
+    return [resultado['tabla'] for resultado in resultados if resultado['estado'] == 'procesada']
+
+
+def imprimir_reporte(resultados):
+    """ Muestra qué hojas se procesaron y cuáles se omitieron, y por qué """
+    motivos = {
+        'procesada': 'procesada',
+        'sin_cambios_archivo': 'omitida (archivo sin cambios)',
+        'sin_cambios_hoja': 'omitida (hoja sin cambios)',
+        'sin_cambios_contenido': 'omitida (contenido idéntico)',
+    }
+    for resultado in resultados:
+        filas = resultado['filas'] if resultado['filas'] is not None else '-'
+        print(f"{resultado['salida']:<32} {motivos[resultado['estado']]:<32} {filas:>8} filas  {resultado['segundos']:.2f} s")
+
+    omitidas = sum(resultado['estado'] != 'procesada' for resultado in resultados)
+    print(f"{len(resultados) - omitidas} hojas procesadas, {omitidas} omitidas")
+    afectadas = tablas_afectadas(resultados)
+    print(f"Tablas a recargar: {', '.join(afectadas) if afectadas else 'ninguna'}")
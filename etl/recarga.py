@@ -0,0 +1,213 @@
+"""
+Recarga en PostgreSQL de las tablas cuyas hojas procesó el pipeline.
+
+Cada tabla se arma desde su dataset procesado con las mismas transformaciones que la ingesta de
+Notebooks/DB_Create.ipynb (claves foráneas con CacheDimensiones y nombres de columna de la tabla)
+y se recarga completa (TRUNCATE y COPY en una transacción) con cargar_tablas, que al terminar
+refresca las vistas, ejecuta ANALYZE e invalida el cache de los dashboards.
+"""
+import pandas as pd
+
+from etl.carga_masiva import cargar_tablas
+from etl.dimensiones import CacheDimensiones
+from etl.pipeline import tablas_afectadas
+
+# Dimensión -> columna de id que agrega CacheDimensiones
+IDS_DIMENSIONES = {'localidades': 'id_localidad', 'provincias': 'id_provincia', 'periodos': 'id_periodo'}
+
+
+# -- TABLAS CON TRANSFORMACIONES PROPIAS --
+
+def _preparar_accesos_velocidad_localidad(df, dimensiones):
+    """ Una fila por localidad y velocidad, solo con cantidades no nulas y mayores a 0 """
+    columnas_velocidad = [col for col in df.columns if 'Mbps' in col]
+    df = df[['Provincia', 'Partido', 'Localidad', 'Link Indec'] + columnas_velocidad].drop_duplicates()
+    df = dimensiones.resolver_localidades(df).dropna(subset=['id_localidad'])
+
+    df_carga = df.melt(
+        id_vars=['id_localidad'], value_vars=columnas_velocidad,
+        var_name='velocidad', value_name='cantidad_accesos', ignore_index=False
+    ).sort_index(kind='stable')
+    df_carga = df_carga[df_carga['cantidad_accesos'] > 0]
+    df_carga = df_carga.assign(
+        velocidad_mbps=df_carga['velocidad'].str.replace(' Mbps', '').str.replace(',', '.').astype(float),
+        cantidad_accesos=df_carga['cantidad_accesos'].astype('int64')
+    )
+    return df_carga[['id_localidad', 'velocidad_mbps', 'cantidad_accesos']]
+
+
+# Columnas "SI" / "--" del mapa de conectividad -> columna booleana de la tabla
+COLUMNAS_BOOLEANAS_MAPA = {
+    'ADSL': 'adsl', 'Cablemódem': 'cablemodem', 'Dial Up': 'dial_up', 'Fibra óptica': 'fibra_optica',
+    'Satelital': 'satelital', 'Wireless': 'wireless', 'Telefonía Fija': 'telefonia_fija',
+    '3G': 'cobertura_3g', '4G': 'cobertura_4g'
+}
+
+
+def _preparar_mapa_conectividad(df, dimensiones):
+    """ Resuelve id_localidad (creando las localidades nuevas) y convierte "SI" y "--" a booleanos """
+    df_carga = dimensiones.resolver_localidades(df, crear=True, atributos={
+        'Link': 'link_indec', 'Latitud': 'latitud', 'Longitud': 'longitud'
+    }).dropna(subset=['id_localidad'])
+
+    # Cualquier valor distinto de "SI" y "--" queda como NULL
+    df_carga = df_carga.assign(**{
+        destino: df_carga[origen].map({'SI': True, '--': False}).astype('boolean')
+        for origen, destino in COLUMNAS_BOOLEANAS_MAPA.items()
+    })
+    df_carga = df_carga.rename(columns={'Población': 'poblacion', 'Link': 'link_indec', 'Latitud': 'latitud', 'Longitud': 'longitud'})
+    return df_carga[['id_localidad', 'poblacion', *COLUMNAS_BOOLEANAS_MAPA.values(), 'link_indec', 'latitud', 'longitud']]
+
+
+# -- DEFINICIÓN DE LAS RECARGAS --
+
+# Tabla -> 'claves': dimensiones a resolver, 'columnas': columna del dataset -> columna de la tabla;
+# o 'preparar': función (df, dimensiones) -> DataFrame listo para cargar.
+# Las tablas se preparan en este orden: mapa_conectividad va primero porque crea las localidades nuevas
+# (como la carga de 'localidades' del notebook antes de las tablas de hechos); las demás tablas por
+# localidad solo las resuelven y descartarían las filas de una localidad que aún no existe.
+RECARGAS = {
+    'mapa_conectividad': {'preparar': _preparar_mapa_conectividad},
+    'accesos_por_velocidad_localidades': {'preparar': _preparar_accesos_velocidad_localidad},
+    'tecnologias_acceso': {
+        'claves': ['localidades'],
+        'columnas': {
+            'ADSL': 'adsl', 'CABLEMODEM': 'cablemodem', 'DIAL UP': 'dial_up', 'FIBRA OPTICA': 'fibra_optica',
+            'OTROS': 'otros', 'SATELITAL': 'satelital', 'WIMAX': 'wimax', 'WIRELESS': 'wireless',
+            'Total general': 'total_general'
+        },
+    },
+    'accesos_velocidad_provincia': {
+        'claves': ['provincias', 'periodos'],
+        'columnas': {
+            'HASTA 512 kbps': 'hasta_512_kbps',
+            '+ 512 Kbps - 1 Mbps': 'entre_512_kbps_1_mbps',
+            '+ 1 Mbps - 6 Mbps': 'entre_1_mbps_6_mbps',
+            '+ 6 Mbps - 10 Mbps': 'entre_6_mbps_10_mbps',
+            '+ 10 Mbps - 20 Mbps': 'entre_10_mbps_20_mbps',
+            '+ 20 Mbps - 30 Mbps': 'entre_20_mbps_30_mbps',
+            '+ 30 Mbps': 'mas_de_30_mbps',
+            'OTROS': 'otros',
+            'Total': 'total_accesos'
+        },
+    },
+    'penetracion_internet_poblacion': {
+        'claves': ['provincias', 'periodos'],
+        'columnas': {'Accesos por cada 100 hab': 'accesos_por_100_hab'},
+    },
+    'penetracion_internet_hogares': {
+        'claves': ['provincias', 'periodos'],
+        'columnas': {'Accesos por cada 100 hogares': 'accesos_por_100_hogares'},
+    },
+    'ingresos_servicios_internet': {
+        'claves': ['periodos'],
+        'columnas': {'Ingresos (miles de pesos)': 'ingresos_miles_pesos'},
+    },
+    'velocidad_media_provincia': {
+        'claves': ['provincias', 'periodos'],
+        'columnas': {'Mbps (Media de bajada)': 'mbps_media_bajada'},
+    },
+    'sms_salientes': {
+        'claves': ['periodos'],
+        'columnas': {'Número de SMS salientes': 'numero_sms_salientes'},
+    },
+    'llamadas_salientes': {
+        'claves': ['periodos'],
+        'columnas': {
+            'Llamadas pospago salientes (miles)': 'llamadas_pospago_miles',
+            'Llamadas prepago salientes (miles)': 'llamadas_prepago_miles',
+            'Total de llamadas salientes (miles)': 'total_llamadas_salientes_miles'
+        },
+    },
+    'minutos_salientes': {
+        'claves': ['periodos'],
+        'columnas': {
+            'Minutos pospago salientes (miles)': 'minutos_pospago_miles',
+            'Minutos prepago salientes (miles)': 'minutos_prepago_miles',
+            'Total de minutos salientes (miles)': 'total_minutos_salientes_miles'
+        },
+    },
+    'ingresos_telefonia_movil': {
+        'claves': ['periodos'],
+        'columnas': {'Ingresos (miles de $)': 'ingresos_miles_pesos'},
+    },
+    'penetracion_telefonia_movil': {
+        'claves': ['periodos'],
+        'columnas': {'Accesos por cada 100 hab': 'accesos_por_100_hab'},
+    },
+    'accesos_telefonia_movil': {
+        'claves': ['periodos'],
+        'columnas': {
+            'Total de accesos pospago': 'total_accesos_pospago',
+            'Total de accesos prepago': 'total_accesos_prepago',
+            'Total de accesos operativos': 'total_accesos_operativos'
+        },
+    },
+}
+
+
+def preparar_tabla(tabla, df, dimensiones):
+    """
+    Arma el DataFrame a cargar en una tabla a partir de su dataset procesado.
+
+    Los periodos nuevos (p. ej. un trimestre recién publicado) se insertan en 'periodos' antes de
+    resolver las claves.
+
+    Parámetros:
+    - tabla (str): Tabla destino (ver RECARGAS).
+    - df (DataFrame): Dataset procesado por el pipeline.
+    - dimensiones (CacheDimensiones): Tablas de búsqueda de las dimensiones.
+
+    Retorno:
+    - DataFrame con las columnas de la tabla.
+    """
+    recarga = RECARGAS[tabla]
+    if 'preparar' in recarga:
+        return recarga['preparar'](df, dimensiones)
+
+    for dimension in recarga['claves']:
+        if dimension == 'periodos':
+            descripcion = 'Periodo' if 'Periodo' in df.columns else None
+            df = dimensiones.resolver_periodos(df, descripcion=descripcion, crear=True)
+        elif dimension == 'provincias':
+            df = dimensiones.resolver_provincias(df)
+        else:
+            df = dimensiones.resolver_localidades(df)
+
+    ids = [IDS_DIMENSIONES[dimension] for dimension in recarga['claves']]
+    df = df.dropna(subset=ids).rename(columns=recarga['columnas'])
+    return df[ids + list(recarga['columnas'].values())]
+
+
+def _leer_salida(archivos):
+    """ Lee el dataset procesado, prefiriendo el parquet (con tipos) si se exportó """
+    parquet = [archivo for archivo in archivos if archivo.endswith('.parquet')]
+    if parquet:
+        return pd.read_parquet(parquet[0])
+    return pd.read_csv(archivos[0])
+
+
+def recargar_tablas(conn, resultados, **opciones):
+    """
+    Recarga las tablas afectadas por una ejecución del pipeline (tablas_afectadas), preparándolas
+    en el orden de RECARGAS.
+
+    Parámetros:
+    - conn: Conexión psycopg2.
+    - resultados (list): Resultado de ejecutar_pipeline.
+    - **opciones: Argumentos adicionales para cargar_dataframe (metodo, tam_lote, ...).
+
+    Retorno:
+    - list con el resultado de cargar_dataframe para cada tabla (vacía si ninguna hoja cambió).
+    """
+    if not tablas_afectadas(resultados):
+        return []
+
+    # Preparar en el orden de RECARGAS: las localidades nuevas se crean antes de resolver las demás tablas
+    procesadas = {resultado['tabla']: resultado for resultado in resultados if resultado['estado'] == 'procesada'}
+    dimensiones = CacheDimensiones(conn)
+    cargas = {
+        tabla: preparar_tabla(tabla, _leer_salida(procesadas[tabla]['archivos']), dimensiones)
+        for tabla in RECARGAS if tabla in procesadas
+    }
+    return cargar_tablas(conn, cargas, truncar=True, **opciones)
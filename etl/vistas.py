@@ -0,0 +1,60 @@
+import time
+
+from psycopg2 import sql
+
+# Vista materializada (migración 0002) -> tablas de las que depende
+VISTAS_MATERIALIZADAS = {
+    'mv_penetracion_provincia_periodo': {'penetracion_internet_hogares', 'provincias', 'periodos'},
+    'mv_cobertura_provincia': {'mapa_conectividad', 'localidades', 'provincias'},
+    'mv_accesos_movil_periodo': {'accesos_telefonia_movil', 'periodos'},
+}
+
+
+def vistas_afectadas(tablas):
+    """ Retorna las vistas materializadas que dependen de alguna de las tablas dadas """
+    tablas = set(tablas)
+    return [vista for vista, dependencias in VISTAS_MATERIALIZADAS.items() if dependencias & tablas]
+
+
+def refrescar_vistas(conn, vistas=None, concurrente=True):
+    """
+    Refresca las vistas materializadas de los KPIs, cada una en su propia transacción.
+
+    Con concurrente=True se usa REFRESH ... CONCURRENTLY, que no bloquea las lecturas de los
+    dashboards mientras se recalcula la vista. Una vista que nunca se pobló se refresca de forma
+    normal, ya que CONCURRENTLY lo requiere. Las vistas que aún no existen (migración 0002 sin
+    aplicar) se omiten.
+
+    Parámetros:
+    - conn: Conexión psycopg2.
+    - vistas (list, opcional): Vistas a refrescar; por defecto todas las de VISTAS_MATERIALIZADAS.
+    - concurrente (bool): Usar REFRESH MATERIALIZED VIEW CONCURRENTLY.
+
+    Retorno:
+    - list de dict con 'vista', 'concurrente' y 'segundos' de cada vista refrescada.
+    """
+    vistas = list(VISTAS_MATERIALIZADAS) if vistas is None else list(vistas)
+    if not vistas:
+        return []
+
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT matviewname, ispopulated FROM pg_matviews WHERE matviewname = ANY(%s)", (vistas,))
+        pobladas = dict(cursor.fetchall())
+    conn.commit()
+
+    resultados = []
+    for vista in vistas:
+        if vista not in pobladas:
+            continue
+        usar_concurrente = concurrente and pobladas[vista]
+        comando = "REFRESH MATERIALIZED VIEW CONCURRENTLY {}" if usar_concurrente else "REFRESH MATERIALIZED VIEW {}"
+        inicio = time.perf_counter()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(sql.SQL(comando).format(sql.Identifier(vista)))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        resultados.append({'vista': vista, 'concurrente': usar_concurrente, 'segundos': time.perf_counter() - inicio})
+    return resultados
@@ -0,0 +1,12 @@
+"""
+Núcleo compartido de acceso a datos y transformaciones para los dashboards de Dash y Streamlit.
+
+Se instala con `pip install -e .` desde la raíz del repositorio. Ambos dashboards importan los
+cargadores de telecom_core.cargadores, de modo que cada proceso tiene un único pool de conexiones
+y un único cache, y los procesos del mismo host comparten la versión de los datos y el snapshot.
+"""
+from telecom_core.config import cargar_configuracion
+
+# Las credenciales y la configuración (TELECOM_*) deben estar en el entorno antes de que los
+# módulos del paquete las lean
+cargar_configuracion()
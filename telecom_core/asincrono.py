@@ -0,0 +1,57 @@
+"""
+Carga concurrente de varios datasets con asyncio.
+
+Cada cargador se ejecuta con asyncio.to_thread sobre el pool de conexiones compartido (psycopg2
+libera el GIL mientras espera a la base de datos), y asyncio.gather espera a todos: el tiempo
+total es el de la consulta más lenta y no la suma de todas. Se conservan el cache, los tipos
+compactos y el snapshot de cada cargador.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _normalizar(carga):
+    """ Acepta un cargador o una tupla (cargador, kwargs) """
+    if callable(carga):
+        return carga, {}
+    cargador, parametros = carga
+    return cargador, parametros or {}
+
+
+async def cargar_async(cargas):
+    """
+    Ejecuta concurrentemente los cargadores y espera todos los resultados.
+
+    Parámetros:
+    - cargas (dict): Nombre -> cargador, o nombre -> (cargador, kwargs).
+
+    Retorno:
+    - dict nombre -> resultado de cada cargador. Si alguno falla se propaga su excepción.
+    """
+    tareas = {}
+    for nombre, carga in cargas.items():
+        cargador, parametros = _normalizar(carga)
+        tareas[nombre] = asyncio.to_thread(cargador, **parametros)
+    resultados = await asyncio.gather(*tareas.values())
+    return dict(zip(tareas, resultados))
+
+
+def cargar_concurrente(cargas):
+    """
+    Envoltura sincrónica de cargar_async, para los callbacks y refrescos que no corren en un event loop.
+
+    Si se llama desde código que ya tiene un event loop corriendo, la carga se ejecuta en un loop
+    propio dentro de otro hilo.
+
+    Parámetros:
+    - cargas (dict): Ver cargar_async.
+
+    Retorno:
+    - dict nombre -> resultado de cada cargador.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(cargar_async(cargas))
+    with ThreadPoolExecutor(max_workers=1) as ejecutor:
+        return ejecutor.submit(asyncio.run, cargar_async(cargas)).result()
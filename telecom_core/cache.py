@@ -0,0 +1,173 @@
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+
+from telecom_core.pool import conexion
+from telecom_core.tipos import compactar
+
+# Archivo compartido por todos los procesos del host con la versión vigente de los datos.
+# El ETL lo actualiza tras cada recarga para que los dashboards descarten sus caches.
+ARCHIVO_VERSION = Path(os.getenv("TELECOM_ARCHIVO_VERSION", Path(tempfile.gettempdir()) / "telecom_version_datos"))
+
+
+def version_datos():
+    """
+    Retorna la versión vigente de los datos cargados en la base.
+
+    Retorno:
+    - str con la versión escrita por el ETL, o '0' si nunca se marcó una recarga.
+    """
+    try:
+        return ARCHIVO_VERSION.read_text().strip() or "0"
+    except OSError:
+        return "0"
+
+
+def _tamanio(valor):
+    """ Estima los bytes que ocupa un resultado en memoria """
+    if isinstance(valor, pd.DataFrame):
+        return int(valor.memory_usage(deep=True).sum())
+    if isinstance(valor, pd.Series):
+        return int(valor.memory_usage(deep=True))
+    return sys.getsizeof(valor)
+
+
+def clave_consulta(query, params=None, esquema=None):
+    """ Genera la clave de cache a partir del texto SQL (sin diferencias de espacios), sus parámetros y el esquema de tipos """
+    texto = " ".join(query.split())
+    return hashlib.sha256(f"{texto}|{params!r}|{esquema!r}".encode("utf-8")).hexdigest()
+
+
+class CacheConsultas:
+    """
+    Cache LRU de resultados de consultas con expiración por tiempo y límite de memoria.
+
+    Parámetros:
+    - ttl (float): Segundos de vigencia de cada resultado.
+    - max_entradas (int): Cantidad máxima de resultados guardados.
+    - max_bytes (int): Memoria máxima estimada de todos los resultados guardados.
+    """
+
+    def __init__(self, ttl=3600.0, max_entradas=128, max_bytes=256 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+
+        self._entradas = OrderedDict()
+        self._bytes = 0
+        self._version = version_datos()
+        self._lock = threading.Lock()
+        self._stats = {'aciertos': 0, 'fallos': 0, 'expirados': 0, 'desalojados': 0, 'invalidaciones': 0}
+
+    def _verificar_version(self):
+        """ Vacía el cache si el ETL publicó una nueva versión de los datos """
+        version = version_datos()
+        if version != self._version:
+            self._entradas.clear()
+            self._bytes = 0
+            self._version = version
+            self._stats['invalidaciones'] += 1
+
+    def _quitar(self, clave):
+        _, _, tamanio = self._entradas.pop(clave)
+        self._bytes -= tamanio
+
+    def obtener(self, clave):
+        """ Retorna el resultado guardado para la clave, o None si no existe o expiró """
+        with self._lock:
+            self._verificar_version()
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self._stats['fallos'] += 1
+                return None
+            valor, expira, _ = entrada
+            if time.monotonic() >= expira:
+                self._quitar(clave)
+                self._stats['expirados'] += 1
+                self._stats['fallos'] += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self._stats['aciertos'] += 1
+            return valor
+
+    def guardar(self, clave, valor, ttl=None):
+        """ Guarda un resultado, desalojando los menos usados si se superan los límites """
+        tamanio = _tamanio(valor)
+        if tamanio > self.max_bytes:
+            return
+        with self._lock:
+            if clave in self._entradas:
+                self._quitar(clave)
+            self._entradas[clave] = (valor, time.monotonic() + (self.ttl if ttl is None else ttl), tamanio)
+            self._bytes += tamanio
+            while len(self._entradas) > self.max_entradas or self._bytes > self.max_bytes:
+                self._quitar(next(iter(self._entradas)))
+                self._stats['desalojados'] += 1
+
+    def invalidar(self):
+        """ Descarta todos los resultados guardados en este proceso """
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+            self._version = version_datos()
+            self._stats['invalidaciones'] += 1
+
+    def estadisticas(self):
+        """ Retorna aciertos, fallos, desalojos, entradas y bytes ocupados del cache """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entradas'] = len(self._entradas)
+            stats['bytes'] = self._bytes
+        return stats
+
+
+cache = CacheConsultas(
+    ttl=float(os.getenv("CACHE_TTL", "3600")),
+    max_entradas=int(os.getenv("CACHE_MAX_ENTRADAS", "128")),
+    max_bytes=int(os.getenv("CACHE_MAX_MB", "256")) * 1024 * 1024
+)
+
+
+def leer_sql(query, params=None, ttl=None, esquema=None):
+    """
+    Ejecuta una consulta con una conexión del pool y guarda el resultado en el cache compartido.
+
+    Parámetros:
+    - query (str): Consulta SQL.
+    - params (tuple | dict, opcional): Parámetros de la consulta.
+    - ttl (float, opcional): Vigencia en segundos; por defecto la del cache.
+    - esquema (str | dict, opcional): Tipos compactos a aplicar (ver telecom_core.tipos); el cache
+                                      guarda el resultado ya compactado.
+
+    Retorno:
+    - DataFrame con el resultado. Es una copia superficial: agregar o reemplazar columnas
+      no altera el resultado guardado.
+    """
+    clave = clave_consulta(query, params, esquema)
+    df = cache.obtener(clave)
+    if df is None:
+        with conexion() as conn:
+            df = pd.read_sql(query, conn, params=params)
+        if esquema is not None:
+            df = compactar(df, esquema)
+        cache.guardar(clave, df, ttl=ttl)
+    return df.copy(deep=False)
+
+
+def invalidar_cache():
+    """
+    Hook para el ETL: publica una nueva versión de los datos tras una recarga.
+
+    Vacía el cache de este proceso y actualiza el archivo de versión, con lo que el resto
+    de los procesos del host (ambos dashboards) descartan sus resultados en la próxima consulta.
+    """
+    ARCHIVO_VERSION.parent.mkdir(parents=True, exist_ok=True)
+    ARCHIVO_VERSION.write_text(str(time.time_ns()))
+    cache.invalidar()
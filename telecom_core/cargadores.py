@@ -0,0 +1,189 @@
+"""
+Cargadores de los datasets de los KPIs, compartidos por los dashboards de Dash y Streamlit.
+
+Cada cargador lee una vista materializada con una consulta parametrizada (telecom_core.consultas),
+aplica los tipos compactos del dataset (telecom_core.tipos) y reutiliza el cache y el pool únicos
+del proceso. Los decorados con @con_snapshot se sirven del snapshot Parquet cuando está vigente.
+
+Exportar el snapshot de todos los datasets: python -m telecom_core.cargadores
+"""
+import logging
+import threading
+
+from telecom_core.asincrono import cargar_async, cargar_concurrente
+from telecom_core.cache import leer_sql, version_datos
+from telecom_core.consultas import (
+    ANIO_ACTUAL, ANIO_DESDE_RECIENTE, CONSULTA_COBERTURA_PROVINCIA, consulta_accesos_movil, consulta_penetracion
+)
+from telecom_core.lotes import cargar_cobertura_provincia_en_lotes
+from telecom_core.periodos import agregar_periodo
+from telecom_core.snapshot import con_snapshot, exportar_snapshot
+from telecom_core.transformaciones import indicadores_provincia
+
+
+# -- FUNCIONES PARA EL KPI 1 --
+
+@con_snapshot('penetracion_reciente', desde=ANIO_DESDE_RECIENTE)
+def load_internet_penetration_data(desde=None, hasta=None, provincias=None, nivel='provincia_periodo'):
+    """
+    Funcion para cargar los datos de penetracion de internet en hogares para el KPI 1.
+    El filtrado por periodo y provincia y la agregación se resuelven en la consulta SQL.
+
+    Parámetros:
+    - desde, hasta (int | tuple, opcional): Rango de periodos, un año o (anio, trimestre).
+    - provincias (list, opcional): Provincias a incluir.
+    - nivel (str): 'provincia_periodo', 'provincia' o 'periodo' (ver consulta_penetracion).
+    """
+    # Consulta SQL (compartida en telecom_core.consultas)
+    query, params = consulta_penetracion(desde, hasta, provincias, nivel)
+    
+    # Ejecutar consulta (o reutilizar el resultado del cache) y cargar en DataFrame con tipos compactos
+    df = leer_sql(query, params, esquema='penetracion')
+
+    # Índice de periodo y etiqueta categórica 'anio_trimestre', una sola vez por dataset
+    return agregar_periodo(df)
+
+
+@con_snapshot('penetracion_mapa')
+def cargar_datos_penetracion_mapa():
+    """
+    Carga los datos de penetración promedio por provincia desde la base de datos.
+
+    Retorno:
+    - DataFrame con las columnas 'nombre_provincia' y 'promedio_accesos'.
+    """
+    # Consulta SQL (compartida en telecom_core.consultas): promedio por provincia calculado en la base
+    query, params = consulta_penetracion(desde=ANIO_ACTUAL, nivel='provincia')
+    df = leer_sql(query, params, esquema='penetracion')
+    
+    # Normalizar nombres de provincias para facilitar la coincidencia con GeoJSON (sigue siendo categórica)
+    df['nombre_provincia'] = df['nombre_provincia'].str.lower().astype('category')
+    return df
+
+
+
+
+# -- FUNCIONES PARA EL KPI 2 --
+
+@con_snapshot('cobertura_provincia')
+def cargar_datos_cobertura_provincia(en_lotes=False):
+    """
+    Carga la cobertura de fibra óptica y conectividad inalámbrica agregada por provincia, desde la
+    vista materializada mv_cobertura_provincia (localidades con fibra óptica o wireless).
+
+    Parámetros:
+    - en_lotes (bool): Agregar desde el detalle por localidad, leído en lotes con un cursor del
+                       servidor (memoria acotada), en lugar de leer la vista materializada.
+
+    Retorno:
+    - DataFrame con las columnas 'nombre_provincia', 'total_localidades', 'localidades_fibra',
+      'localidades_wireless' y 'porcentaje_fibra'.
+    """
+    if en_lotes:
+        return cargar_cobertura_provincia_en_lotes()
+
+    # Consulta SQL (compartida en telecom_core.consultas)
+    query = CONSULTA_COBERTURA_PROVINCIA
+    df = leer_sql(query, esquema='cobertura_provincia')
+    return df
+
+
+
+
+# -- FUNCIONES PARA EL KPI 3 --
+
+@con_snapshot('accesos_movil_anual', desde=ANIO_ACTUAL, hasta=ANIO_ACTUAL, nivel='anio')
+@con_snapshot('accesos_movil_reciente', desde=ANIO_DESDE_RECIENTE)
+def cargar_datos_accesos_movil(desde=None, hasta=None, nivel='periodo'):
+    """
+    Carga los datos de accesos a planes de telefonía móvil pospago y prepago, filtrados y
+    agregados en la consulta SQL.
+
+    Parámetros:
+    - desde, hasta (int | tuple, opcional): Rango de periodos, un año o (anio, trimestre).
+    - nivel (str): 'periodo' (por año y trimestre) o 'anio' (totales por año).
+
+    Retorno:
+    - DataFrame con las columnas 'anio', 'trimestre', 'periodo' y 'anio_trimestre' (estas tres solo con
+      nivel 'periodo'), 'total_accesos_pospago' y 'total_accesos_prepago'.
+    """
+    # Consulta SQL (compartida en telecom_core.consultas)
+    query, params = consulta_accesos_movil(desde, hasta, nivel)
+    df = leer_sql(query, params, esquema='accesos_movil')
+
+    # Índice de periodo y etiqueta categórica 'anio_trimestre' (solo con nivel 'periodo')
+    return agregar_periodo(df)
+
+
+
+# -- CARGA CONCURRENTE DE TODOS LOS KPIs --
+
+# Datasets que usan las páginas de los dashboards: nombre -> (cargador, kwargs)
+CARGAS_KPI = {
+    'penetracion': (load_internet_penetration_data, {'desde': ANIO_DESDE_RECIENTE}),
+    'penetracion_mapa': (cargar_datos_penetracion_mapa, {}),
+    'cobertura_provincia': (cargar_datos_cobertura_provincia, {}),
+    'accesos_movil': (cargar_datos_accesos_movil, {'desde': ANIO_DESDE_RECIENTE}),
+    'accesos_movil_anual': (cargar_datos_accesos_movil, {'desde': ANIO_ACTUAL, 'hasta': ANIO_ACTUAL, 'nivel': 'anio'}),
+}
+
+
+async def cargar_datasets_kpi_async(nombres=None):
+    """
+    Carga concurrentemente los datasets de los KPIs (penetración, cobertura y accesos móviles).
+
+    Parámetros:
+    - nombres (list, opcional): Datasets de CARGAS_KPI a cargar; por defecto todos.
+
+    Retorno:
+    - dict nombre -> DataFrame.
+    """
+    nombres = list(CARGAS_KPI) if nombres is None else nombres
+    return await cargar_async({nombre: CARGAS_KPI[nombre] for nombre in nombres})
+
+
+def cargar_datasets_kpi(nombres=None):
+    """
+    Versión sincrónica de cargar_datasets_kpi_async. Las consultas se emiten en paralelo, así que
+    el tiempo total es el de la más lenta; los resultados quedan en el cache del proceso.
+    """
+    nombres = list(CARGAS_KPI) if nombres is None else nombres
+    return cargar_concurrente({nombre: CARGAS_KPI[nombre] for nombre in nombres})
+
+
+
+# -- INDICADORES POR PROVINCIA PARA LOS MAPAS --
+
+# Agregado vigente: (versión de los datos, DataFrame)
+_indicadores = (None, None)
+_indicadores_lock = threading.Lock()
+
+
+def cargar_indicadores_provincia():
+    """
+    Retorna los indicadores por provincia de los mapas de coropletas (penetración promedio y porcentaje
+    de localidades con fibra óptica), indexados por la clave del GeoJSON (ver indicadores_provincia).
+
+    El agregado se calcula una vez por versión de los datos: cuando el ETL publica una versión nueva
+    se vuelve a armar con los datasets recién consultados.
+
+    Retorno:
+    - DataFrame con las columnas 'clave', 'provincia', 'promedio_accesos' y 'porcentaje_fibra'.
+    """
+    global _indicadores
+    version = version_datos()
+    with _indicadores_lock:
+        version_actual, df_indicadores = _indicadores
+        if df_indicadores is None or version_actual != version:
+            datasets = cargar_datasets_kpi(['penetracion_mapa', 'cobertura_provincia'])
+            df_indicadores = indicadores_provincia(datasets['penetracion_mapa'], datasets['cobertura_provincia'])
+            _indicadores = (version, df_indicadores)
+    return df_indicadores
+
+if __name__ == '__main__':
+    # Exportar el snapshot Parquet de los datasets de los KPIs
+    # (el nivel INFO muestra la memoria de cada dataset antes y después de compactar los tipos)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    manifiesto = exportar_snapshot()
+    for nombre, info in manifiesto['datasets'].items():
+        print(f"{nombre}: {info['filas']} filas, {info['memoria'] / 1024:.1f} KB en memoria -> {info['archivo']}")
@@ -0,0 +1,29 @@
+import os
+import threading
+
+from dotenv import find_dotenv, load_dotenv
+
+_cargada = False
+_lock = threading.Lock()
+
+
+def cargar_configuracion():
+    """
+    Carga una sola vez por proceso las credenciales de la base de datos (DB_HOST, DB_NAME,
+    DB_USER, DB_PASSWORD) y el resto de la configuración desde un archivo .env.
+
+    El archivo se toma de la variable de entorno TELECOM_ENV_FILE o, si no está definida, se
+    busca un .env desde el directorio de trabajo hacia arriba. Las variables ya definidas en el
+    entorno tienen prioridad sobre las del archivo.
+
+    Retorno:
+    - str con la ruta del archivo cargado, o '' si no se encontró ninguno.
+    """
+    global _cargada
+    with _lock:
+        ruta = os.getenv("TELECOM_ENV_FILE") or find_dotenv(usecwd=True)
+        if not _cargada:
+            if ruta:
+                load_dotenv(ruta, override=False)
+            _cargada = True
+        return ruta
@@ -0,0 +1,152 @@
+# Consultas SQL de los KPIs, compartidas por los cargadores de ambos dashboards (telecom_core.cargadores)
+# y por la verificación de planes de ejecución del ETL (etl/migraciones). Leen las vistas materializadas
+# de la migración 0002, que el ETL refresca después de cada carga.
+
+
+# -- CONSTRUCCIÓN DE CONSULTAS PARAMETRIZADAS --
+
+# Primer año que muestran los gráficos de evolución de los KPIs
+ANIO_DESDE_RECIENTE = 2023
+
+# Año del mapa de penetración y de la distribución pospago/prepago
+ANIO_ACTUAL = 2024
+
+
+def _condiciones_periodo(desde, hasta):
+    """
+    Arma las condiciones WHERE de un rango de periodos. Cada extremo puede ser un año (int),
+    que filtra solo por 'anio', o una tupla (anio, trimestre).
+    """
+    condiciones, params = [], []
+    for valor, operador in ((desde, '>='), (hasta, '<=')):
+        if valor is None:
+            continue
+        if isinstance(valor, tuple):
+            condiciones.append(f"(anio, trimestre) {operador} (%s, %s)")
+            params.extend(valor)
+        else:
+            condiciones.append(f"anio {operador} %s")
+            params.append(valor)
+    return condiciones, params
+
+
+def _armar_consulta(columnas, vista, condiciones=(), agrupar=None, ordenar=None):
+    """ Arma el texto SQL de una consulta sobre una vista """
+    partes = [f"    SELECT\n        {columnas}\n    FROM\n        {vista}"]
+    if condiciones:
+        partes.append("    WHERE\n        " + "\n        AND ".join(condiciones))
+    if agrupar:
+        partes.append(f"    GROUP BY\n        {agrupar}")
+    if ordenar:
+        partes.append(f"    ORDER BY\n        {ordenar}")
+    return "\n" + "\n".join(partes) + ";\n"
+
+
+def _nivel(niveles, nivel):
+    if nivel not in niveles:
+        raise ValueError(f"Nivel de agregación desconocido: {nivel!r} (opciones: {', '.join(niveles)})")
+    return niveles[nivel]
+
+
+# -- KPI 1 --
+
+# Nivel de agregación -> (columnas, GROUP BY, ORDER BY)
+NIVELES_PENETRACION = {
+    'provincia_periodo': ("nombre_provincia,\n        anio,\n        trimestre,\n        accesos_por_100_hogares", None, None),
+    'provincia': ("nombre_provincia,\n        AVG(accesos_por_100_hogares) AS promedio_accesos", "nombre_provincia", None),
+    'periodo': ("anio,\n        trimestre,\n        AVG(accesos_por_100_hogares) AS promedio_accesos", "anio, trimestre", "anio, trimestre"),
+}
+
+
+def consulta_penetracion(desde=None, hasta=None, provincias=None, nivel='provincia_periodo'):
+    """
+    Arma la consulta de penetración de internet en hogares con el filtrado y la agregación en SQL.
+
+    Parámetros:
+    - desde, hasta (int | tuple, opcional): Extremos del rango de periodos, un año o (anio, trimestre).
+    - provincias (list, opcional): Nombres de provincia a incluir (como están en la base de datos).
+    - nivel (str): 'provincia_periodo' (una fila por provincia y trimestre), 'provincia' (promedio
+                   por provincia) o 'periodo' (promedio nacional por trimestre).
+
+    Retorno:
+    - tuple (query, params) para leer_sql.
+    """
+    columnas, agrupar, ordenar = _nivel(NIVELES_PENETRACION, nivel)
+    condiciones, params = _condiciones_periodo(desde, hasta)
+    if provincias is not None:
+        condiciones.append("nombre_provincia = ANY(%s)")
+        params.append(list(provincias))
+    query = _armar_consulta(columnas, "mv_penetracion_provincia_periodo", condiciones, agrupar, ordenar)
+    return query, tuple(params) or None
+
+
+# -- KPI 2 --
+
+CONSULTA_COBERTURA_PROVINCIA = """
+    SELECT
+        nombre_provincia,
+        total_localidades,
+        localidades_fibra,
+        localidades_wireless,
+        100.0 * localidades_fibra / total_localidades AS porcentaje_fibra
+    FROM
+        mv_cobertura_provincia
+    ORDER BY
+        nombre_provincia;
+"""
+
+# Detalle por localidad (misma población que mv_cobertura_provincia), para leer en lotes
+# con un cursor del servidor (telecom_core.lotes)
+CONSULTA_CONECTIVIDAD_LOCALIDAD = """
+    SELECT
+        p.nombre_provincia,
+        l.partido,
+        l.localidad,
+        mc.poblacion,
+        mc.fibra_optica,
+        mc.wireless
+    FROM
+        mapa_conectividad mc
+    JOIN
+        localidades l ON mc.id_localidad = l.id_localidad
+    JOIN
+        provincias p ON l.id_provincia = p.id_provincia
+    WHERE
+        mc.fibra_optica = TRUE OR mc.wireless = TRUE;
+"""
+
+
+# -- KPI 3 --
+
+# Nivel de agregación -> (columnas, GROUP BY, ORDER BY)
+NIVELES_ACCESOS_MOVIL = {
+    'periodo': ("anio,\n        trimestre,\n        total_accesos_pospago,\n        total_accesos_prepago", None, "anio, trimestre"),
+    'anio': ("anio,\n        SUM(total_accesos_pospago) AS total_accesos_pospago,\n        SUM(total_accesos_prepago) AS total_accesos_prepago", "anio", "anio"),
+}
+
+
+def consulta_accesos_movil(desde=None, hasta=None, nivel='periodo'):
+    """
+    Arma la consulta de accesos de telefonía móvil pospago y prepago con el filtrado y la agregación en SQL.
+
+    Parámetros:
+    - desde, hasta (int | tuple, opcional): Extremos del rango de periodos, un año o (anio, trimestre).
+    - nivel (str): 'periodo' (una fila por trimestre) o 'anio' (totales por año).
+
+    Retorno:
+    - tuple (query, params) para leer_sql.
+    """
+    columnas, agrupar, ordenar = _nivel(NIVELES_ACCESOS_MOVIL, nivel)
+    condiciones, params = _condiciones_periodo(desde, hasta)
+    query = _armar_consulta(columnas, "mv_accesos_movil_periodo", condiciones, agrupar, ordenar)
+    return query, tuple(params) or None
+
+
+# Consultas que ejecutan los dashboards: nombre del dataset (el mismo del snapshot) -> (query, params)
+CONSULTAS_KPI = {
+    'penetracion_reciente': consulta_penetracion(desde=ANIO_DESDE_RECIENTE),
+    'penetracion_mapa': consulta_penetracion(desde=ANIO_ACTUAL, nivel='provincia'),
+    'cobertura_provincia': (CONSULTA_COBERTURA_PROVINCIA, None),
+    'accesos_movil_reciente': consulta_accesos_movil(desde=ANIO_DESDE_RECIENTE),
+    'accesos_movil_anual': consulta_accesos_movil(desde=ANIO_ACTUAL, hasta=ANIO_ACTUAL, nivel='anio'),
+}
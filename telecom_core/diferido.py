@@ -0,0 +1,92 @@
+import logging
+import os
+import threading
+import time
+
+from telecom_core.cache import version_datos
+
+logger = logging.getLogger(__name__)
+
+# Segundos entre refrescos en segundo plano de los datos y figuras de cada página
+INTERVALO_REFRESCO = float(os.getenv("DASH_REFRESCO_S", "900"))
+
+
+class CargaDiferida:
+    """
+    Construye un recurso (datos y figuras de una página) recién cuando se pide por primera vez
+    y lo mantiene actualizado con un hilo de refresco en segundo plano.
+
+    Solo un hilo construye a la vez: los pedidos concurrentes esperan esa única construcción
+    en lugar de repetir las consultas. Durante un refresco se sigue sirviendo el valor anterior,
+    que se reemplaza completo al terminar. El refresco solo reconstruye si el ETL publicó una
+    nueva versión de los datos (o si la versión es desconocida), así los workers inactivos no
+    repiten trabajo cuando nada cambió.
+
+    Parámetros:
+    - construir (callable): Función sin argumentos que retorna el recurso.
+    - intervalo (float, opcional): Segundos entre refrescos; 0 desactiva el refresco.
+    """
+
+    def __init__(self, construir, intervalo=None):
+        self._construir = construir
+        self.intervalo = INTERVALO_REFRESCO if intervalo is None else intervalo
+        self._valor = None
+        self._construido = False
+        self._lock = threading.Lock()
+        self._hilo = None
+        self._version = None
+        self._construcciones = 0
+        self.ultima_construccion = None
+
+    def obtener(self):
+        """ Retorna el recurso, construyéndolo en el primer pedido """
+        if not self._construido:
+            with self._lock:
+                if not self._construido:
+                    self._version = version_datos()
+                    self._valor = self._construir()
+                    self._construido = True
+                    self._construcciones += 1
+                    self.ultima_construccion = time.time()
+                    self._iniciar_refresco()
+        return self._valor
+
+    @property
+    def version(self):
+        """ Versión de los datos con la que se construyó el valor actual (None si aún no se construyó) """
+        return self._version
+
+    @property
+    def construcciones(self):
+        """
+        Cantidad de veces que se construyó el valor (0 si aún no se construyó). Cambia con cada
+        reconstrucción aunque la versión de los datos sea desconocida ('0'), así que sirve de clave
+        para memorizar lo que se deriva del valor actual (ver CacheFiguras).
+        """
+        return self._construcciones
+
+    def refrescar(self, forzar=False):
+        """ Reconstruye el recurso si cambiaron los datos (o si se fuerza); si falla, conserva el valor anterior """
+        version = version_datos()
+        if not forzar and self._construido and version != "0" and version == self._version:
+            return
+        with self._lock:
+            try:
+                self._valor = self._construir()
+                self._version = version
+                self._construido = True
+                self._construcciones += 1
+                self.ultima_construccion = time.time()
+            except Exception:
+                logger.exception("Error al refrescar %s; se conserva el valor anterior", self._construir.__name__)
+
+    def _iniciar_refresco(self):
+        if self.intervalo <= 0 or self._hilo is not None:
+            return
+        self._hilo = threading.Thread(target=self._bucle_refresco, name=f"refresco-{self._construir.__name__}", daemon=True)
+        self._hilo.start()
+
+    def _bucle_refresco(self):
+        while True:
+            time.sleep(self.intervalo)
+            self.refrescar()
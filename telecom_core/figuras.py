@@ -0,0 +1,56 @@
+import threading
+
+from telecom_core.cache import version_datos
+
+
+class CacheFiguras:
+    """
+    Memoriza figuras de Plotly por clave (p. ej. una por provincia) ya serializadas con
+    to_plotly_json(), para que un callback que solo cambia de selección se resuelva con una
+    búsqueda en un diccionario en lugar de filtrar los datos y armar la figura otra vez.
+
+    Las figuras se descartan todas juntas cuando cambia la versión de los datos.
+
+    Parámetros:
+    - construir (callable): Función que recibe la clave y retorna la figura (go.Figure o dict).
+    - version (callable, opcional): Función que retorna la versión de los datos con que se construyen
+                                    las figuras; por defecto version_datos(). Con una CargaDiferida
+                                    conviene usar su contador de construcciones (lambda: carga.construcciones):
+                                    cambia con cada reconstrucción, incluso cuando la versión de los
+                                    datos es desconocida ('0') y no distinguiría los datos viejos de los nuevos.
+    """
+
+    def __init__(self, construir, version=None):
+        self._construir = construir
+        self._version_actual = version or version_datos
+        self._figuras = {}
+        self._version = None
+        self._lock = threading.Lock()
+
+    def obtener(self, clave):
+        """ Retorna la figura de la clave, construyéndola si no está memorizada para la versión vigente """
+        version = self._version_actual()
+        with self._lock:
+            if version != self._version:
+                self._figuras = {}
+                self._version = version
+            figura = self._figuras.get(clave)
+        if figura is None:
+            figura = self._construir(clave)
+            if hasattr(figura, 'to_plotly_json'):
+                figura = figura.to_plotly_json()
+            with self._lock:
+                if version == self._version:
+                    self._figuras[clave] = figura
+        return figura
+
+    def precalcular(self, claves):
+        """ Construye por adelantado las figuras de todas las claves (p. ej. en un hilo de fondo) """
+        for clave in claves:
+            self.obtener(clave)
+
+    def invalidar(self):
+        """ Descarta todas las figuras memorizadas """
+        with self._lock:
+            self._figuras = {}
+            self._version = None
@@ -0,0 +1,110 @@
+"""
+Servicio de geometrías de provincias para los mapas de coropletas.
+
+El GeoJSON se lee y se parsea una sola vez por proceso (se vuelve a leer solo si el archivo cambia)
+y se guardan versiones simplificadas para distintos niveles de zoom. Los mapas del país completo
+(zoom 4) no distinguen detalles menores a un par de kilómetros, así que embeber la geometría de
+resolución completa en cada figura solo agranda lo que se envía al navegador.
+"""
+import copy
+import json
+import threading
+from pathlib import Path
+
+import numpy as np
+from shapely.geometry import mapping, shape
+
+from telecom_core.normalizacion import agregar_claves_geojson
+
+# Nivel -> tolerancia de simplificación en grados (1 grado ~ 111 km)
+TOLERANCIAS = {
+    'pais': 0.02,        # Argentina completa (zoom <= 4)
+    'region': 0.005,     # Varias provincias (zoom 5-6)
+    'detalle': 0.001,    # Una provincia o menos (zoom >= 7)
+    'original': 0.0,     # Sin simplificar
+}
+
+# Decimales de las coordenadas de cada nivel (4 decimales ~ 10 m)
+DECIMALES = {'pais': 3, 'region': 4, 'detalle': 4, 'original': None}
+
+_geometrias = {}
+_lock = threading.Lock()
+
+
+def nivel_para_zoom(zoom):
+    """ Retorna el nivel de simplificación adecuado para un nivel de zoom de mapbox/leaflet """
+    if zoom <= 4:
+        return 'pais'
+    if zoom <= 6:
+        return 'region'
+    return 'detalle'
+
+
+def _redondear(coordenadas, decimales):
+    """ Redondea recursivamente las coordenadas de una geometría GeoJSON """
+    if coordenadas and isinstance(coordenadas[0], (int, float)):
+        return [round(valor, decimales) for valor in coordenadas]
+    if coordenadas and isinstance(coordenadas[0][0], (int, float)):
+        return np.round(np.asarray(coordenadas, dtype=float), decimales).tolist()
+    return [_redondear(parte, decimales) for parte in coordenadas]
+
+
+def _simplificar(geojson_data, tolerancia, decimales):
+    """ Retorna una copia del GeoJSON con cada geometría simplificada sin romper su validez """
+    simplificado = {clave: valor for clave, valor in geojson_data.items() if clave != 'features'}
+    simplificado['features'] = []
+    for feature in geojson_data['features']:
+        geometria = shape(feature['geometry']).simplify(tolerancia, preserve_topology=True)
+        geometria = mapping(geometria)
+        geometria = {'type': geometria['type'], 'coordinates': _redondear(geometria['coordinates'], decimales)}
+        simplificado['features'].append({
+            'type': 'Feature',
+            'properties': dict(feature['properties']),
+            'geometry': geometria
+        })
+    return simplificado
+
+
+def _cargar(ruta):
+    """ Lee el GeoJSON, agrega la clave de coincidencia y calcula todos los niveles """
+    with open(ruta, encoding='utf-8') as f:
+        original = agregar_claves_geojson(json.load(f))
+    niveles = {'original': original}
+    for nivel, tolerancia in TOLERANCIAS.items():
+        if nivel != 'original':
+            niveles[nivel] = _simplificar(original, tolerancia, DECIMALES[nivel])
+    return niveles
+
+
+def obtener_geojson(ruta, nivel='pais', copiar=False):
+    """
+    Retorna el GeoJSON de provincias simplificado al nivel pedido, con la propiedad 'clave'
+    (ver agregar_claves_geojson) en cada provincia.
+
+    Parámetros:
+    - ruta (str | Path): Ruta al archivo GeoJSON.
+    - nivel (str): Nivel de TOLERANCIAS ('pais', 'region', 'detalle' u 'original').
+    - copiar (bool): Retornar una copia que se puede modificar (p. ej. para agregar valores a las
+                     propiedades). Sin copia, el GeoJSON es compartido y no debe modificarse.
+
+    Retorno:
+    - dict con el FeatureCollection.
+    """
+    if nivel not in TOLERANCIAS:
+        raise ValueError(f"Nivel de simplificación desconocido: {nivel!r} (opciones: {', '.join(TOLERANCIAS)})")
+
+    ruta = Path(ruta).resolve()
+    clave = (str(ruta), ruta.stat().st_mtime_ns)
+    niveles = _geometrias.get(clave)
+    if niveles is None:
+        with _lock:
+            niveles = _geometrias.get(clave)
+            if niveles is None:
+                niveles = _cargar(ruta)
+                # Descartar las versiones de un archivo que cambió en disco
+                for anterior in [k for k in _geometrias if k[0] == clave[0]]:
+                    del _geometrias[anterior]
+                _geometrias[clave] = niveles
+
+    geojson_data = niveles[nivel]
+    return copy.deepcopy(geojson_data) if copiar else geojson_data
@@ -0,0 +1,106 @@
+import itertools
+
+import pandas as pd
+
+from telecom_core.consultas import CONSULTA_CONECTIVIDAD_LOCALIDAD
+from telecom_core.pool import conexion
+from telecom_core.tipos import compactar
+
+# Filas por lote al leer con cursores del servidor
+TAM_LOTE = 20000
+
+# Nombres únicos para los cursores del servidor abiertos en este proceso
+_contador_cursores = itertools.count()
+
+
+def leer_sql_en_lotes(query, params=None, tam_lote=TAM_LOTE, esquema=None):
+    """
+    Ejecuta una consulta con un cursor con nombre (del lado del servidor) y entrega el resultado
+    en DataFrames de a 'tam_lote' filas, sin traer nunca el resultado completo al cliente.
+
+    La conexión del pool queda tomada mientras se recorren los lotes y se devuelve al terminar
+    (o al cerrar el generador, si se deja de iterar antes). Los lotes no pasan por el cache.
+
+    Parámetros:
+    - query (str): Consulta SQL.
+    - params (tuple | dict, opcional): Parámetros de la consulta.
+    - tam_lote (int): Filas por lote.
+    - esquema (str | dict, opcional): Tipos compactos a aplicar a cada lote (ver telecom_core.tipos).
+
+    Retorno:
+    - Generador de DataFrames.
+    """
+    with conexion() as conn:
+        # El cursor con nombre vive dentro de la transacción; el pool la descarta al devolver la conexión
+        with conn.cursor(name=f"lotes_{next(_contador_cursores)}") as cursor:
+            cursor.itersize = tam_lote
+            cursor.execute(query, params)
+            while True:
+                filas = cursor.fetchmany(tam_lote)
+                if not filas:
+                    break
+                columnas = [columna[0] for columna in cursor.description]
+                lote = pd.DataFrame.from_records(filas, columns=columnas, coerce_float=True)
+                if esquema is not None:
+                    lote = compactar(lote, esquema, informar=False)
+                yield lote
+
+
+def agregar_cobertura_en_lotes(lotes):
+    """
+    Agrega por provincia la cobertura de fibra óptica y wireless a partir de lotes con el detalle
+    por localidad. Cada lote se reduce a una fila por provincia y se suma al acumulado, así la
+    memoria depende de la cantidad de provincias y del tamaño del lote, no del total de localidades.
+
+    Parámetros:
+    - lotes (iterable): DataFrames con las columnas 'nombre_provincia', 'fibra_optica' y 'wireless'
+                        (y opcionalmente 'poblacion').
+
+    Retorno:
+    - DataFrame con las columnas 'nombre_provincia', 'total_localidades', 'localidades_fibra',
+      'localidades_wireless' y 'porcentaje_fibra' (las de cargar_datos_cobertura_provincia),
+      más 'poblacion' y 'poblacion_fibra' si los lotes traen la población.
+    """
+    acumulado = None
+    for lote in lotes:
+        fibra = lote['fibra_optica'].fillna(False).astype(bool)
+        parcial = pd.DataFrame({
+            'nombre_provincia': lote['nombre_provincia'].astype(str),
+            'total_localidades': 1,
+            'localidades_fibra': fibra.astype('int32'),
+            'localidades_wireless': lote['wireless'].fillna(False).astype(bool).astype('int32'),
+        })
+        if 'poblacion' in lote.columns:
+            poblacion = lote['poblacion'].fillna(0).astype('int64')
+            parcial['poblacion'] = poblacion
+            parcial['poblacion_fibra'] = poblacion.where(fibra, 0)
+        parcial = parcial.groupby('nombre_provincia').sum()
+        acumulado = parcial if acumulado is None else acumulado.add(parcial, fill_value=0)
+
+    columnas = ['total_localidades', 'localidades_fibra', 'localidades_wireless']
+    if acumulado is None:
+        return pd.DataFrame(columns=['nombre_provincia', *columnas, 'porcentaje_fibra'])
+
+    # add() con fill_value pasa los conteos a float cuando una provincia falta en algún lote
+    df = acumulado.astype('int64').sort_index().reset_index()
+    df['porcentaje_fibra'] = 100.0 * df['localidades_fibra'] / df['total_localidades']
+    poblacion = [columna for columna in ('poblacion', 'poblacion_fibra') if columna in df.columns]
+    df = df[['nombre_provincia', *columnas, 'porcentaje_fibra', *poblacion]]
+    return compactar(df, 'cobertura_provincia', informar=False)
+
+
+def cargar_cobertura_provincia_en_lotes(tam_lote=TAM_LOTE):
+    """
+    Calcula la cobertura de fibra óptica y wireless por provincia leyendo mapa_conectividad por
+    localidad en lotes, con memoria acotada. Es la alternativa a la vista materializada
+    mv_cobertura_provincia cuando hace falta recorrer el detalle (p. ej. mapas históricos de
+    varios periodos, o una base sin la migración 0002).
+
+    Parámetros:
+    - tam_lote (int): Filas por lote.
+
+    Retorno:
+    - DataFrame como el de agregar_cobertura_en_lotes.
+    """
+    lotes = leer_sql_en_lotes(CONSULTA_CONECTIVIDAD_LOCALIDAD, tam_lote=tam_lote, esquema='mapa_conectividad')
+    return agregar_cobertura_en_lotes(lotes)
@@ -0,0 +1,99 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Variantes de nombres de provincia que no se resuelven solo quitando tildes y espacios
+ALIAS_PROVINCIAS = {
+    'capitalfederal': 'caba',
+    'ciudaddebuenosaires': 'caba',
+    'ciudadautonomadebuenosaires': 'caba',
+    'tierradelfuegoantartidaeislasdelatlanticosur': 'tierradelfuego',
+}
+
+
+@lru_cache(maxsize=None)
+def normalizar_nombre(nombre):
+    """
+    Elimina tildes y caracteres especiales, convierte a minúsculas y recorta espacios.
+
+    Parámetros:
+    - nombre (str): Nombre de provincia, partido o localidad.
+
+    Retorno:
+    - str normalizado; los valores que no son texto se devuelven sin cambios.
+    """
+    if not isinstance(nombre, str):
+        return nombre
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', nombre)
+        if unicodedata.category(c) != 'Mn'
+    ).lower().strip()
+
+
+@lru_cache(maxsize=None)
+def clave_provincia(nombre):
+    """
+    Genera la clave de coincidencia de una provincia: el nombre normalizado sin espacios ni
+    signos, con alias resueltos. Así 'BuenosAires' (GeoJSON) y 'buenos aires' (base de datos)
+    comparten la clave 'buenosaires', y 'CiudaddeBuenosAires' coincide con 'caba'.
+    """
+    if not isinstance(nombre, str):
+        return nombre
+    clave = re.sub(r'[^a-z0-9]', '', normalizar_nombre(nombre))
+    return ALIAS_PROVINCIAS.get(clave, clave)
+
+
+def _aplicar_por_valor_unico(serie, funcion):
+    """ Aplica la función una sola vez por valor distinto y reconstruye la columna completa """
+    codigos, unicos = pd.factorize(serie)
+    resultado = np.array([funcion(valor) for valor in unicos] + [np.nan], dtype=object)
+    # Los nulos tienen código -1 y toman el último elemento (NaN)
+    return pd.Series(resultado[codigos], index=serie.index, name=serie.name)
+
+
+def normalizar_serie(serie):
+    """
+    Versión vectorizada de normalizar_nombre para columnas de pandas: el trabajo es
+    proporcional a la cantidad de nombres distintos, no a la cantidad de filas.
+    """
+    return _aplicar_por_valor_unico(serie, normalizar_nombre)
+
+
+def claves_provincia(serie):
+    """ Versión vectorizada de clave_provincia para columnas de pandas """
+    return _aplicar_por_valor_unico(serie, clave_provincia)
+
+
+# -- ÍNDICE DE PROVINCIAS --
+
+# Código ISO 3166-2 (propiedad ISO_1 del GeoJSON) -> nombre de la provincia
+PROVINCIAS_ISO = {
+    'AR-C': 'CABA', 'AR-B': 'Buenos Aires', 'AR-K': 'Catamarca', 'AR-H': 'Chaco', 'AR-U': 'Chubut',
+    'AR-X': 'Córdoba', 'AR-W': 'Corrientes', 'AR-E': 'Entre Ríos', 'AR-P': 'Formosa', 'AR-Y': 'Jujuy',
+    'AR-L': 'La Pampa', 'AR-F': 'La Rioja', 'AR-M': 'Mendoza', 'AR-N': 'Misiones', 'AR-Q': 'Neuquén',
+    'AR-R': 'Río Negro', 'AR-A': 'Salta', 'AR-J': 'San Juan', 'AR-D': 'San Luis', 'AR-Z': 'Santa Cruz',
+    'AR-S': 'Santa Fe', 'AR-G': 'Santiago del Estero', 'AR-V': 'Tierra del Fuego', 'AR-T': 'Tucumán',
+}
+
+# Índices precalculados al importar: código ISO -> clave, y clave -> nombre para mostrar
+CLAVES_ISO = {iso: clave_provincia(nombre) for iso, nombre in PROVINCIAS_ISO.items()}
+NOMBRES_PROVINCIA = {CLAVES_ISO[iso]: nombre for iso, nombre in PROVINCIAS_ISO.items()}
+
+
+def agregar_claves_geojson(geojson_data, propiedad='NAME_1', propiedad_iso='ISO_1'):
+    """
+    Agrega a cada provincia del GeoJSON la propiedad 'clave', para vincular los datos con
+    featureidkey="properties.clave" / key_on="feature.properties.clave". La clave sale del código
+    ISO (CLAVES_ISO) cuando la provincia lo trae, y si no del nombre con clave_provincia.
+
+    Retorno:
+    - El mismo GeoJSON, modificado en el lugar.
+    """
+    for feature in geojson_data['features']:
+        propiedades = feature['properties']
+        clave = CLAVES_ISO.get(propiedades.get(propiedad_iso))
+        propiedades['clave'] = clave or clave_provincia(propiedades[propiedad])
+    return geojson_data
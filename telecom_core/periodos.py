@@ -0,0 +1,68 @@
+"""
+Tipo de periodo (año y trimestre) de los datasets trimestrales.
+
+Los cargadores agregan a cada dataset, una sola vez, dos columnas derivadas de 'anio' y 'trimestre':
+- 'periodo': índice entero del trimestre (anio * 4 + trimestre - 1), para ordenar y filtrar
+  comparando enteros.
+- 'anio_trimestre': etiqueta categórica ordenada ('2023 T4' < '2024 T1'), para ejes y leyendas.
+  Las etiquetas se arman una vez por periodo distinto, no por fila.
+"""
+import numpy as np
+import pandas as pd
+
+
+def indice_periodo(anio, trimestre):
+    """
+    Retorna el índice entero de un trimestre. Acepta escalares o columnas (vectorizado).
+
+    Parámetros:
+    - anio (int | Series): Año.
+    - trimestre (int | Series): Trimestre (1 a 4).
+    """
+    if isinstance(anio, pd.Series):
+        return (anio.astype('int16') * 4 + trimestre.astype('int16') - 1).astype('int16')
+    return int(anio) * 4 + int(trimestre) - 1
+
+
+def etiqueta_periodo(indice):
+    """ Retorna la etiqueta de un índice de periodo (p. ej. 8096 -> '2024 T1') """
+    anio, trimestre = divmod(int(indice), 4)
+    return f"{anio} T{trimestre + 1}"
+
+
+def periodo_de_etiqueta(etiqueta):
+    """ Retorna el índice de periodo de una etiqueta 'AAAA Tn' (p. ej. '2024 T1' -> 8096) """
+    anio, trimestre = etiqueta.split(' T')
+    return indice_periodo(anio, trimestre)
+
+
+def etiquetas_periodo(periodos):
+    """
+    Convierte una columna de índices de periodo en etiquetas categóricas ordenadas.
+
+    Parámetros:
+    - periodos (Series): Índices de periodo (ver indice_periodo).
+
+    Retorno:
+    - Series categórica ordenada, con una categoría por periodo distinto en orden cronológico.
+    """
+    unicos = np.unique(periodos.to_numpy())
+    codigos = np.searchsorted(unicos, periodos.to_numpy())
+    etiquetas = pd.Categorical.from_codes(
+        codigos, categories=[etiqueta_periodo(indice) for indice in unicos], ordered=True
+    )
+    return pd.Series(etiquetas, index=periodos.index, name='anio_trimestre')
+
+
+def agregar_periodo(df):
+    """
+    Agrega las columnas 'periodo' y 'anio_trimestre' a un dataset con 'anio' y 'trimestre'.
+
+    Retorno:
+    - DataFrame nuevo con las dos columnas; si el dataset no es trimestral (sin 'trimestre')
+      o ya las tiene, se retorna sin cambios.
+    """
+    if 'trimestre' not in df.columns or 'periodo' in df.columns:
+        return df
+    periodos = indice_periodo(df['anio'], df['trimestre'])
+    return df.assign(periodo=periodos, anio_trimestre=etiquetas_periodo(periodos))
@@ -0,0 +1,182 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+
+class PoolConexiones:
+    """
+    Pool de conexiones PostgreSQL seguro para hilos, con chequeo de salud,
+    reconexión automática y estadísticas de uso.
+
+    Parámetros:
+    - minconn (int): Conexiones que se mantienen abiertas como mínimo.
+    - maxconn (int): Conexiones abiertas como máximo; al alcanzarlo, los pedidos esperan.
+    - timeout (float): Segundos máximos de espera por una conexión libre.
+    - intervalo_ping (float): Segundos de inactividad tras los cuales se verifica la conexión antes de prestarla.
+    - **parametros_conexion: Argumentos para psycopg2.connect (host, database, user, password, ...).
+    """
+
+    def __init__(self, minconn=1, maxconn=10, timeout=30.0, intervalo_ping=30.0, **parametros_conexion):
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.intervalo_ping = intervalo_ping
+
+        self._pool = ThreadedConnectionPool(minconn, maxconn, **parametros_conexion)
+        self._semaforo = threading.BoundedSemaphore(maxconn)
+        self._lock = threading.Lock()
+        self._ultimo_uso = {}
+        self._stats = {
+            'prestamos': 0,
+            'en_uso': 0,
+            'max_en_uso': 0,
+            'espera_total_s': 0.0,
+            'espera_max_s': 0.0,
+            'timeouts': 0,
+            'reconexiones': 0,
+        }
+
+    def _es_saludable(self, conn):
+        """ Verifica que la conexión siga viva; solo hace ping si estuvo inactiva un tiempo """
+        if conn.closed:
+            return False
+        if time.monotonic() - self._ultimo_uso.get(id(conn), 0.0) < self.intervalo_ping:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _devolver(self, conn, descartar=False):
+        """ Devuelve la conexión al pool, cerrándola si quedó inutilizable """
+        if not descartar and not conn.closed:
+            try:
+                # Dejar la conexión sin transacción abierta para el próximo préstamo
+                conn.rollback()
+            except psycopg2.Error:
+                descartar = True
+        descartar = descartar or bool(conn.closed)
+        with self._lock:
+            self._ultimo_uso.pop(id(conn), None)
+            if not descartar:
+                self._ultimo_uso[id(conn)] = time.monotonic()
+        self._pool.putconn(conn, close=descartar)
+
+    @contextmanager
+    def conexion(self):
+        """
+        Presta una conexión del pool durante el bloque `with` y la devuelve al salir.
+
+        Si la conexión está caída se reemplaza por una nueva antes de entregarla; si la
+        consulta falla por un problema de conexión, la conexión se descarta del pool.
+        """
+        inicio = time.perf_counter()
+        if not self._semaforo.acquire(timeout=self.timeout):
+            with self._lock:
+                self._stats['timeouts'] += 1
+            raise PoolError(f"No hay conexiones libres tras esperar {self.timeout} segundos")
+        espera = time.perf_counter() - inicio
+
+        try:
+            conn = self._pool.getconn()
+            if not self._es_saludable(conn):
+                self._devolver(conn, descartar=True)
+                conn = self._pool.getconn()
+                with self._lock:
+                    self._stats['reconexiones'] += 1
+        except Exception:
+            self._semaforo.release()
+            raise
+
+        with self._lock:
+            self._stats['prestamos'] += 1
+            self._stats['en_uso'] += 1
+            self._stats['max_en_uso'] = max(self._stats['max_en_uso'], self._stats['en_uso'])
+            self._stats['espera_total_s'] += espera
+            self._stats['espera_max_s'] = max(self._stats['espera_max_s'], espera)
+
+        descartar = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            descartar = True
+            raise
+        finally:
+            self._devolver(conn, descartar=descartar)
+            with self._lock:
+                self._stats['en_uso'] -= 1
+            self._semaforo.release()
+
+    def estadisticas(self):
+        """
+        Retorna las estadísticas de espera y uso del pool para dimensionarlo.
+
+        Retorno:
+        - dict con préstamos, conexiones en uso (actual y máximo), tiempos de espera,
+          timeouts y reconexiones.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['minconn'] = self.minconn
+        stats['maxconn'] = self.maxconn
+        stats['espera_promedio_s'] = stats['espera_total_s'] / stats['prestamos'] if stats['prestamos'] else 0.0
+        return stats
+
+    def cerrar(self):
+        """ Cierra todas las conexiones del pool """
+        self._pool.closeall()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def obtener_pool():
+    """
+    Retorna el pool compartido del proceso, creándolo en el primer uso.
+
+    El tamaño se configura con las variables de entorno DB_POOL_MIN, DB_POOL_MAX,
+    DB_POOL_TIMEOUT y DB_POOL_PING; las credenciales con DB_HOST, DB_NAME, DB_USER y DB_PASSWORD
+    (del entorno o del archivo .env, ver telecom_core.config).
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PoolConexiones(
+                    minconn=int(os.getenv("DB_POOL_MIN", "1")),
+                    maxconn=int(os.getenv("DB_POOL_MAX", "10")),
+                    timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+                    intervalo_ping=float(os.getenv("DB_POOL_PING", "30")),
+                    host=os.getenv("DB_HOST"),
+                    database=os.getenv("DB_NAME"),
+                    user=os.getenv("DB_USER"),
+                    password=os.getenv("DB_PASSWORD")
+                )
+    return _pool
+
+
+def conexion():
+    """ Presta una conexión del pool compartido (usar con `with`) """
+    return obtener_pool().conexion()
+
+
+def estadisticas_pool():
+    """ Retorna las estadísticas del pool compartido, o un diccionario vacío si aún no se creó """
+    return _pool.estadisticas() if _pool is not None else {}
+
+
+def cerrar_pool():
+    """ Cierra el pool compartido; el próximo préstamo crea uno nuevo """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.cerrar()
+            _pool = None
@@ -0,0 +1,123 @@
+"""
+Motor de proyecciones de los KPIs.
+
+Proyecta todas las series de un dataset (una por provincia, o una sola serie nacional) y varios
+trimestres futuros en una sola pasada de NumPy, con una tasa de crecimiento objetivo o con la
+tendencia lineal ajustada a cada serie. Los dashboards calculan la tabla de proyecciones una vez por
+versión de los datos y los gráficos la leen, en lugar de proyectar en cada callback.
+"""
+import numpy as np
+import pandas as pd
+
+from telecom_core.periodos import agregar_periodo, etiquetas_periodo
+
+METODOS = ('tasa', 'tendencia')
+
+
+def _ultimo_valido(valores):
+    """ Retorna la columna del último valor no nulo de cada fila (-1 si la fila no tiene datos) """
+    validos = ~np.isnan(valores)
+    ultimo = valores.shape[1] - 1 - np.argmax(validos[:, ::-1], axis=1)
+    return np.where(validos.any(axis=1), ultimo, -1)
+
+
+def proyectar_matriz(valores, trimestres=1, crecimiento=0.0, metodo='tasa'):
+    """
+    Proyecta todas las series de una matriz a la vez.
+
+    Parámetros:
+    - valores (ndarray): Matriz series x periodos consecutivos con los datos históricos (NaN donde falta
+                         un periodo).
+    - trimestres (int): Trimestres a proyectar después de la última columna.
+    - crecimiento (float | ndarray): Con 'tasa', crecimiento por trimestre (0.05 = 5%), uno para todas las
+                                     series o uno por serie.
+    - metodo (str): 'tasa' (último valor de cada serie con crecimiento compuesto) o 'tendencia' (recta de
+                    mínimos cuadrados ajustada a cada serie).
+
+    Retorno:
+    - ndarray series x trimestres con los valores proyectados (NaN para las series sin datos).
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método de proyección desconocido: {metodo!r} (opciones: {', '.join(METODOS)})")
+
+    valores = np.asarray(valores, dtype='float64')
+    n_periodos = valores.shape[1]
+    horizontes = np.arange(1, trimestres + 1)
+
+    if metodo == 'tasa':
+        # Último valor de cada serie, compuesto desde su periodo hasta cada horizonte
+        ultimo = _ultimo_valido(valores)
+        base = np.where(ultimo >= 0, valores[np.arange(len(valores)), ultimo], np.nan)
+        pasos = (n_periodos - 1 - ultimo)[:, None] + horizontes[None, :]
+        tasa = np.broadcast_to(np.asarray(crecimiento, dtype='float64'), (len(valores),))[:, None]
+        return base[:, None] * (1 + tasa) ** pasos
+
+    # Tendencia: pendiente y ordenada de cada serie sobre sus periodos con datos
+    validos = ~np.isnan(valores)
+    x = np.broadcast_to(np.arange(n_periodos, dtype='float64'), valores.shape)
+    n = validos.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_medio = np.where(validos, x, 0).sum(axis=1) / n
+        y_medio = np.where(validos, valores, 0).sum(axis=1) / n
+        dx = np.where(validos, x - x_medio[:, None], 0)
+        dy = np.where(validos, valores - y_medio[:, None], 0)
+        sxx = (dx * dx).sum(axis=1)
+        pendiente = np.where(sxx > 0, (dx * dy).sum(axis=1) / sxx, 0.0)
+    x_futuro = (n_periodos - 1 + horizontes)[None, :]
+    return y_medio[:, None] + pendiente[:, None] * (x_futuro - x_medio[:, None])
+
+
+def proyectar_kpi(df, valor, serie=None, trimestres=1, crecimiento=0.0, metodo='tasa', base=None):
+    """
+    Proyecta un KPI trimestral para todas sus series con proyectar_matriz.
+
+    Parámetros:
+    - df (DataFrame): Formato largo con 'anio' y 'trimestre' (o 'periodo'), la columna `valor` y, si hay
+                      varias series, la columna `serie`.
+    - valor (str): Columna a proyectar.
+    - serie (str, opcional): Columna que identifica cada serie (p. ej. 'nombre_provincia'); sin ella el
+                             dataset es una sola serie.
+    - trimestres, crecimiento, metodo: Ver proyectar_matriz.
+    - base (int, opcional): Índice del último periodo histórico a usar (ver telecom_core.periodos); por
+                            defecto el último del dataset.
+
+    Retorno:
+    - DataFrame largo ordenado por serie y periodo con las columnas `serie`, 'periodo', 'anio_trimestre',
+      `valor` y 'proyectado' (False en los periodos históricos, True en los proyectados). Si no quedan
+      periodos históricos, el DataFrame está vacío con las mismas columnas.
+    """
+    df = agregar_periodo(df)
+    if base is not None:
+        df = df[df['periodo'] <= base]
+    if serie:
+        df = df[df[serie].notna()]
+    columnas = ([serie] if serie else []) + ['periodo', valor]
+    historico = df[columnas].assign(proyectado=False)
+    if historico.empty:
+        # Sin periodos históricos (dataset vacío o base anterior a todos) no hay nada que proyectar
+        historico.insert(len(columnas) - 1, 'anio_trimestre', etiquetas_periodo(historico['periodo']))
+        return historico.reset_index(drop=True)
+
+    # Matriz series x periodos, con un casillero por trimestre entre el primero y el último
+    codigos, series = pd.factorize(df[serie]) if serie else (np.zeros(len(df), dtype='int64'), None)
+    n_series = len(series) if serie else 1
+    periodos = df['periodo'].to_numpy()
+    primero, ultimo = periodos.min(), periodos.max()
+    valores = np.full((n_series, ultimo - primero + 1), np.nan)
+    valores[codigos, periodos - primero] = df[valor].to_numpy(dtype='float64')
+
+    proyectados = proyectar_matriz(valores, trimestres, crecimiento, metodo)
+
+    # Filas proyectadas en formato largo (serie por serie, trimestre por trimestre)
+    df_proyectado = pd.DataFrame({
+        'periodo': np.tile(np.arange(ultimo + 1, ultimo + 1 + trimestres), n_series),
+        valor: proyectados.ravel(),
+        'proyectado': True,
+    })
+    if serie:
+        df_proyectado.insert(0, serie, series.take(np.repeat(np.arange(n_series), trimestres)))
+
+    df_kpi = pd.concat([historico, df_proyectado], ignore_index=True)
+    df_kpi = df_kpi.sort_values(([serie] if serie else []) + ['periodo'], kind='stable', ignore_index=True)
+    df_kpi.insert(len(columnas) - 1, 'anio_trimestre', etiquetas_periodo(df_kpi['periodo']))
+    return df_kpi
@@ -0,0 +1,167 @@
+import functools
+import inspect
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from telecom_core.cache import cache, version_datos
+from telecom_core.tipos import memoria
+
+# Directorio con los archivos Parquet y el manifiesto del snapshot
+DIRECTORIO_SNAPSHOT = Path(os.getenv("TELECOM_SNAPSHOT_DIR", Path(__file__).resolve().parent.parent / "snapshot"))
+
+# Antigüedad máxima (en horas) de un snapshot antes de considerarlo vencido; 0 desactiva el límite
+MAX_EDAD_HORAS = float(os.getenv("TELECOM_SNAPSHOT_MAX_EDAD", "0"))
+
+# Antigüedad máxima (en horas) cuando no se conoce la versión vigente de los datos (el archivo de
+# versión es local al host y falta, p. ej. en otro servidor o tras limpiar el directorio temporal);
+# 0 descarta el snapshot siempre que la versión sea desconocida
+MAX_EDAD_SIN_VERSION_HORAS = float(os.getenv("TELECOM_SNAPSHOT_MAX_EDAD_SIN_VERSION", "24"))
+
+NOMBRE_MANIFIESTO = "manifest.json"
+
+# Cargadores registrados con @con_snapshot, por nombre de dataset
+_cargadores = {}
+
+
+def leer_manifiesto(directorio=None):
+    """ Retorna el manifiesto del snapshot, o None si no existe o no se puede leer """
+    ruta = Path(directorio or DIRECTORIO_SNAPSHOT) / NOMBRE_MANIFIESTO
+    try:
+        return json.loads(ruta.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def snapshot_vigente(manifiesto):
+    """
+    Indica si un snapshot puede usarse en lugar de la base de datos.
+
+    Un snapshot está vencido si el ETL publicó una versión de datos distinta a la exportada
+    o si supera la antigüedad máxima configurada. Si la versión vigente es desconocida ('0',
+    ver version_datos) no hay con qué compararlo: solo se usa mientras no supere
+    MAX_EDAD_SIN_VERSION_HORAS.
+    """
+    if manifiesto is None:
+        return False
+    edad = time.time() - manifiesto.get("creado_ts", 0)
+    version_actual = version_datos()
+    if version_actual == "0":
+        if edad > MAX_EDAD_SIN_VERSION_HORAS * 3600:
+            return False
+    elif manifiesto.get("version") != version_actual:
+        return False
+    if MAX_EDAD_HORAS > 0 and edad > MAX_EDAD_HORAS * 3600:
+        return False
+    return True
+
+
+def leer_snapshot(nombre, directorio=None):
+    """
+    Lee un dataset del snapshot mediante memory-map.
+
+    Parámetros:
+    - nombre (str): Nombre del dataset en el manifiesto.
+    - directorio (str | Path, opcional): Directorio del snapshot.
+
+    Retorno:
+    - DataFrame, o None si el snapshot no existe, está vencido o no coincide con el manifiesto.
+    """
+    directorio = Path(directorio or DIRECTORIO_SNAPSHOT)
+    manifiesto = leer_manifiesto(directorio)
+    if not snapshot_vigente(manifiesto) or nombre not in manifiesto["datasets"]:
+        return None
+
+    info = manifiesto["datasets"][nombre]
+    clave = f"snapshot:{directorio}:{manifiesto['version']}:{nombre}"
+    df = cache.obtener(clave)
+    if df is None:
+        try:
+            df = pd.read_parquet(directorio / info["archivo"], memory_map=True)
+        except (OSError, ValueError):
+            return None
+        if len(df) != info["filas"]:
+            return None
+        cache.guardar(clave, df)
+    return df.copy(deep=False)
+
+
+def con_snapshot(nombre, **parametros):
+    """
+    Decorador para cargadores: sirve el dataset desde el snapshot si está vigente y,
+    si falta o está vencido, ejecuta el cargador original contra la base de datos.
+
+    El cargador queda registrado para que exportar_snapshot() lo incluya, llamado con
+    'parametros'. El decorador puede apilarse para exportar varias variantes de un mismo
+    cargador (por ejemplo, distintos rangos de periodos o niveles de agregación).
+
+    Parámetros:
+    - nombre (str): Nombre del dataset en el manifiesto.
+    - parametros: Argumentos con nombre del cargador que corresponden al dataset exportado.
+    """
+    def decorador(cargador):
+        @functools.wraps(cargador)
+        def envoltura(*args, **kwargs):
+            # Solo la llamada con los mismos parámetros corresponde al dataset exportado
+            if not args and kwargs == parametros:
+                df = leer_snapshot(nombre)
+                if df is not None:
+                    return df
+            return cargador(*args, **kwargs)
+
+        # Registrar la función original: al exportar nunca se lee el snapshot anterior
+        _cargadores[nombre] = functools.partial(inspect.unwrap(cargador), **parametros)
+        return envoltura
+    return decorador
+
+
+def exportar_snapshot(directorio=None):
+    """
+    Exporta todos los datasets registrados a archivos Parquet junto con un manifiesto
+    que guarda la versión de los datos, la cantidad de filas de cada archivo y los bytes
+    que ocupa en memoria una vez cargado (con los tipos compactos de telecom_core.tipos).
+
+    Los archivos llevan la versión en el nombre y el manifiesto se reemplaza de forma
+    atómica, así los lectores nunca ven un snapshot a medio escribir.
+
+    Retorno:
+    - dict con el manifiesto escrito.
+    """
+    directorio = Path(directorio or DIRECTORIO_SNAPSHOT)
+    directorio.mkdir(parents=True, exist_ok=True)
+
+    creado = time.time()
+    version = version_datos()
+    sufijo = f"{version}-{int(creado)}"
+    manifiesto = {
+        "version": version,
+        "creado": datetime.fromtimestamp(creado, tz=timezone.utc).isoformat(),
+        "creado_ts": creado,
+        "datasets": {}
+    }
+
+    for nombre, cargador in _cargadores.items():
+        df = cargador()
+        archivo = f"{nombre}-{sufijo}.parquet"
+        df.to_parquet(directorio / archivo, index=False)
+        manifiesto["datasets"][nombre] = {"archivo": archivo, "filas": len(df), "memoria": memoria(df)}
+
+    temporal = directorio / f"{NOMBRE_MANIFIESTO}.tmp"
+    temporal.write_text(json.dumps(manifiesto, indent=2), encoding="utf-8")
+    os.replace(temporal, directorio / NOMBRE_MANIFIESTO)
+
+    # Eliminar archivos de snapshots anteriores
+    vigentes = {info["archivo"] for info in manifiesto["datasets"].values()}
+    for archivo in directorio.glob("*.parquet"):
+        if archivo.name not in vigentes:
+            try:
+                archivo.unlink(missing_ok=True)
+            except OSError:
+                # En Windows no se puede borrar un archivo que otro proceso tiene mapeado
+                pass
+
+    return manifiesto
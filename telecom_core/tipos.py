@@ -0,0 +1,101 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tipos compactos de cada dataset: columna -> dtype de pandas.
+# - 'category' para nombres repetidos (provincias, partidos, localidades).
+# - Enteros chicos para año/trimestre y conteos; si la columna trae nulos se usa el
+#   entero nullable equivalente (Int16, Int32...).
+# - 'boolean' (nullable) para las tecnologías de mapa_conectividad, que llegan como
+#   object cuando hay NULL.
+# - float32 para tasas y porcentajes.
+# Las columnas ausentes en el DataFrame se ignoran, así un esquema sirve para todos los
+# niveles de agregación de un dataset.
+ESQUEMAS = {
+    'penetracion': {
+        'nombre_provincia': 'category',
+        'anio': 'int16',
+        'trimestre': 'int8',
+        'periodo': 'int16',
+        'accesos_por_100_hogares': 'float32',
+        'promedio_accesos': 'float32',
+    },
+    'cobertura_provincia': {
+        'nombre_provincia': 'category',
+        'total_localidades': 'int32',
+        'localidades_fibra': 'int32',
+        'localidades_wireless': 'int32',
+        'porcentaje_fibra': 'float32',
+    },
+    'accesos_movil': {
+        'anio': 'int16',
+        'trimestre': 'int8',
+        'periodo': 'int16',
+        'total_accesos_pospago': 'int32',
+        'total_accesos_prepago': 'int32',
+    },
+    'mapa_conectividad': {
+        'nombre_provincia': 'category',
+        'partido': 'category',
+        'localidad': 'category',
+        'poblacion': 'int32',
+        'adsl': 'boolean',
+        'cablemodem': 'boolean',
+        'dial_up': 'boolean',
+        'fibra_optica': 'boolean',
+        'satelital': 'boolean',
+        'wireless': 'boolean',
+        'telefonia_fija': 'boolean',
+        'cobertura_3g': 'boolean',
+        'cobertura_4g': 'boolean',
+        'latitud': 'float32',
+        'longitud': 'float32',
+    },
+}
+
+
+def memoria(df):
+    """ Retorna los bytes que ocupa un DataFrame, incluyendo el contenido de las columnas object """
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _convertir(serie, dtype):
+    """ Convierte una columna al dtype compacto, pasando a la variante nullable si hay nulos """
+    if dtype.startswith(('int', 'uint')) and serie.isna().any():
+        dtype = dtype.replace('int', 'Int').replace('uInt', 'UInt')
+    return serie.astype(dtype)
+
+
+def compactar(df, esquema, nombre=None, informar=True):
+    """
+    Aplica a un DataFrame los tipos compactos de su esquema e informa la memoria antes y después.
+
+    Parámetros:
+    - df (DataFrame): DataFrame leído de la base de datos.
+    - esquema (str | dict): Nombre de un esquema de ESQUEMAS, o un dict columna -> dtype.
+    - nombre (str, opcional): Nombre del dataset para el informe; por defecto el del esquema.
+    - informar (bool): Registrar la memoria antes y después (nivel INFO).
+
+    Retorno:
+    - DataFrame nuevo con las columnas convertidas; el resto de las columnas se conservan.
+    """
+    if isinstance(esquema, str):
+        nombre = nombre or esquema
+        esquema = ESQUEMAS[esquema]
+
+    antes = memoria(df) if informar else 0
+    conversiones = {
+        columna: _convertir(df[columna], dtype)
+        for columna, dtype in esquema.items()
+        if columna in df.columns and str(df[columna].dtype) != dtype
+    }
+    if conversiones:
+        df = df.assign(**conversiones)
+    if informar:
+        despues = memoria(df)
+        logger.info(
+            "%s: %d filas, memoria %.1f KB -> %.1f KB (%.0f%% menos)",
+            nombre or "dataset", len(df), antes / 1024, despues / 1024,
+            100 * (1 - despues / antes) if antes else 0
+        )
+    return df
@@ -0,0 +1,200 @@
+"""
+Transformaciones de pandas compartidas por los gráficos de ambos dashboards: la preparación de
+los datos vive acá una sola vez y cada visualization.py solo arma la figura con su estilo.
+"""
+import pandas as pd
+
+from telecom_core.normalizacion import NOMBRES_PROVINCIA, claves_provincia
+from telecom_core.periodos import agregar_periodo, periodo_de_etiqueta
+from telecom_core.proyecciones import proyectar_kpi, proyectar_matriz
+
+# Último trimestre con datos de penetración y aumento proyectado por trimestre (KPI 1)
+PERIODO_BASE = '2024 T1'
+AUMENTO_PENETRACION = 0.02
+
+# Provincias de menor cobertura de fibra óptica y aumento proyectado (KPI 2)
+CUANTIL_MENOR_COBERTURA = 0.25
+AUMENTO_COBERTURA = 0.30
+
+# Aumento objetivo del promedio nacional de cobertura de fibra óptica (KPI 2)
+AUMENTO_OBJETIVO_COBERTURA = 0.10
+
+# Aumento proyectado de los accesos pospago por trimestre (KPI 3)
+AUMENTO_POSPAGO = 0.05
+
+
+def agregar_anio_trimestre(df):
+    """
+    Asegura las columnas 'periodo' y 'anio_trimestre' (ver telecom_core.periodos). Los cargadores ya
+    las agregan, así que con sus datasets no copia ni arma nada.
+    """
+    return agregar_periodo(df)
+
+
+def ordenar_por_periodo(df, por=None):
+    """
+    Ordena por periodo en un solo ordenamiento sobre el índice entero.
+
+    Parámetros:
+    - df (DataFrame): Dataset con la columna 'periodo' (o 'anio' y 'trimestre').
+    - por (str, opcional): Columna para ordenar dentro de cada periodo.
+    """
+    df = agregar_periodo(df)
+    return df.sort_values(['periodo', por] if por else 'periodo', kind='stable')
+
+
+# -- KPI 1 --
+
+def proyeccion_penetracion(df_penetracion, periodo=PERIODO_BASE, aumento=AUMENTO_PENETRACION, trimestres=1,
+                           metodo='tasa'):
+    """
+    Series de penetración de todas las provincias con sus trimestres proyectados (ver proyectar_kpi).
+    Se calcula una vez por versión de los datos; los gráficos por provincia leen de esta tabla.
+
+    Parámetros:
+    - df_penetracion (DataFrame): Columnas 'nombre_provincia', 'anio', 'trimestre' y 'accesos_por_100_hogares'.
+    - periodo (str): Último trimestre histórico (base de la proyección).
+    - aumento (float): Aumento proyectado por trimestre (0.02 = 2%), con el método 'tasa'.
+    - trimestres (int): Trimestres a proyectar.
+    - metodo (str): 'tasa' o 'tendencia' (ver proyectar_matriz).
+
+    Retorno:
+    - DataFrame con las columnas 'nombre_provincia', 'periodo', 'anio_trimestre', 'accesos_por_100_hogares'
+      y 'proyectado'.
+    """
+    return proyectar_kpi(
+        df_penetracion, 'accesos_por_100_hogares', serie='nombre_provincia', trimestres=trimestres,
+        crecimiento=aumento, metodo=metodo, base=periodo_de_etiqueta(periodo)
+    )
+
+
+def proyectar_penetracion(df_penetracion, periodo=PERIODO_BASE, aumento=AUMENTO_PENETRACION):
+    """
+    Calcula la proyección de la penetración de cada provincia para el trimestre siguiente.
+
+    Parámetros:
+    - df_penetracion (DataFrame): Columnas 'nombre_provincia', 'anio', 'trimestre' y 'accesos_por_100_hogares'.
+    - periodo (str): Trimestre base de la proyección.
+    - aumento (float): Aumento proyectado (0.02 = 2%).
+
+    Retorno:
+    - DataFrame con las filas del trimestre base y la columna 'acceso_proyectado'.
+    """
+    df_kpi = agregar_periodo(df_penetracion)
+    df_kpi = df_kpi[df_kpi['periodo'] == periodo_de_etiqueta(periodo)]
+
+    # Todas las provincias en una sola pasada del motor de proyecciones
+    df_proyeccion = proyeccion_penetracion(df_kpi, periodo, aumento)
+    proyectados = df_proyeccion.loc[df_proyeccion['proyectado'], ['nombre_provincia', 'accesos_por_100_hogares']]
+    proyectados = proyectados.rename(columns={'accesos_por_100_hogares': 'acceso_proyectado'})
+    return df_kpi.merge(proyectados, on='nombre_provincia', how='left')
+
+
+def evolucion_provincia(df_penetracion, provincia, periodo=PERIODO_BASE, aumento=AUMENTO_PENETRACION):
+    """
+    Prepara la serie de penetración de una provincia en orden cronológico, con el punto proyectado al final.
+
+    Parámetros:
+    - df_penetracion (DataFrame): La tabla de proyeccion_penetracion (se lee sin recalcular), o los datos
+                                  con 'nombre_provincia', 'anio', 'trimestre' y 'accesos_por_100_hogares'.
+    - provincia (str): Nombre de la provincia.
+    - periodo (str): Trimestre base de la proyección.
+    - aumento (float): Aumento proyectado (0.02 = 2%), si hay que calcular la proyección.
+
+    Retorno:
+    - tuple (DataFrame, float): La serie con la columna 'anio_trimestre' y las filas proyectadas, y el último
+      valor proyectado; (serie sin proyección, None) si la provincia no tiene datos del trimestre base.
+    """
+    if 'proyectado' in df_penetracion.columns:
+        df_proyeccion = df_penetracion
+    else:
+        df_proyeccion = proyeccion_penetracion(df_penetracion, periodo, aumento)
+
+    df_provincia = df_proyeccion[df_proyeccion['nombre_provincia'] == provincia].reset_index(drop=True)
+    if not (df_provincia['periodo'] == periodo_de_etiqueta(periodo)).any():
+        return df_provincia[~df_provincia['proyectado']], None
+
+    return df_provincia, float(df_provincia['accesos_por_100_hogares'].iloc[-1])
+
+
+# -- KPI 2 --
+
+def provincias_menor_cobertura(df_cobertura, cuantil=CUANTIL_MENOR_COBERTURA, aumento=AUMENTO_COBERTURA):
+    """
+    Selecciona las provincias con menor cobertura de fibra óptica y proyecta su aumento.
+
+    Parámetros:
+    - df_cobertura (DataFrame): Agregado por provincia, con 'nombre_provincia' y 'porcentaje_fibra'.
+    - cuantil (float): Se toman las provincias por debajo de este cuantil de cobertura.
+    - aumento (float): Aumento proyectado (0.30 = 30%).
+
+    Retorno:
+    - DataFrame con las columnas 'Provincia', 'Cobertura Actual' y 'Cobertura Proyectada' (como fracción).
+    """
+    cobertura = df_cobertura.set_index('nombre_provincia')['porcentaje_fibra'] / 100
+    cobertura = cobertura[cobertura < cobertura.quantile(cuantil)]
+
+    # Cada provincia es una serie de un solo periodo para el motor de proyecciones
+    proyectada = proyectar_matriz(cobertura.to_numpy()[:, None], trimestres=1, crecimiento=aumento)[:, 0]
+    return pd.DataFrame({
+        'Provincia': cobertura.index,
+        'Cobertura Actual': cobertura.values,
+        'Cobertura Proyectada': proyectada
+    })
+
+
+def objetivo_cobertura(df_cobertura, aumento=AUMENTO_OBJETIVO_COBERTURA):
+    """
+    Retorna el promedio nacional de cobertura de fibra óptica y su objetivo con el aumento proyectado.
+
+    Retorno:
+    - tuple (promedio actual, objetivo), en porcentaje.
+    """
+    promedio = float(df_cobertura['porcentaje_fibra'].mean())
+    return promedio, promedio * (1 + aumento)
+
+
+# -- KPI 3 --
+
+def proyeccion_accesos_pospago(df_accesos_movil, aumento=AUMENTO_POSPAGO, trimestres=1, metodo='tasa'):
+    """
+    Serie nacional de accesos pospago con sus trimestres proyectados (ver proyectar_kpi).
+
+    Parámetros:
+    - df_accesos_movil (DataFrame): Columnas 'anio', 'trimestre' y 'total_accesos_pospago'.
+    - aumento (float): Aumento proyectado por trimestre (0.05 = 5%), con el método 'tasa'.
+    - trimestres (int): Trimestres a proyectar.
+    - metodo (str): 'tasa' o 'tendencia' (ver proyectar_matriz).
+
+    Retorno:
+    - DataFrame con las columnas 'periodo', 'anio_trimestre', 'total_accesos_pospago' y 'proyectado'.
+    """
+    return proyectar_kpi(
+        df_accesos_movil, 'total_accesos_pospago', trimestres=trimestres, crecimiento=aumento, metodo=metodo
+    )
+
+
+# -- MAPAS DE COROPLETAS --
+
+def indicadores_provincia(df_penetracion_mapa, df_cobertura):
+    """
+    Une los indicadores por provincia que muestran los mapas, indexados por la clave de coincidencia
+    con el GeoJSON. Las claves se calculan acá, una vez por versión de los datos, y no en cada figura.
+
+    Parámetros:
+    - df_penetracion_mapa (DataFrame): Columnas 'nombre_provincia' y 'promedio_accesos'.
+    - df_cobertura (DataFrame): Agregado por provincia, con 'nombre_provincia' y 'porcentaje_fibra'.
+
+    Retorno:
+    - DataFrame con una fila por provincia y las columnas 'clave', 'provincia' (nombre para mostrar),
+      'promedio_accesos' y 'porcentaje_fibra' (NaN si la provincia no tiene ese indicador).
+    """
+    series = [
+        df.set_index(claves_provincia(df['nombre_provincia']).to_numpy())[columna].astype('float64')
+        for df, columna in ((df_penetracion_mapa, 'promedio_accesos'), (df_cobertura, 'porcentaje_fibra'))
+    ]
+    df_indicadores = pd.concat(series, axis=1).rename_axis('clave').reset_index()
+    df_indicadores.insert(
+        1, 'provincia', df_indicadores['clave'].map(NOMBRES_PROVINCIA).fillna(df_indicadores['clave'])
+    )
+    return df_indicadores